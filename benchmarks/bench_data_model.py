@@ -0,0 +1,78 @@
+"""
+Construction time and RSS of nodes built with the compact models (default) and the pydantic models (--strict).
+
+Each mode runs in its own process so that peak RSS is not shared between modes.
+
+$ python benchmarks/bench_data_model.py [--nodes 2000] [--columns 100]
+"""
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
+from subprocess import run
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+
+def sample_entries(n_nodes: int, n_columns: int) -> list[tuple[dict, dict]]:
+    entries = []
+    for i in range(n_nodes):
+        manifest_data = {
+            "name": f"model_{i}",
+            "columns": {f"column_{j}": {"description": f"description {j}"} for j in range(0, n_columns, 2)},
+            "raw_code": "select 1",
+            "compiled_code": "select 1",
+            "depends_on": {"nodes": [f"model.pkg.model_{i - 1}"] if i > 0 else []},
+            "description": "",
+            "language": "sql",
+            "tags": [],
+            "package_name": "pkg",
+            "database": "db",
+            "schema": "schema",
+            "config": {"materialized": "table"},
+        }
+        catalog_data = {
+            "metadata": {"owner": "owner"},
+            "columns": {
+                f"column_{j}": {"type": "STRING", "index": j, "name": f"column_{j}", "comment": None}
+                for j in range(n_columns)
+            },
+        }
+        entries.append((manifest_data, catalog_data))
+    return entries
+
+
+def measure(n_nodes: int, n_columns: int, strict: bool):
+    from export_dbt_docs_to_md.build_parsed_data import build_models_data
+
+    entries = sample_entries(n_nodes, n_columns)
+    rss_before = getrusage(RUSAGE_SELF).ru_maxrss
+    start = perf_counter()
+    nodes = {f"model.pkg.model_{i}": build_models_data(m, c, strict) for i, (m, c) in enumerate(entries)}
+    elapsed = perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    rss_mib = (getrusage(RUSAGE_SELF).ru_maxrss - rss_before) / 1024
+    mode = "strict (pydantic)" if strict else "compact (slots)"
+    print(f"{mode:<18} {len(nodes)} nodes x {n_columns} columns: {elapsed:8.3f} s, +{rss_mib:8.1f} MiB RSS")
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--mode", choices=["compact", "strict"])
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        measure(args.nodes, args.columns, strict=args.mode == "strict")
+        return
+
+    for mode in ("compact", "strict"):
+        argv = [sys.executable, __file__, f"--nodes={args.nodes}", f"--columns={args.columns}", f"--mode={mode}"]
+        run(argv, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Time each phase of parse_docs_data on synthetic projects of several sizes.
+
+Phases are load (json decode), build (node construction), resolve (test/lineage relationships),
+render (template formatting) and write (file output). Results are written as JSON so that runs can be compared.
+
+$ python benchmarks/bench_export.py --sizes 1000 10000 100000 --output bench_output.json
+"""
+
+import sys
+from argparse import ArgumentParser
+from json import dump
+from pathlib import Path
+from platform import python_version
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from export_dbt_docs_to_md.api import build_parsed_json_from_artifacts, load_artifacts, resolve_pages  # noqa: E402
+from export_dbt_docs_to_md.format_parsed_data import render_page  # noqa: E402
+from export_dbt_docs_to_md.output_sink import DirectorySink  # noqa: E402
+from synthetic import add_generator_arguments, write_artifacts  # noqa: E402
+
+
+def bench(n_nodes: int, work_dir_path: Path, strict: bool, generator_kwargs: dict) -> dict:
+    artifacts_dir_path = work_dir_path / "artifacts"
+    manifest_json_path, catalog_json_path = write_artifacts(artifacts_dir_path, n_nodes=n_nodes, **generator_kwargs)
+    timings = {}
+
+    start = perf_counter()
+    manifest_json, catalog_json = load_artifacts(manifest_json_path, catalog_json_path)
+    timings["load"] = perf_counter() - start
+
+    start = perf_counter()
+    parsed_json = build_parsed_json_from_artifacts(manifest_json, catalog_json, strict)
+    timings["build"] = perf_counter() - start
+    del manifest_json, catalog_json
+
+    start = perf_counter()
+    pages, _ = resolve_pages(parsed_json)
+    timings["resolve"] = perf_counter() - start
+
+    start = perf_counter()
+    rendered = [render_page(page) for page in pages]
+    timings["render"] = perf_counter() - start
+
+    start = perf_counter()
+    with DirectorySink(work_dir_path / "output") as sink:
+        for page, markdown_str in zip(pages, rendered):
+            sink.write(page.file_path, markdown_str)
+    timings["write"] = perf_counter() - start
+
+    return {
+        "nodes": n_nodes,
+        "strict": strict,
+        "manifest_bytes": manifest_json_path.stat().st_size,
+        "catalog_bytes": catalog_json_path.stat().st_size,
+        "pages": len(pages),
+        "output_bytes": sum(len(markdown_str.encode()) for markdown_str in rendered),
+        "seconds": {**timings, "total": sum(timings.values())},
+    }
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="node counts")
+    parser.add_argument("--strict", action="store_true", help="build nodes with pydantic models")
+    parser.add_argument("--output", help="write results to this JSON file instead of stdout")
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    generator_kwargs = {
+        "n_columns": args.columns,
+        "tests_per_column": args.tests_per_column,
+        "n_macros": args.macros,
+        "fan_out": args.fan_out,
+        "n_packages": args.packages,
+        "seed": args.seed,
+    }
+    results = []
+    for n_nodes in args.sizes:
+        with TemporaryDirectory() as work_dir:
+            result = bench(n_nodes, Path(work_dir), args.strict, generator_kwargs)
+        results.append(result)
+        seconds = " ".join(f"{k}={v:.3f}" for k, v in result["seconds"].items())
+        print(f"{n_nodes} nodes, {result['pages']} pages: {seconds}", file=sys.stderr)
+
+    report = {"python": python_version(), "generator": generator_kwargs, "results": results}
+    if args.output is None:
+        dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, mode="w") as f:
+            dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
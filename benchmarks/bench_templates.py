@@ -0,0 +1,113 @@
+"""
+Microbenchmark of per-page rendering cost, dedent + str.format on every call (before)
+versus precompiled templates with list-join assembly (after).
+
+$ python benchmarks/bench_templates.py [--columns 50] [--number 2000]
+"""
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from textwrap import dedent
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from export_dbt_docs_to_md.data_model import Column, ManifestData  # noqa: E402
+from export_dbt_docs_to_md.format_parsed_data import format_column_info, render_models_data  # noqa: E402
+from export_dbt_docs_to_md.templates import MODEL_TEMPLATE  # noqa: E402
+
+
+def legacy_format_column_info(column_info_list: dict[str, Column]) -> str:
+    formatted_str = ""
+    for column_info in column_info_list.values():
+        formatted_str += dedent("| {name} | {type_} | {description} | {test} |\n").format(
+            name=column_info.name,
+            type_=column_info.type_,
+            description=column_info.description_from_manifest
+            if column_info.description_from_manifest is not None and column_info.description_from_manifest != ""
+            else "&nbsp;",
+            test="<br>".join(sorted(column_info.test)) if len(column_info.test) > 0 else "&nbsp;",
+        )
+    return formatted_str
+
+
+def legacy_render_models_data(manifest_data: ManifestData, referenced_by: dict[str, str]) -> str:
+    # the template is indented as it was written inline in the original format_models_data
+    return dedent("\n".join("    " + line if line else line for line in MODEL_TEMPLATE.split("\n"))).format(
+        table_name=manifest_data.name,
+        materialized=manifest_data.materialized,
+        tags=manifest_data.tags if len(manifest_data.tags) > 0 else "untagged",
+        owner=manifest_data.owner,
+        type_=manifest_data.materialized,
+        package=manifest_data.package_name,
+        language=manifest_data.language,
+        relation=manifest_data.name,
+        description=manifest_data.description
+        if manifest_data.description is not None and manifest_data.description != ""
+        else "This source is not currently documented",
+        formatted_column_info=legacy_format_column_info(manifest_data.columns),
+        referenced_by_models=referenced_by["models"],
+        referenced_by_tests=referenced_by["tests"],
+        upstream="&nbsp;",
+        downstream="&nbsp;",
+        lineage_diagram="",
+        depends_on="<br>".join(manifest_data.depends_on),
+        raw_code=manifest_data.raw_code,
+        compiled_code=manifest_data.compiled_code.strip(),
+    )
+
+
+def sample_model(n_columns: int) -> ManifestData:
+    columns = {
+        f"column_{i}": Column(
+            type_="STRING",
+            index=str(i),
+            name=f"column_{i}",
+            comment=None,
+            description_from_manifest=f"description of column_{i}" if i % 2 else None,
+            test={"not_null", "unique"} if i % 3 == 0 else set(),
+        )
+        for i in range(n_columns)
+    }
+    return ManifestData(
+        name="sample_model",
+        columns=columns,
+        depends_on=["model.pkg.upstream_a", "model.pkg.upstream_b"],
+        raw_code="select * from {{ ref('upstream_a') }}\n" * 20,
+        compiled_code="select * from upstream_a\n" * 20,
+        description="sample model",
+        language="sql",
+        tags=["daily"],
+        owner="owner",
+        package_name="pkg",
+        database="db",
+        schema_="schema",
+        materialized="table",
+    )
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    manifest_data = sample_model(args.columns)
+    referenced_by = {"models": "pkg/model/downstream", "tests": "&nbsp;"}
+
+    results = {
+        "column table (before)": timeit(lambda: legacy_format_column_info(manifest_data.columns), number=args.number),
+        "column table (after)": timeit(lambda: format_column_info(manifest_data.columns), number=args.number),
+        "model page (before)": timeit(
+            lambda: legacy_render_models_data(manifest_data, referenced_by), number=args.number
+        ),
+        "model page (after)": timeit(lambda: render_models_data(manifest_data, referenced_by), number=args.number),
+    }
+    print(f"{args.columns} columns, {args.number} iterations")
+    for name, seconds in results.items():
+        print(f"{name:<24} {seconds / args.number * 1e6:10.1f} us/page")
+
+
+if __name__ == "__main__":
+    main()
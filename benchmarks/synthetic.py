@@ -0,0 +1,311 @@
+"""
+Synthetic manifest.json/catalog.json generator.
+
+Nodes are split into models, seeds and sources (10% each for seeds and sources).
+Every model depends on `fan_out` earlier models/seeds/sources, so the graph is a DAG.
+
+$ python benchmarks/synthetic.py --nodes 10000 --columns 20 --tests_per_column 0.5 --output_dir tmp_synthetic
+"""
+
+from argparse import ArgumentParser
+from json import dump
+from pathlib import Path
+from random import Random
+
+# manifest v8 (dbt 1.4), refs are lists of names as the exporter reads them.
+DBT_VERSION = "1.4.0"
+MANIFEST_SCHEMA = "https://schemas.getdbt.com/dbt/manifest/v8.json"
+CATALOG_SCHEMA = "https://schemas.getdbt.com/dbt/catalog/v1.json"
+GENERIC_TESTS = ("not_null", "unique", "accepted_values", "relationships")
+
+
+def _metadata(schema: str) -> dict:
+    return {
+        "dbt_schema_version": schema,
+        "dbt_version": DBT_VERSION,
+        "generated_at": "2023-01-01T00:00:00.000000Z",
+        "invocation_id": "00000000-0000-0000-0000-000000000000",
+        "env": {},
+    }
+
+
+def _columns(n_columns: int) -> dict:
+    return {
+        f"column_{i}": {
+            "name": f"column_{i}",
+            "description": f"description of column_{i}" if i % 2 == 0 else "",
+            "meta": {},
+            "data_type": None,
+            "constraints": [],
+            "quote": None,
+            "tags": [],
+        }
+        for i in range(n_columns)
+    }
+
+
+def _catalog_entry(unique_id: str, name: str, n_columns: int) -> dict:
+    return {
+        "metadata": {"type": "BASE TABLE", "schema": "analytics", "name": name, "database": "db", "owner": "owner"},
+        "columns": {
+            f"column_{i}": {
+                "type": ("STRING", "INT64", "TIMESTAMP")[i % 3],
+                "index": i + 1,
+                "name": f"column_{i}",
+                "comment": None,
+            }
+            for i in range(n_columns)
+        },
+        "stats": {},
+        "unique_id": unique_id,
+    }
+
+
+def _node(unique_id: str, resource_type: str, package: str, name: str, n_columns: int, depends_on: list[str], tags):
+    raw_code = "select\n" + ",\n".join(f"    column_{i}" for i in range(n_columns))
+    raw_code += "\nfrom " + (" join ".join("{{ ref('" + d.split(".")[-1] + "') }}" for d in depends_on) or "raw")
+    return {
+        "database": "db",
+        "schema": "analytics",
+        "name": name,
+        "resource_type": resource_type,
+        "package_name": package,
+        "path": f"{name}.sql",
+        "original_file_path": f"{'seeds' if resource_type == 'seed' else 'models'}/{name}.sql",
+        "unique_id": unique_id,
+        "fqn": [package, name],
+        "alias": name,
+        "checksum": {"name": "sha256", "checksum": "0" * 64},
+        "config": {"enabled": True, "materialized": "seed" if resource_type == "seed" else "table", "tags": []},
+        "tags": tags,
+        "description": f"{name} {resource_type}" if len(depends_on) % 2 == 0 else "",
+        "columns": _columns(n_columns),
+        "meta": {},
+        "docs": {"show": True, "node_color": None},
+        "language": "sql",
+        "refs": [[d.split(".")[-1]] for d in depends_on],
+        "sources": [],
+        "metrics": [],
+        "depends_on": {"macros": ["macro.synthetic.macro_0"], "nodes": depends_on},
+        "raw_code": raw_code,
+        "compiled_code": raw_code.replace("{{ ref('", "analytics.").replace("') }}", ""),
+    }
+
+
+def _source(unique_id: str, package: str, name: str, n_columns: int) -> dict:
+    return {
+        "database": "db",
+        "schema": "raw",
+        "name": name,
+        "resource_type": "source",
+        "package_name": package,
+        "path": "models/sources.yml",
+        "original_file_path": "models/sources.yml",
+        "unique_id": unique_id,
+        "fqn": [package, "raw", name],
+        "source_name": "raw",
+        "source_description": "",
+        "loader": "synthetic",
+        "identifier": name,
+        "description": "",
+        "columns": _columns(n_columns),
+        "meta": {},
+        "source_meta": {},
+        "tags": [],
+        "config": {"enabled": True},
+    }
+
+
+def _test(unique_id: str, package: str, test_name: str, parents: list[str], column_name: str) -> dict:
+    return {
+        "database": "db",
+        "schema": "analytics_dbt_test__audit",
+        "name": unique_id.split(".")[2],
+        "resource_type": "test",
+        "package_name": package,
+        "path": f"{unique_id.split('.')[2]}.sql",
+        "original_file_path": "models/schema.yml",
+        "unique_id": unique_id,
+        "fqn": [package, unique_id.split(".")[2]],
+        "alias": unique_id.split(".")[2],
+        "checksum": {"name": "none", "checksum": ""},
+        "config": {"enabled": True, "materialized": "test", "severity": "ERROR"},
+        "tags": [],
+        "description": "",
+        "columns": {},
+        "meta": {},
+        "language": "sql",
+        "refs": [[parent.split(".")[-1]] for parent in parents],
+        "sources": [],
+        "metrics": [],
+        "depends_on": {"macros": [f"macro.dbt.test_{test_name}"], "nodes": parents},
+        "raw_code": "{{ test_" + test_name + "(**_dbt_generic_test_kwargs) }}",
+        "compiled_code": f"select {column_name} from analytics.{parents[0].split('.')[-1]} where {column_name} is null",
+        "column_name": column_name,
+        "test_metadata": {"name": test_name, "kwargs": {"column_name": column_name}, "namespace": None},
+    }
+
+
+def _macro(unique_id: str, package: str, name: str, depends_on: list[str]) -> dict:
+    return {
+        "name": name,
+        "resource_type": "macro",
+        "package_name": package,
+        "path": f"macros/{name}.sql",
+        "original_file_path": f"macros/{name}.sql",
+        "unique_id": unique_id,
+        "macro_sql": "{% macro " + name + "() %}\n    select 1\n{% endmacro %}",
+        "depends_on": {"macros": depends_on},
+        "description": "",
+        "meta": {},
+        "docs": {"show": True, "node_color": None},
+        "patch_path": None,
+        "arguments": [],
+        "created_at": 0.0,
+        "supported_languages": None,
+    }
+
+
+def generate(
+    n_nodes: int,
+    n_columns: int = 20,
+    tests_per_column: float = 0.2,
+    n_macros: int = 50,
+    fan_out: int = 3,
+    n_packages: int = 1,
+    seed: int = 0,
+) -> tuple[dict, dict]:
+    """
+    Return (manifest_json, catalog_json) of a synthetic project.
+    """
+    random = Random(seed)
+    nodes, sources, macros = {}, {}, {}
+    catalog_nodes, catalog_sources = {}, {}
+    child_map: dict[str, list[str]] = {}
+
+    n_sources = max(1, n_nodes // 10)
+    n_seeds = max(1, n_nodes // 10)
+    tables = []
+    for i in range(n_nodes):
+        package = f"synthetic_{i % n_packages}" if n_packages > 1 else "synthetic"
+        if i < n_sources:
+            name = f"source_{i}"
+            unique_id = f"source.{package}.raw.{name}"
+            sources[unique_id] = _source(unique_id, package, name, n_columns)
+            catalog_sources[unique_id] = _catalog_entry(unique_id, name, n_columns)
+        elif i < n_sources + n_seeds:
+            name = f"seed_{i}"
+            unique_id = f"seed.{package}.{name}"
+            nodes[unique_id] = _node(unique_id, "seed", package, name, n_columns, [], [])
+            catalog_nodes[unique_id] = _catalog_entry(unique_id, name, n_columns)
+        else:
+            name = f"model_{i}"
+            unique_id = f"model.{package}.{name}"
+            depends_on = random.sample(tables, min(fan_out, len(tables)))
+            tags = [f"tag_{i % 5}"] if i % 2 else []
+            nodes[unique_id] = _node(unique_id, "model", package, name, n_columns, depends_on, tags)
+            catalog_nodes[unique_id] = _catalog_entry(unique_id, name, n_columns)
+            for parent in depends_on:
+                child_map[parent].append(unique_id)
+        child_map[unique_id] = []
+        tables.append(unique_id)
+
+    n_tests = 0
+    for table in tables:
+        if table.startswith("seed."):
+            continue
+        for c in range(n_columns):
+            # tests_per_column can be fractional, e.g. 0.2 tests 1 of 5 columns.
+            n_column_tests = int(tests_per_column) + (random.random() < tests_per_column % 1)
+            for t in range(n_column_tests):
+                test_name = GENERIC_TESTS[t % len(GENERIC_TESTS)]
+                parents = [table]
+                if test_name == "relationships":
+                    parents.append(random.choice(tables))
+                package = table.split(".")[1]
+                unique_id = f"test.{package}.{test_name}_{table.split('.')[-1]}_column_{c}.{n_tests:010x}"
+                nodes[unique_id] = _test(unique_id, package, test_name, parents, f"column_{c}")
+                for parent in parents:
+                    child_map[parent].append(unique_id)
+                child_map[unique_id] = []
+                n_tests += 1
+
+    for i in range(n_macros):
+        unique_id = f"macro.synthetic.macro_{i}"
+        depends_on = [f"macro.synthetic.macro_{i + 1}"] if i + 1 < n_macros else []
+        macros[unique_id] = _macro(unique_id, "synthetic", f"macro_{i}", depends_on)
+    # dbt builtin macros are in every manifest and skipped by the exporter.
+    for test_name in GENERIC_TESTS:
+        unique_id = f"macro.dbt.test_{test_name}"
+        macros[unique_id] = _macro(unique_id, "dbt", f"test_{test_name}", [])
+
+    parent_map: dict[str, list[str]] = {k: [] for k in child_map}
+    for parent, children in child_map.items():
+        for child in children:
+            parent_map[child].append(parent)
+
+    manifest_json = {
+        "metadata": _metadata(MANIFEST_SCHEMA),
+        "nodes": nodes,
+        "sources": sources,
+        "macros": macros,
+        "docs": {},
+        "exposures": {},
+        "metrics": {},
+        "selectors": {},
+        "disabled": {},
+        "parent_map": parent_map,
+        "child_map": child_map,
+    }
+    catalog_json = {
+        "metadata": _metadata(CATALOG_SCHEMA),
+        "nodes": catalog_nodes,
+        "sources": catalog_sources,
+        "errors": None,
+    }
+    return manifest_json, catalog_json
+
+
+def write_artifacts(output_dir_path: str | Path, **kwargs) -> tuple[Path, Path]:
+    output_dir_path = Path(output_dir_path)
+    output_dir_path.mkdir(exist_ok=True, parents=True)
+    manifest_json, catalog_json = generate(**kwargs)
+    manifest_json_path = output_dir_path / "manifest.json"
+    catalog_json_path = output_dir_path / "catalog.json"
+    with open(manifest_json_path, mode="w") as f:
+        dump(manifest_json, f)
+    with open(catalog_json_path, mode="w") as f:
+        dump(catalog_json, f)
+    return manifest_json_path, catalog_json_path
+
+
+def add_generator_arguments(parser: ArgumentParser):
+    parser.add_argument("--columns", type=int, default=20, help="columns per node")
+    parser.add_argument("--tests_per_column", type=float, default=0.2, help="generic tests per column")
+    parser.add_argument("--macros", type=int, default=50, help="number of project macros")
+    parser.add_argument("--fan_out", type=int, default=3, help="parents per model")
+    parser.add_argument("--packages", type=int, default=1, help="number of packages")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=1000, help="number of models, seeds and sources")
+    parser.add_argument("--output_dir", default="tmp_synthetic")
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    write_artifacts(
+        args.output_dir,
+        n_nodes=args.nodes,
+        n_columns=args.columns,
+        tests_per_column=args.tests_per_column,
+        n_macros=args.macros,
+        fan_out=args.fan_out,
+        n_packages=args.packages,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,49 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import DocsProject, render_pages
+    from .export_dbt_docs_to_md import parse_docs_data
+    from .output_sink import DirectorySink, MemorySink, OutputSink, TarSink, ZipSink, open_sink
+
+__all__ = [
+    "DirectorySink",
+    "DocsProject",
+    "MemorySink",
+    "OutputSink",
+    "TarSink",
+    "ZipSink",
+    "open_sink",
+    "parse_docs_data",
+    "render_pages",
+]
+
+# module of each public name. the modules are imported on first access,
+# so that the CLI entry point does not import the whole library before parsing arguments.
+_EXPORTS = {
+    "DirectorySink": "output_sink",
+    "DocsProject": "api",
+    "MemorySink": "output_sink",
+    "OutputSink": "output_sink",
+    "TarSink": "output_sink",
+    "ZipSink": "output_sink",
+    "open_sink": "output_sink",
+    "parse_docs_data": "export_dbt_docs_to_md",
+    "render_pages": "api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals().keys(), *__all__])
+
+
 def hello():
     return "Hello from export-dbt-docs-to-md!"
@@ -0,0 +1,3 @@
+from .export_dbt_docs_to_md import main
+
+main()
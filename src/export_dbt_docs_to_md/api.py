@@ -0,0 +1,429 @@
+"""
+Library API: load a dbt project and render its pages without touching disk.
+
+    from export_dbt_docs_to_md import DocsProject, render_pages
+
+    for relative_path, markdown_str in render_pages("target/manifest.json", "target/catalog.json"):
+        ...
+
+    project = DocsProject.load(manifest_json, catalog_json)  # paths or already loaded dicts
+    relative_path, markdown_str = project.render("model.my_project.my_model")
+
+Nodes are built and tests are attached to columns once in DocsProject.load,
+and each page is resolved (referenced by, lineage) and rendered only when it is asked for.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from .build_parsed_data import (
+    build_macro_data,
+    build_models_data,
+    build_parsed_json,
+    build_source_data,
+    build_test_data,
+)
+from .cache import ParsedJsonCache
+from .column_table import FULL_COLUMN_TABLE, ColumnTable
+from .format_parsed_data import Page, format_node_list, page_filepath, render_page, render_page_files
+from .incremental import ExportState
+from .join import CatalogIndex
+from .json_decoder import load_manifest_and_catalog
+from .lineage import LineageIndex
+from .lineage_diagram import LineageDiagram, LineageDiagramBuilder
+from .profiler import DISABLED_PROFILER, Profiler
+from .selector import filter_selected, select_node_ids, selector_attributes
+from .stream_loader import load_parsed_json_streaming
+from .templates import DEFAULT_TEMPLATES, PageTemplate, load_templates, templates_fingerprint
+
+if TYPE_CHECKING:
+    from .data_model import ParsedJson
+
+
+def is_table_node(node_id: str) -> bool:
+    return node_id.startswith("model.") or node_id.startswith("source.") or node_id.startswith("seed.")
+
+
+def test_page_name(test_node: str) -> str:
+    # remove test id at the end of test node name
+    return ".".join(test_node.split(".")[:-1])
+
+
+def load_artifacts(
+    manifest_json_path: str | Path, catalog_json_path: str | Path, json_backend: Optional[str] = None
+) -> tuple[dict, dict]:
+    """
+    json_backend is msgspec, orjson or json, or None for the fastest installed one.
+    """
+    return load_manifest_and_catalog(manifest_json_path, catalog_json_path, json_backend)
+
+
+def load_parsed_json(
+    manifest_json_path: str | Path,
+    catalog_json_path: str | Path,
+    strict: bool = False,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    json_backend: Optional[str] = None,
+) -> ParsedJson:
+    manifest_json, catalog_json = load_artifacts(manifest_json_path, catalog_json_path, json_backend)
+    return build_parsed_json_from_artifacts(manifest_json, catalog_json, strict, select=select, exclude=exclude)
+
+
+def build_parsed_json_from_artifacts(
+    manifest_json: dict,
+    catalog_json: dict,
+    strict: bool = False,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    previous: Optional[tuple[Any, Any, ParsedJson]] = None,
+) -> ParsedJson:
+    """
+    previous is (manifest_json, catalog_json, parsed_json) of an earlier build.
+    Nodes whose manifest.json and catalog.json entries are equal to the previous ones are reused as they are,
+    note that tests attached to their columns are kept too.
+    Nodes missing from catalog.json are built from manifest.json only and reported with a warning.
+    """
+    catalog_index = CatalogIndex(catalog_json)
+
+    def previous_node(node_map_key: str, k: str, top_level_key: str, manifest_data: Any, catalog_key: Optional[str]):
+        if previous is None:
+            return None
+        previous_manifest_json, previous_catalog_json, previous_parsed_json = previous
+        if previous_manifest_json[top_level_key].get(k) != manifest_data:
+            return None
+        if catalog_key is not None and previous_catalog_json[catalog_key].get(k) != catalog_index.entries.get(k):
+            return None
+        return getattr(previous_parsed_json, node_map_key).get(k)
+
+    # resolve selection from the raw entries so that only selected nodes are built.
+    selected = None
+    if select or exclude:
+        node_attributes = {
+            k: selector_attributes(k, manifest_data)
+            for top_level_key in ("nodes", "sources", "macros")
+            for k, manifest_data in manifest_json[top_level_key].items()
+        }
+        selected = select_node_ids(select, exclude, node_attributes, manifest_json["child_map"])
+
+    parsed_json_dict = {
+        "nodes": {},
+        "tests": {},
+        "macros": {},
+        "sources": {},
+        "parent_map": {},
+        "child_map": {},
+    }
+    top_level_key = "nodes"
+    for k, manifest_data in manifest_json[top_level_key].items():
+        if selected is not None and k not in selected:
+            continue
+        # Store basic info of tables to dataclass.
+        if k.startswith("model.") or k.startswith("seed."):
+            node_data = previous_node(top_level_key, k, top_level_key, manifest_data, top_level_key)
+            if node_data is None:
+                node_data = build_models_data(manifest_data, catalog_index.get(k), strict)
+            parsed_json_dict[top_level_key][k] = node_data
+
+        elif k.startswith("test."):
+            test_data = previous_node("tests", k, top_level_key, manifest_data, None)
+            if test_data is None:
+                test_data = build_test_data(manifest_data, strict)
+            parsed_json_dict["tests"][k] = test_data
+
+    top_level_key = "macros"
+    for k, manifest_data in manifest_json[top_level_key].items():
+        if selected is not None and k not in selected:
+            continue
+        if k.startswith("macro.dbt."):
+            # dbt-docs ignores dbt default macro, ignore here too.
+            continue
+        elif k.startswith("macro."):
+            macro_data = previous_node(top_level_key, k, top_level_key, manifest_data, None)
+            if macro_data is None:
+                macro_data = build_macro_data(manifest_data, strict)
+            parsed_json_dict["macros"][k] = macro_data
+
+    top_level_key = "sources"
+    for k, manifest_data in manifest_json[top_level_key].items():
+        if selected is not None and k not in selected:
+            continue
+        # Store basic info of tables to dataclass.
+        if k.startswith("source."):
+            source_data = previous_node(top_level_key, k, top_level_key, manifest_data, top_level_key)
+            if source_data is None:
+                source_data = build_source_data(manifest_data, catalog_index.get(k), strict)
+            parsed_json_dict[top_level_key][k] = source_data
+
+    catalog_index.report_unmatched()
+    return build_parsed_json(
+        {
+            "nodes": parsed_json_dict["nodes"],
+            "tests": parsed_json_dict["tests"],
+            "macros": parsed_json_dict["macros"],
+            "sources": parsed_json_dict["sources"],
+            "parent_map": filter_selected(manifest_json["parent_map"], selected),
+            "child_map": filter_selected(manifest_json["child_map"], selected),
+        },
+        strict,
+    )
+
+
+def build_test_parent_map(parsed_json: ParsedJson) -> dict[str, list[str]]:
+    """
+    Return parent tables of every column test.
+    child_map is inverted once so that a test with several parents (e.g. relationships) is attached to
+    every parent column, and its page is rendered only once.
+    """
+    test_parent_map = {}
+    for parent_node, child_node_list in parsed_json.child_map.items():
+        if not is_table_node(parent_node):
+            continue
+        for child_node in child_node_list:
+            # a test can be out of the selection even if its parent is selected.
+            test_data = parsed_json.tests.get(child_node)
+            if test_data is not None and test_data.column_name is not None:
+                test_parent_map.setdefault(child_node, []).append(parent_node)
+    return test_parent_map
+
+
+def attach_tests(parsed_json: ParsedJson, test_parent_map: dict[str, list[str]]):
+    """
+    Store relationship between tests and tables, i.e. add test names to the columns they test.
+    A column which is neither in catalog.json nor documented in manifest.json has no row to add the test to.
+    """
+    for test_node, parent_node_list in test_parent_map.items():
+        test_data = parsed_json.tests[test_node]
+        for parent_node in parent_node_list:
+            if parent_node.startswith("model."):
+                column = parsed_json.nodes[parent_node].columns.get(test_data.column_name)
+            elif parent_node.startswith("source."):
+                column = parsed_json.sources[parent_node].columns.get(test_data.column_name)
+            else:
+                continue
+            if column is not None:
+                column.test.add(test_data.test_metadata_name)
+
+
+class DocsProject:
+    def __init__(
+        self,
+        parsed_json: ParsedJson,
+        templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+        test_parent_map: Optional[dict[str, list[str]]] = None,
+        column_table: ColumnTable = FULL_COLUMN_TABLE,
+        lineage_diagram: Optional[LineageDiagram] = None,
+    ):
+        """
+        Pass test_parent_map if tests are already attached with attach_tests().
+        column_table caps the column tables of wide tables, see column_table.py.
+        With lineage_diagram, model and source pages embed a lineage diagram, see lineage_diagram.py.
+        """
+        if test_parent_map is None:
+            test_parent_map = build_test_parent_map(parsed_json)
+            attach_tests(parsed_json, test_parent_map)
+        self.parsed_json = parsed_json
+        self.templates = templates
+        self.test_parent_map = test_parent_map
+        self.column_table = column_table
+        self.lineage = LineageIndex.from_parsed_json(parsed_json)
+        self.lineage_diagram = lineage_diagram
+        # memoizes subgraphs across the pages of the project.
+        self._diagram_builder = (
+            LineageDiagramBuilder(self.lineage, lineage_diagram) if lineage_diagram is not None else None
+        )
+
+    @classmethod
+    def load(
+        cls,
+        manifest_json: str | Path | dict,
+        catalog_json: str | Path | dict,
+        strict: bool = False,
+        select: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        template_dir_path: Optional[str | Path] = None,
+        stream: bool = False,
+        json_backend: Optional[str] = None,
+        cache: Optional[ParsedJsonCache] = None,
+        profiler: Profiler = DISABLED_PROFILER,
+        column_table: ColumnTable = FULL_COLUMN_TABLE,
+        lineage_diagram: Optional[LineageDiagram] = None,
+    ) -> "DocsProject":
+        """
+        manifest_json and catalog_json are file paths or already loaded dicts.
+        stream and cache need file paths, see parse_docs_data() for the other arguments.
+        """
+        from_files = isinstance(manifest_json, (str, Path)) and isinstance(catalog_json, (str, Path))
+        if (stream or cache is not None) and not from_files:
+            raise ValueError("stream and cache are supported only for manifest.json and catalog.json file paths")
+
+        with profiler.phase("templates"):
+            templates = load_templates(template_dir_path)
+
+        parsed_json = None
+        if cache is not None:
+            with profiler.phase("cache_get"):
+                cache_key = cache.key(manifest_json, catalog_json, strict=strict, select=select, exclude=exclude)
+                parsed_json = cache.get(cache_key)
+            profiler.count("cache_hit" if parsed_json is not None else "cache_miss")
+        if parsed_json is not None:
+            # tests are attached to columns in the cached nodes already.
+            return cls(parsed_json, templates, build_test_parent_map(parsed_json), column_table, lineage_diagram)
+
+        if stream:
+            # read manifest.json and catalog.json node by node to bound memory on huge projects.
+            # decoding and node construction are interleaved, so they are one phase.
+            with profiler.phase("load_and_build"):
+                parsed_json = load_parsed_json_streaming(
+                    manifest_json, catalog_json, strict, select=select, exclude=exclude
+                )
+        else:
+            if from_files:
+                with profiler.phase("load"):
+                    manifest_json, catalog_json = load_artifacts(manifest_json, catalog_json, json_backend)
+            with profiler.phase("build"):
+                parsed_json = build_parsed_json_from_artifacts(
+                    manifest_json, catalog_json, strict, select=select, exclude=exclude
+                )
+        with profiler.phase("attach_tests"):
+            test_parent_map = build_test_parent_map(parsed_json)
+            attach_tests(parsed_json, test_parent_map)
+        if cache is not None:
+            with profiler.phase("cache_put"):
+                cache.put(cache_key, parsed_json)
+        return cls(parsed_json, templates, test_parent_map, column_table, lineage_diagram)
+
+    def node_ids(self) -> list[str]:
+        """
+        ids of nodes which have a page, in the order of pages: macros, column tests, then tables.
+        """
+        # TODO: deal with other nodes property analysis, exposure, metric and docs.
+        return [
+            *self.parsed_json.macros.keys(),
+            *self.test_parent_map.keys(),
+            *(node_id for node_id in self.parsed_json.child_map.keys() if is_table_node(node_id)),
+        ]
+
+    def _macro_page(self, node_id: str) -> Page:
+        macro_data = self.parsed_json.macros[node_id]
+        children = sorted(self.lineage.children(node_id))
+        referenced_by = {
+            "models": format_node_list([c for c in children if c.startswith("model.") or c.startswith("seed.")]),
+            "macros": format_node_list([c for c in children if c.startswith("macro.")]),
+        }
+        file_path = page_filepath(node_id, macro_data.package_name, Path())
+        return Page(node_id, "macro", macro_data, referenced_by, file_path)
+
+    def _test_page(self, node_id: str) -> Page:
+        if node_id not in self.test_parent_map:
+            raise KeyError(node_id)
+        file_path = page_filepath(test_page_name(node_id), "tests", Path())
+        return Page(node_id, "test", self.parsed_json.tests[node_id], None, file_path)
+
+    def _table_page(self, node_id: str) -> Page:
+        referenced_by = {"models": [], "tests": []}
+        for child_node in self.parsed_json.child_map[node_id]:
+            if child_node.startswith("model.") or child_node.startswith("seed."):
+                referenced_by["models"].append(child_node)
+            elif child_node in self.test_parent_map:
+                referenced_by["tests"].append(test_page_name(child_node))
+
+        # format reference info
+        for reference_by_key in referenced_by.keys():
+            referenced_by[reference_by_key] = format_node_list(referenced_by[reference_by_key])
+
+        node_lineage = None
+        if node_id.startswith("model."):
+            node_lineage = {
+                "upstream": format_node_list(sorted(self.lineage.upstream(node_id))),
+                "downstream": format_node_list(sorted(self.lineage.downstream(node_id))),
+            }
+        if self._diagram_builder is not None and node_id.startswith(("model.", "source.")):
+            node_lineage = {**(node_lineage or {}), "diagram": self._diagram_builder.render(node_id)}
+
+        if node_id.startswith("source."):
+            node_data = self.parsed_json.sources[node_id]
+        else:
+            node_data = self.parsed_json.nodes[node_id]
+        file_path = page_filepath(node_id, node_data.package_name, Path())
+        return Page(node_id, node_id.split(".")[0], node_data, referenced_by, file_path, node_lineage)
+
+    def page(self, node_id: str) -> Page:
+        """
+        Resolve the page of node_id. Raise KeyError if node_id has no page.
+        """
+        if node_id.startswith("macro."):
+            return self._macro_page(node_id)
+        if node_id.startswith("test."):
+            return self._test_page(node_id)
+        if is_table_node(node_id):
+            return self._table_page(node_id)
+        raise KeyError(node_id)
+
+    def render(self, node_id: str) -> tuple[str, str]:
+        """
+        Return (relative_path, markdown) of the page of node_id, without its column sidecar files.
+        """
+        page = self.page(node_id)
+        return page.file_path.as_posix(), render_page(page, self.templates, self.column_table)
+
+    def pages(self, node_ids: Optional[Iterable[str]] = None) -> Iterator[tuple[str, str]]:
+        """
+        Lazily render (relative_path, markdown) of node_ids, or of every page.
+        Column sidecar files of wide tables follow their page.
+        """
+        for node_id in self.node_ids() if node_ids is None else node_ids:
+            for file_path, markdown_str in render_page_files(self.page(node_id), self.templates, self.column_table):
+                yield file_path.as_posix(), markdown_str
+
+    def resolve(
+        self, state: Optional[ExportState] = None, node_ids: Optional[Iterable[str]] = None
+    ) -> tuple[list[Page], dict[str, Any]]:
+        """
+        Return every page to render, or the pages of node_ids, with its content hash.
+        With incremental export state, pages whose hash is unchanged are left out.
+        """
+        if state is None:
+            state = ExportState(Path(), enabled=False)
+        pages = []
+        digests = {}
+        # e.g. a changed --template_dir renders every page again.
+        fingerprint = templates_fingerprint(self.templates) if state.enabled else None
+        for node_id in self.node_ids() if node_ids is None else node_ids:
+            page = self.page(node_id)
+            column_table = self.column_table if is_table_node(node_id) else None
+            digests[node_id] = state.digest(page.node_data, page.referenced_by, page.lineage, column_table, fingerprint)
+            if state.is_changed(node_id, digests[node_id]):
+                pages.append(page)
+        return pages, digests
+
+
+def resolve_pages(
+    parsed_json: ParsedJson,
+    state: Optional[ExportState] = None,
+    test_parent_map: Optional[dict[str, list[str]]] = None,
+) -> tuple[list[Page], dict[str, str]]:
+    """
+    Store test and lineage relationships, and return pages to render with their content hash.
+    Pass test_parent_map if tests are already attached with attach_tests().
+    """
+    return DocsProject(parsed_json, test_parent_map=test_parent_map).resolve(state)
+
+
+def render_pages(
+    manifest_json: str | Path | dict,
+    catalog_json: str | Path | dict,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    template_dir_path: Optional[str | Path] = None,
+    **load_kwargs: Any,
+) -> Iterator[tuple[str, str]]:
+    """
+    Lazily render (relative_path, markdown) of every page, see DocsProject.load() for the arguments.
+    """
+    project = DocsProject.load(
+        manifest_json, catalog_json, select=select, exclude=exclude, template_dir_path=template_dir_path, **load_kwargs
+    )
+    return project.pages()
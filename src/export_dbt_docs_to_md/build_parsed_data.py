@@ -0,0 +1,145 @@
+"""
+Build nodes from manifest.json and catalog.json entries.
+
+With strict=True the pydantic models in data_model.py validate every entry,
+otherwise the compact models in compact_data_model.py are used.
+Repeated short strings such as types and package names are interned to share one object.
+"""
+
+from __future__ import annotations
+
+from sys import intern
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
+
+from . import compact_data_model
+
+if TYPE_CHECKING:
+    from .data_model import Column, Macro, ManifestData, ParsedJson, SourceData, Test
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return intern(value) if type(value) is str else value
+
+
+def _data_model(strict: bool) -> ModuleType:
+    if not strict:
+        return compact_data_model
+    # pydantic takes a large part of the startup time, so it is imported only with strict=True.
+    from . import data_model
+
+    return data_model
+
+
+def build_column_info(manifest_data: dict, catalog_data: Optional[dict], strict: bool = False) -> dict[str, Column]:
+    """
+    merge catalog.json columns with their descriptions in manifest.json.
+    Without catalog_data (the node is not in catalog.json), columns documented in manifest.json are used as they are.
+    """
+    column_model = _data_model(strict).Column
+    manifest_columns = manifest_data["columns"]
+    columns = {}
+    if catalog_data is None:
+        for index, column in enumerate(manifest_columns.values(), start=1):
+            columns[column["name"]] = column_model(
+                type_=_intern(column.get("data_type") or ""),
+                index=str(index),
+                name=column["name"],
+                comment=None,
+                description_from_manifest=column["description"],
+            )
+        return columns
+
+    for column in catalog_data["columns"].values():
+        column_info_from_manifest = manifest_columns.get(column["name"])
+        if column_info_from_manifest is not None:
+            description_from_manifest = column_info_from_manifest["description"]
+        else:
+            description_from_manifest = None
+
+        columns[column["name"]] = column_model(
+            type_=_intern(column["type"]),
+            index=str(column["index"]),
+            name=column["name"],
+            comment=column["comment"],
+            description_from_manifest=description_from_manifest,
+        )
+    return columns
+
+
+def _owner(catalog_data: Optional[dict]) -> Optional[str]:
+    return _intern(catalog_data["metadata"]["owner"]) if catalog_data is not None else None
+
+
+def build_models_data(manifest_data: dict, catalog_data: Optional[dict], strict: bool = False) -> ManifestData:
+    """
+    build model or seed node from manifest.json["nodes"] and catalog.json["nodes"] entries.
+    catalog_data is None if the node is not in catalog.json.
+    """
+    return _data_model(strict).ManifestData(
+        name=manifest_data["name"],
+        columns=build_column_info(manifest_data, catalog_data, strict),
+        raw_code=manifest_data["raw_code"],
+        compiled_code=manifest_data["compiled_code"],
+        depends_on=manifest_data["depends_on"]["nodes"],
+        description=manifest_data["description"],
+        language=_intern(manifest_data["language"]),
+        tags=manifest_data["tags"],
+        owner=_owner(catalog_data),
+        package_name=_intern(manifest_data["package_name"]),
+        database=_intern(manifest_data["database"]),
+        schema_=_intern(manifest_data["schema"]),
+        materialized=_intern(manifest_data["config"]["materialized"]),
+        depends_on_macros=manifest_data["depends_on"].get("macros", []),
+    )
+
+
+def build_test_data(manifest_data: dict, strict: bool = False) -> Test:
+    return _data_model(strict).Test(
+        name=manifest_data["name"],
+        materialized=_intern(manifest_data["config"]["materialized"]),
+        column_name=manifest_data["column_name"],
+        refs=manifest_data["refs"][0],
+        depends_on=manifest_data["depends_on"]["nodes"],
+        raw_code=manifest_data["raw_code"],
+        compiled_code=manifest_data["compiled_code"],
+        description=manifest_data["description"],
+        test_metadata_name=_intern(manifest_data["test_metadata"]["name"]),
+    )
+
+
+def build_macro_data(manifest_data: dict, strict: bool = False) -> Macro:
+    return _data_model(strict).Macro(
+        name=manifest_data["name"],
+        depends_on=manifest_data["depends_on"],
+        arguments=manifest_data["arguments"],
+        macro_sql=manifest_data["macro_sql"],
+        description=manifest_data["description"],
+        resource_type=_intern(manifest_data["resource_type"]),
+        package_name=_intern(manifest_data["package_name"]),
+    )
+
+
+def build_source_data(manifest_data: dict, catalog_data: Optional[dict], strict: bool = False) -> SourceData:
+    return _data_model(strict).SourceData(
+        name=manifest_data["name"],
+        columns=build_column_info(manifest_data, catalog_data, strict),
+        description=manifest_data["description"],
+        tags=manifest_data["tags"],
+        owner=_owner(catalog_data),
+        package_name=_intern(manifest_data["package_name"]),
+        database=_intern(manifest_data["database"]),
+        schema_=_intern(manifest_data["schema"]),
+        resource_type=_intern(manifest_data["resource_type"]),
+        # -- below property exists pnly source node
+        loader=_intern(manifest_data["loader"]),
+        source_name=_intern(manifest_data["source_name"]),
+    )
+
+
+def build_parsed_json(parsed_json_dict: dict[str, dict], strict: bool = False) -> ParsedJson:
+    """
+    parsed_json_dict has nodes, sources, tests, macros, parent_map and child_map.
+    parent_map and child_map are validated again only with strict=True.
+    """
+    return _data_model(strict).ParsedJson(**parsed_json_dict)
@@ -0,0 +1,131 @@
+"""
+On-disk cache of built ParsedJson.
+
+An entry is the pickled ParsedJson, with tests attached to columns, keyed by the content hash of
+manifest.json and catalog.json, the tool version and the options that change the built nodes.
+A cache hit skips JSON decoding and node construction. Least recently used entries are evicted
+when the cache dir grows over max_bytes.
+"""
+
+from __future__ import annotations
+
+import gc
+import pickle
+from contextlib import contextmanager
+from hashlib import sha256
+from os import replace, utime
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .data_model import ParsedJson
+
+
+CACHE_SUFFIX = ".pickle"
+# bump this when ParsedJson or its models change.
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 1 << 30
+
+
+def tool_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("export-dbt-docs-to-md")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def file_hash(file_path: str | Path, chunk_size: int = 1 << 20) -> str:
+    digest = sha256()
+    with open(file_path, mode="rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # (un)pickling allocates millions of containers and the cyclic gc would run many times over them.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ParsedJsonCache:
+    def __init__(self, cache_dir_path: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir_path = Path(cache_dir_path)
+        self.max_bytes = max_bytes
+
+    def key(self, manifest_json_path: str | Path, catalog_json_path: str | Path, **options: Any) -> str:
+        """
+        options are the arguments which change the built ParsedJson, e.g. strict and select.
+        """
+        key_parts = [
+            f"{CACHE_VERSION}",
+            tool_version(),
+            file_hash(manifest_json_path),
+            file_hash(catalog_json_path),
+            repr(sorted(options.items())),
+        ]
+        return sha256("\n".join(key_parts).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir_path / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[ParsedJson]:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, mode="rb") as f, _gc_paused():
+                parsed_json = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # a broken entry, e.g. from a killed run, is built again.
+            entry_path.unlink(missing_ok=True)
+            return None
+        # the mtime is the last use for eviction.
+        utime(entry_path)
+        return parsed_json
+
+    def put(self, key: str, parsed_json: ParsedJson):
+        self.cache_dir_path.mkdir(exist_ok=True, parents=True)
+        entry_path = self._entry_path(key)
+        # a temp file of its own, so that parallel runs on the same inputs do not write into each other's entry.
+        with NamedTemporaryFile(dir=self.cache_dir_path, prefix=f"{key}.", suffix=".tmp", delete=False) as f:
+            tmp_path = Path(f.name)
+            try:
+                with _gc_paused():
+                    pickle.dump(parsed_json, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                f.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        replace(tmp_path, entry_path)
+        self.evict(keep=entry_path)
+
+    def evict(self, keep: Optional[Path] = None):
+        """
+        delete least recently used entries until the cache dir is within max_bytes.
+        """
+        entries = []
+        for entry_path in self.cache_dir_path.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                entries.append((entry_path.stat(), entry_path))
+            except FileNotFoundError:
+                # evicted by another run meanwhile
+                continue
+        entries.sort(key=lambda entry: entry[0].st_mtime)
+        total_bytes = sum(stat.st_size for stat, _ in entries)
+        for stat, entry_path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if entry_path == keep:
+                continue
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
@@ -0,0 +1,74 @@
+"""
+Size caps of the column table and the sample SQL select list of very wide tables.
+
+- full renders every column in the page (default).
+- truncate renders the first max_columns columns and every column in a <page>.columns.md sidecar.
+- split renders the first max_columns columns and the rest in <page>.columns.2.md, <page>.columns.3.md, ...,
+  max_columns columns each.
+
+The sample SQL select list of seeds and sources is capped at max_columns with truncate and split.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+COLUMN_TABLE_STRATEGIES = ("full", "truncate", "split")
+DEFAULT_MAX_COLUMNS = 200
+
+
+@dataclass(frozen=True)
+class ColumnTable:
+    strategy: str = "full"
+    max_columns: int = DEFAULT_MAX_COLUMNS
+
+    def __post_init__(self):
+        if self.strategy not in COLUMN_TABLE_STRATEGIES:
+            raise ValueError(
+                f"Invalid column table strategy: {self.strategy}. "
+                f"Supported strategies are {', '.join(COLUMN_TABLE_STRATEGIES)}"
+            )
+        if self.max_columns < 1:
+            raise ValueError(f"max_columns must be positive: {self.max_columns}")
+
+    def is_capped(self, n_columns: int) -> bool:
+        return self.strategy != "full" and n_columns > self.max_columns
+
+
+FULL_COLUMN_TABLE = ColumnTable()
+
+
+class ColumnSidecar(NamedTuple):
+    """
+    columns[start:stop] are rendered in file_path, which is relative to the output root.
+    """
+
+    file_path: Path
+    start: int
+    stop: int
+
+
+def column_sidecars(page_file_path: Path, n_columns: int, column_table: ColumnTable) -> list[ColumnSidecar]:
+    """
+    sidecar files of a page with n_columns columns, empty if the column table is not capped.
+    """
+    if not column_table.is_capped(n_columns):
+        return []
+    stem = page_file_path.stem
+    if column_table.strategy == "truncate":
+        return [ColumnSidecar(page_file_path.with_name(f"{stem}.columns.md"), 0, n_columns)]
+    max_columns = column_table.max_columns
+    return [
+        ColumnSidecar(page_file_path.with_name(f"{stem}.columns.{part}.md"), start, min(start + max_columns, n_columns))
+        for part, start in enumerate(range(max_columns, n_columns, max_columns), start=2)
+    ]
+
+
+def select_list(column_names: list[str], column_table: ColumnTable) -> str:
+    """
+    column list of the sample SQL select statement
+    """
+    if not column_table.is_capped(len(column_names)):
+        return ",\n    ".join(column_names)
+    n_more = len(column_names) - column_table.max_columns
+    return ",\n    ".join(column_names[: column_table.max_columns]) + f"\n    -- and {n_more} more columns"
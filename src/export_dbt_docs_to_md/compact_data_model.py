@@ -0,0 +1,87 @@
+"""
+Compact counterparts of the models in data_model.py.
+
+These are `__slots__` dataclasses without validation, so an instance has no per-instance `__dict__`
+and construction is a plain attribute assignment. They are used by default,
+and the pydantic models in data_model.py are used with `--strict`.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True)
+class Column:
+    type_: str
+    index: str
+    name: str
+    comment: Optional[str]
+    description_from_manifest: Optional[str]
+    test: set[str] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class ManifestData:
+    name: str
+    columns: dict[str, Column]
+    depends_on: list[str]
+    raw_code: str
+    compiled_code: str
+    description: str
+    language: str
+    tags: list[str]
+    owner: Optional[str]
+    package_name: str
+    database: str
+    schema_: str
+    materialized: str
+    depends_on_macros: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Test:
+    name: str
+    materialized: str
+    column_name: Optional[str]
+    refs: list[str]
+    depends_on: list[str]
+    raw_code: str
+    compiled_code: str
+    description: Optional[str]
+    test_metadata_name: str
+
+
+@dataclass(slots=True)
+class Macro:
+    name: str
+    depends_on: dict[str, list[str]]
+    arguments: list[str]
+    macro_sql: str
+    description: Optional[str]
+    resource_type: str
+    package_name: str
+
+
+@dataclass(slots=True)
+class SourceData:
+    name: str
+    columns: dict[str, Column]
+    description: str
+    tags: list[str]
+    owner: Optional[str]
+    package_name: str
+    database: str
+    schema_: str
+    resource_type: str
+    loader: str
+    source_name: str
+
+
+@dataclass(slots=True)
+class ParsedJson:
+    nodes: dict[str, ManifestData]
+    sources: dict[str, SourceData]
+    tests: dict[str, Test]
+    macros: dict[str, Macro]
+    parent_map: dict[str, list[str]]
+    child_map: dict[str, list[str]]
@@ -21,11 +21,12 @@ class ManifestData(BaseModel):
     description: str
     language: str
     tags: list[str]
-    owner: str
+    owner: Optional[str] = Field(...)
     package_name: str
     database: str
     schema_: str
     materialized: str
+    depends_on_macros: list[str] = Field(default_factory=list)
 
 
 class Test(BaseModel):
@@ -53,7 +54,7 @@ class SourceData(BaseModel):
     columns: dict[str, Column]
     description: str
     tags: list[str]
-    owner: str
+    owner: Optional[str] = Field(...)
     package_name: str
     database: str
     schema_: str
@@ -0,0 +1,198 @@
+"""
+Changelog between two versions of manifest.json and catalog.json, e.g. of two dbt runs.
+
+Both versions are built with the same code as parse_docs_data(), then compared in one pass over the union of node ids
+with dict lookups, without resolving or rendering any page.
+
+- added and removed models, seeds, sources, tests and macros. Snapshots, analyses etc. are not built, so not compared
+- changed descriptions, materializations and code
+- added and removed columns, and changed column types and descriptions
+
+The result is written as changelog.md and as changelog.json:
+
+    {
+        "version": 1,
+        "summary": {resource_type: {"added": n, "removed": n, "changed": n}, ...},
+        "added": [{"node_id": ..., "resource_type": ...}, ...],
+        "removed": [...],
+        "changed": [{"node_id": ..., "resource_type": ..., "changes": [{"change": ..., ...}, ...]}, ...]
+    }
+"""
+
+from __future__ import annotations
+
+from json import dumps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from .api import load_parsed_json
+from .profiler import DISABLED_PROFILER, Profiler
+
+if TYPE_CHECKING:
+    from .data_model import Column, ParsedJson
+
+CHANGELOG_MARKDOWN_FILE_NAME = "changelog.md"
+CHANGELOG_JSON_FILE_NAME = "changelog.json"
+# bump this when the layout of changelog.json changes.
+CHANGELOG_VERSION = 1
+
+# compared attributes of each node map of ParsedJson, in the order of the report
+_COMPARED_FIELDS = {
+    "nodes": ("description", "materialized", "raw_code"),
+    "sources": ("description", "loader"),
+    "tests": ("raw_code", "column_name"),
+    "macros": ("description", "macro_sql"),
+}
+# fields whose old and new values are too long for the changelog, only the change is reported.
+_CODE_FIELDS = ("raw_code", "macro_sql")
+
+
+def _column_changes(old_columns: dict[str, Column], new_columns: dict[str, Column]) -> Iterator[dict[str, Any]]:
+    for name, new_column in new_columns.items():
+        old_column = old_columns.get(name)
+        if old_column is None:
+            yield {"change": "column_added", "column": name, "type": new_column.type_}
+            continue
+        if old_column.type_ != new_column.type_:
+            yield {"change": "column_type", "column": name, "old": old_column.type_, "new": new_column.type_}
+        if old_column.description_from_manifest != new_column.description_from_manifest:
+            yield {
+                "change": "column_description",
+                "column": name,
+                "old": old_column.description_from_manifest,
+                "new": new_column.description_from_manifest,
+            }
+    for name, old_column in old_columns.items():
+        if name not in new_columns:
+            yield {"change": "column_removed", "column": name, "type": old_column.type_}
+
+
+def _node_changes(node_map_name: str, old_data: Any, new_data: Any) -> list[dict[str, Any]]:
+    changes = []
+    for field_name in _COMPARED_FIELDS[node_map_name]:
+        old_value, new_value = getattr(old_data, field_name), getattr(new_data, field_name)
+        if old_value == new_value:
+            continue
+        if field_name in _CODE_FIELDS:
+            changes.append({"change": "code"})
+        else:
+            changes.append({"change": field_name, "old": old_value, "new": new_value})
+    if node_map_name in ("nodes", "sources"):
+        changes.extend(_column_changes(old_data.columns, new_data.columns))
+    return changes
+
+
+def _entry(node_id: str, node_map_name: str, node_data: Any) -> dict[str, Any]:
+    entry = {"node_id": node_id, "resource_type": node_id.split(".")[0]}
+    if node_map_name == "tests":
+        # the tables (and column) the test is attached to
+        entry["depends_on"] = list(node_data.depends_on)
+        entry["column"] = node_data.column_name
+    return entry
+
+
+def diff_parsed_json(old_json: ParsedJson, new_json: ParsedJson) -> dict[str, Any]:
+    added = []
+    removed = []
+    changed = []
+    for node_map_name in _COMPARED_FIELDS.keys():
+        old_map, new_map = getattr(old_json, node_map_name), getattr(new_json, node_map_name)
+        for node_id, new_data in new_map.items():
+            old_data = old_map.get(node_id)
+            if old_data is None:
+                added.append(_entry(node_id, node_map_name, new_data))
+                continue
+            changes = _node_changes(node_map_name, old_data, new_data)
+            if changes:
+                changed.append({"node_id": node_id, "resource_type": node_id.split(".")[0], "changes": changes})
+        for node_id, old_data in old_map.items():
+            if node_id not in new_map:
+                removed.append(_entry(node_id, node_map_name, old_data))
+
+    summary: dict[str, dict[str, int]] = {}
+    for key, entries in (("added", added), ("removed", removed), ("changed", changed)):
+        entries.sort(key=lambda entry: entry["node_id"])
+        for entry in entries:
+            counts = summary.setdefault(entry["resource_type"], {"added": 0, "removed": 0, "changed": 0})
+            counts[key] += 1
+    return {
+        "version": CHANGELOG_VERSION,
+        "summary": dict(sorted(summary.items())),
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+    }
+
+
+def diff_artifacts(
+    old_manifest_json_path: str | Path,
+    old_catalog_json_path: str | Path,
+    new_manifest_json_path: str | Path,
+    new_catalog_json_path: str | Path,
+    strict: bool = False,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    json_backend: Optional[str] = None,
+    profiler: Profiler = DISABLED_PROFILER,
+) -> dict[str, Any]:
+    """
+    Return the changelog from the old to the new version, see parse_docs_data() for the other arguments.
+    """
+    with profiler.phase("load_and_build"):
+        old_json = load_parsed_json(
+            old_manifest_json_path, old_catalog_json_path, strict, select, exclude, json_backend
+        )
+        new_json = load_parsed_json(
+            new_manifest_json_path, new_catalog_json_path, strict, select, exclude, json_backend
+        )
+    with profiler.phase("diff"):
+        return diff_parsed_json(old_json, new_json)
+
+
+def _format_value(value: Any) -> str:
+    if value is None or value == "":
+        return "(empty)"
+    # keep a change on one line of the list.
+    return "`" + " ".join(str(value).split()).replace("`", "'") + "`"
+
+
+def _format_change(change: dict[str, Any]) -> str:
+    kind = change["change"]
+    if kind == "code":
+        return "code changed"
+    if kind == "column_added":
+        return f"column `{change['column']}` added ({_format_value(change['type'])})"
+    if kind == "column_removed":
+        return f"column `{change['column']}` removed"
+    if kind == "column_type":
+        return f"column `{change['column']}` type: {_format_value(change['old'])} → {_format_value(change['new'])}"
+    if kind == "column_description":
+        return f"column `{change['column']}` description changed"
+    if kind == "description":
+        return "description changed"
+    return f"{kind}: {_format_value(change['old'])} → {_format_value(change['new'])}"
+
+
+def render_changelog_markdown(changelog: dict[str, Any]) -> str:
+    lines = ["# Changelog", "", "| RESOURCE TYPE | ADDED | REMOVED | CHANGED |", "| --- | --- | --- | --- |"]
+    for resource_type, counts in changelog["summary"].items():
+        lines.append(f"| {resource_type} | {counts['added']} | {counts['removed']} | {counts['changed']} |")
+    if not changelog["summary"]:
+        lines.append("| &nbsp; | 0 | 0 | 0 |")
+
+    for key, title in (("added", "Added"), ("removed", "Removed")):
+        if not changelog[key]:
+            continue
+        lines.extend(["", f"## {title}", "| NODE | TYPE |", "| --- | --- |"])
+        lines.extend(f"| {entry['node_id']} | {entry['resource_type']} |" for entry in changelog[key])
+
+    if changelog["changed"]:
+        lines.extend(["", "## Changed"])
+        for entry in changelog["changed"]:
+            lines.extend(["", f"### {entry['node_id']}"])
+            lines.extend(f"- {_format_change(change)}" for change in entry["changes"])
+    return "\n".join(lines) + "\n"
+
+
+def dump_changelog(changelog: dict[str, Any]) -> str:
+    return dumps(changelog, indent=1, ensure_ascii=False)
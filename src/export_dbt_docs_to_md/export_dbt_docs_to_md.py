@@ -7,242 +7,460 @@ manifest.json specification: https://docs.getdbt.com/reference/artifacts/manifes
 catalog.json specification: https://docs.getdbt.com/reference/artifacts/catalog-json
 """
 
-from json import load
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from collections import Counter
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if not __package__:
+    # run as a script, e.g. `python src/export_dbt_docs_to_md/export_dbt_docs_to_md.py`
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    __package__ = "export_dbt_docs_to_md"
+
+# only light modules are imported here, so that `--help` and argument errors return fast.
+# the exporter itself is imported when it runs.
+from .cache import DEFAULT_MAX_BYTES  # noqa: E402
+from .column_table import COLUMN_TABLE_STRATEGIES, DEFAULT_MAX_COLUMNS, FULL_COLUMN_TABLE, ColumnTable  # noqa: E402
+from .lineage_diagram import DEFAULT_DEPTH, DEFAULT_MAX_DEGREE, DIAGRAM_FORMATS, LineageDiagram  # noqa: E402
+from .profiler import DISABLED_PROFILER, Profiler  # noqa: E402
+from .shard import Shard, parse_shard  # noqa: E402
+
+if TYPE_CHECKING:
+    from .cache import ParsedJsonCache
+    from .output_sink import OutputSink
+
+
+def parse_docs_data(
+    manifest_json_path: str | Path,
+    catalog_json_path: str | Path,
+    output_dir_path: str | Path,
+    stream: bool = False,
+    incremental: bool = False,
+    jobs: int = 1,
+    template_dir_path: Optional[str | Path] = None,
+    sink: Optional[OutputSink] = None,
+    strict: bool = False,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    profiler: Profiler = DISABLED_PROFILER,
+    json_backend: Optional[str] = None,
+    cache: Optional[ParsedJsonCache] = None,
+    search_index: bool = False,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
+    lineage_diagram: Optional[LineageDiagram] = None,
+    shard: Optional[Shard] = None,
+    index_pages: bool = False,
+) -> Counter:
+    """
+    Return the number of rendered pages per resource type.
+
+    output_dir_path is a dir, or an archive file path ending with .tar, .tar.gz, .tgz or .zip.
+    Pass `sink` (e.g. MemorySink) to receive pages elsewhere, then output_dir_path is used only for the state file.
+    With strict=True, nodes are validated with the pydantic models in data_model.py.
+    select/exclude are dbt style selectors, e.g. ["tag:nightly package:my_project"] or ["+my_model"].
+    Pass an enabled `profiler` to record time and memory per phase, see profiler.py.
+    json_backend is msgspec, orjson or json, or None for the fastest installed one. It is not used with stream=True.
+    With `cache`, built nodes are reused while manifest.json and catalog.json are unchanged.
+    With search_index=True, an inverted index of every page is written as search_index.json, see search_index.py.
+    column_table caps the column tables of wide tables, e.g. ColumnTable("split", 200), see column_table.py.
+    With lineage_diagram, e.g. LineageDiagram("mermaid", depth=2), model and source pages embed a lineage diagram,
+    see lineage_diagram.py.
+    With shard, e.g. Shard(1, 4), only the pages of the shard are rendered and recorded for merge_shards(),
+    see shard.py.
+    With index_pages=True, index.md pages per package and resource type and files.json with the size and hash of
+    every written file are written too, see output_index.py. Shards always record their files for merge_shards().
+    """
+    from .api import DocsProject
+    from .format_parsed_data import page_sidecar_paths
+    from .incremental import ExportState
+    from .output_index import SEARCH_INDEX, OutputIndex
+    from .output_sink import is_archive_path, open_sink
+    from .parallel_render import write_pages
+    from .search_index import SEARCH_INDEX_FILE_NAME, build_search_index, dump_search_index
+
+    project = DocsProject.load(
+        manifest_json_path,
+        catalog_json_path,
+        strict=strict,
+        select=select,
+        exclude=exclude,
+        template_dir_path=template_dir_path,
+        stream=stream,
+        json_backend=json_backend,
+        cache=cache,
+        profiler=profiler,
+        column_table=column_table,
+        lineage_diagram=lineage_diagram,
+    )
+    parsed_json = project.parsed_json
+    if profiler.enabled:
+        for node_id in parsed_json.nodes.keys():
+            profiler.count(f"nodes.{node_id.split('.')[0]}")
+        profiler.count("nodes.source", len(parsed_json.sources))
+        profiler.count("nodes.test", len(parsed_json.tests))
+        profiler.count("nodes.macro", len(parsed_json.macros))
+
+    # with incremental export, pages whose inputs are unchanged since the last export are not rendered again.
+    if incremental and (is_archive_path(output_dir_path) if sink is None else not sink.is_directory):
+        raise ValueError("Incremental export is supported only for directory output")
+    if incremental and shard is not None:
+        raise ValueError("Incremental export is not supported with shards")
+    if sink is None:
+        sink = open_sink(output_dir_path)
+    state = ExportState.load(output_dir_path, enabled=incremental)
+
+    # resolve relationships first and collect pages to render, then render and write them all at once.
+    with profiler.phase("resolve"):
+        node_ids = None
+        if shard is not None:
+            from .shard import shard_node_ids
+
+            node_ids = shard_node_ids(project, shard)
+        pages, digests = project.resolve(state, node_ids)
+
+    output_index = None
+    if index_pages or shard is not None:
+        output_index = OutputIndex()
+        if incremental:
+            # files of pages skipped by incremental export are as recorded in the previous export.
+            rendered_node_ids = {page.node_id for page in pages}
+            skipped_pages = {k: state.pages[k] for k in digests.keys() if k not in rendered_node_ids}
+            output_index.add_previous(output_dir_path, skipped_pages)
+
+    rendered_count = Counter()
+    with sink:
+        written = write_pages(
+            pages,
+            sink,
+            jobs=jobs,
+            templates=project.templates,
+            profiler=profiler,
+            column_table=column_table,
+            output_index=output_index,
+        )
+        # the loop runs write_pages to its end, where it waits for the writers and raises a failed write.
+        for page in written:
+            state.update(page.node_id, digests[page.node_id], page.file_path, page_sidecar_paths(page, column_table))
+            rendered_count[page.resource_type] += 1
+        if search_index and (shard is None or shard.index == 1):
+            # every page is indexed, also the ones skipped by incremental export or of other shards.
+            with profiler.phase("search_index"):
+                search_index_json = dump_search_index(build_search_index(project))
+                sink.write(Path(SEARCH_INDEX_FILE_NAME), search_index_json)
+            if output_index is not None:
+                output_index.add_file(Path(SEARCH_INDEX_FILE_NAME), search_index_json, SEARCH_INDEX)
+        if shard is not None:
+            from .shard import dump_shard_record
+
+            # index pages of every shard are written by merge_shards().
+            sink.write(shard.record_path, dump_shard_record(shard, output_index, len(project.node_ids())))
+        elif output_index is not None:
+            with profiler.phase("index_pages"):
+                output_index.write(sink)
+
+    with profiler.phase("state"):
+        state.prune()
+        state.save()
+    profiler.count("pages_skipped", state.skipped_count)
+    return rendered_count
+
+
+def build_argument_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument("-m", "--manifest_json")
+    parser.add_argument("-c", "--catalog_json")
+    parser.add_argument(
+        "-o", "--output_dir", default="output", help="output dir, or archive file path (.tar, .tar.gz, .tgz or .zip)"
+    )
+    parser.add_argument("-s", "--stream", action="store_true", help="read manifest.json and catalog.json incrementally")
+    parser.add_argument(
+        "-i", "--incremental", action="store_true", help="render only pages whose inputs changed since the last export"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="number of worker processes/threads to render and write pages"
+    )
+    parser.add_argument("-t", "--template_dir", help="dir of custom page templates, e.g. model.md")
+    parser.add_argument(
+        "--strict", action="store_true", help="validate nodes with pydantic models (slower, uses more memory)"
+    )
+    parser.add_argument("--select", help="dbt style node selection, e.g. 'tag:nightly +my_model'")
+    parser.add_argument("-e", "--exclude", help="dbt style node selection to exclude")
+    parser.add_argument("-p", "--profile", help="write time and memory per phase as JSON to this path")
+    parser.add_argument("--pstats", help="write a cProfile dump to this path, read it with pstats")
+    parser.add_argument("--json_backend", help="msgspec, orjson or json (default: fastest installed)")
+    parser.add_argument("--cache_dir", help="dir to cache built nodes between runs on the same inputs")
+    parser.add_argument(
+        "--cache_max_mb", type=int, default=DEFAULT_MAX_BYTES >> 20, help="size limit of the cache dir in MiB"
+    )
+    parser.add_argument(
+        "--search_index", action="store_true", help="write an inverted index of pages as search_index.json"
+    )
+    parser.add_argument(
+        "--index_pages",
+        action="store_true",
+        help="write index.md per package and resource type, and files.json with the size and hash of every file",
+    )
+    parser.add_argument(
+        "--column_table",
+        choices=COLUMN_TABLE_STRATEGIES,
+        default="full",
+        help="column table of wide tables: full, truncate or split",
+    )
+    parser.add_argument(
+        "--max_columns", type=int, default=DEFAULT_MAX_COLUMNS, help="columns per page with truncate or split"
+    )
+    parser.add_argument(
+        "--lineage_diagram",
+        choices=DIAGRAM_FORMATS,
+        help="embed a mermaid or dot lineage diagram in model/source pages",
+    )
+    parser.add_argument(
+        "--lineage_depth", type=int, default=DEFAULT_DEPTH, help="hops upstream and downstream in lineage diagrams"
+    )
+    parser.add_argument(
+        "--lineage_max_degree",
+        type=int,
+        default=DEFAULT_MAX_DEGREE,
+        help="collapse the parents/children of nodes with more of them in lineage diagrams",
+    )
+    parser.add_argument(
+        "-w", "--watch", action="store_true", help="keep running and re-render pages affected by changes of the inputs"
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        help="file with a 'manifest.json catalog.json output_dir' triple per line, exported in one process",
+    )
+    parser.add_argument(
+        "--diff",
+        nargs=2,
+        metavar=("BASE_MANIFEST_JSON", "BASE_CATALOG_JSON"),
+        help="write changelog.md and changelog.json of the changes from these artifacts to -m and -c, without pages",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="render only the i-th of N shards of the pages, e.g. 1/4, balanced by columns and code size",
+    )
+    parser.add_argument(
+        "--merge_shards",
+        action="store_true",
+        help="write index.md of the pages of every shard exported to the output dir",
+    )
+    parser.add_argument(
+        "--multi_project",
+        help="file with a 'name manifest.json catalog.json' per line, exported to one output dir with shared pages",
+    )
+    return parser
+
+
+def read_batch_file(
+    batch_file_path: str | Path, field_names: tuple[str, ...] = ("manifest.json", "catalog.json", "output_dir")
+) -> list[tuple[str, ...]]:
+    """
+    Return the fields of each line, (manifest_json, catalog_json, output_dir) by default.
+    Empty lines and lines starting with # are skipped, and paths with spaces can be quoted.
+    """
+    from shlex import split
+
+    rows = []
+    with open(batch_file_path) as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            fields = split(line)
+            if len(fields) != len(field_names):
+                raise ValueError(f"{batch_file_path}:{line_number}: expected {' '.join(field_names)}")
+            rows.append(tuple(fields))
+    return rows
 
-from data_model import Column, Macro, ManifestData, ParsedJson, SourceData, Test
-from format_parsed_data import (
-    format_macro_data,
-    format_models_data,
-    format_seeds_data,
-    format_source_data,
-    format_test_data,
-    model2filepath,
-)
-
-
-def parse_docs_data(manifest_json_path: str | Path, catalog_json_path: str | Path, output_dir_path: str | Path):
-    with open(manifest_json_path) as f1:
-        manifest_json = load(f1)
-
-    with open(catalog_json_path) as f2:
-        catalog_json = load(f2)
-
-    parsed_json_dict = {
-        "nodes": {},
-        "tests": {},
-        "macros": {},
-        "sources": {},
-        "parent_map": {},
-        "child_map": {},
-    }
-    top_level_key = "nodes"
-    for k, manifest_data in manifest_json[top_level_key].items():
-        # Store basic info of tables to dataclass.
-        if k.startswith("model.") or k.startswith("seed."):
-            catalog_data = catalog_json[top_level_key][k]
-
-            columns = {}
-            for column in catalog_data["columns"].values():
-                column_info_from_manifest = manifest_data["columns"].get(column["name"])
-                if column_info_from_manifest is not None:
-                    description_from_manifest = column_info_from_manifest["description"]
-                else:
-                    description_from_manifest = None
-
-                columns[column["name"]] = Column(
-                    type_=column["type"],
-                    index=column["index"],
-                    name=column["name"],
-                    comment=column["comment"],
-                    description_from_manifest=description_from_manifest,
-                )
-
-            d = ManifestData(
-                name=manifest_data["name"],
-                columns=columns,
-                raw_code=manifest_data["raw_code"],
-                compiled_code=manifest_data["compiled_code"],
-                depends_on=manifest_data["depends_on"]["nodes"],
-                description=manifest_data["description"],
-                language=manifest_data["language"],
-                tags=manifest_data["tags"],
-                owner=catalog_data["metadata"]["owner"],
-                package_name=manifest_data["package_name"],
-                database=manifest_data["database"],
-                schema_=manifest_data["schema"],
-                materialized=manifest_data["config"]["materialized"],
-                resource_type=manifest_data["resource_type"],
-            )
 
-            parsed_json_dict[top_level_key][k] = d
-
-        elif k.startswith("test."):
-            t = Test(
-                name=manifest_data["name"],
-                materialized=manifest_data["config"]["materialized"],
-                column_name=manifest_data["column_name"],
-                refs=manifest_data["refs"][0],
-                depends_on=manifest_data["depends_on"]["nodes"],
-                raw_code=manifest_data["raw_code"],
-                compiled_code=manifest_data["compiled_code"],
-                description=manifest_data["description"],
-                test_metadata_name=manifest_data["test_metadata"]["name"],
+def main():
+    parser = build_argument_parser()
+    args = parser.parse_args()
+    if args.batch is not None and args.multi_project is not None:
+        parser.error("--batch can not be used with --multi_project")
+    if (
+        args.batch is None
+        and args.multi_project is None
+        and not args.merge_shards
+        and (args.manifest_json is None or args.catalog_json is None)
+    ):
+        parser.error(
+            "--manifest_json and --catalog_json are required without --batch, --multi_project or --merge_shards"
+        )
+    if args.watch and (args.batch is not None or args.multi_project is not None):
+        parser.error("--watch can not be used with --batch or --multi_project")
+    if args.multi_project is not None and (
+        args.index_pages or args.search_index or args.incremental or args.stream or args.cache_dir is not None
+    ):
+        parser.error(
+            "--multi_project can not be used with --index_pages, --search_index, --incremental, --stream or --cache_dir"
+        )
+    if args.watch and (
+        args.incremental
+        or args.index_pages
+        or args.stream
+        or args.cache_dir is not None
+        or args.profile is not None
+        or args.pstats is not None
+    ):
+        # watch mode re-renders only affected pages anyway, see watch.py.
+        parser.error(
+            "--watch can not be used with --incremental, --index_pages, --stream, --cache_dir, --profile or --pstats"
+        )
+    if args.watch or args.multi_project is not None:
+        from .output_sink import is_archive_path
+
+        if is_archive_path(args.output_dir):
+            parser.error("--watch and --multi_project write to a dir, not to an archive file")
+    if args.diff is not None and (args.watch or args.batch is not None or args.multi_project is not None):
+        parser.error("--diff can not be used with --watch, --batch or --multi_project")
+    if args.shard is not None and (
+        args.watch or args.incremental or args.diff is not None or args.multi_project is not None
+    ):
+        parser.error("--shard can not be used with --watch, --incremental, --diff or --multi_project")
+
+    if args.merge_shards:
+        from .shard import merge_shards
+
+        print(f"Indexed {merge_shards(args.output_dir)} pages of every shard in {args.output_dir}")
+        return
+
+    select = [args.select] if args.select is not None else None
+    exclude = [args.exclude] if args.exclude is not None else None
+    column_table = ColumnTable(args.column_table, args.max_columns)
+    lineage_diagram = None
+    if args.lineage_diagram is not None:
+        lineage_diagram = LineageDiagram(args.lineage_diagram, args.lineage_depth, args.lineage_max_degree)
+
+    if args.watch:
+        from .watch import watch
+
+        watch(
+            Path(args.manifest_json),
+            Path(args.catalog_json),
+            Path(args.output_dir),
+            jobs=args.jobs,
+            template_dir_path=args.template_dir,
+            strict=args.strict,
+            select=select,
+            exclude=exclude,
+            json_backend=args.json_backend,
+            search_index=args.search_index,
+            column_table=column_table,
+            lineage_diagram=lineage_diagram,
+        )
+        return
+
+    if args.diff is not None:
+        from .diff_report import (
+            CHANGELOG_JSON_FILE_NAME,
+            CHANGELOG_MARKDOWN_FILE_NAME,
+            diff_artifacts,
+            dump_changelog,
+            render_changelog_markdown,
+        )
+        from .output_sink import open_sink
+
+        profiler = Profiler(enabled=args.profile is not None or args.pstats is not None, pstats_path=args.pstats)
+        with profiler:
+            changelog = diff_artifacts(
+                Path(args.diff[0]),
+                Path(args.diff[1]),
+                Path(args.manifest_json),
+                Path(args.catalog_json),
+                strict=args.strict,
+                select=select,
+                exclude=exclude,
+                json_backend=args.json_backend,
+                profiler=profiler,
             )
-            parsed_json_dict["tests"][k] = t
-
-    top_level_key = "macros"
-    for k, manifest_data in manifest_json[top_level_key].items():
-        # TODO: Currently, I cannot find a way to extract referenced_by info from manifest.json and catalog.json
-        if k.startswith("macro.dbt."):
-            # dbt-docs ignores dbt default macro, ignore here too.
-            continue
-        elif k.startswith("macro."):
-            m = Macro(
-                name=manifest_data["name"],
-                depends_on=manifest_data["depends_on"],
-                arguments=manifest_data["arguments"],
-                macro_sql=manifest_data["macro_sql"],
-                description=manifest_data["description"],
-                resource_type=manifest_data["resource_type"],
-                package_name=manifest_data["package_name"],
+            with profiler.phase("write"), open_sink(args.output_dir) as sink:
+                sink.write(Path(CHANGELOG_MARKDOWN_FILE_NAME), render_changelog_markdown(changelog))
+                sink.write(Path(CHANGELOG_JSON_FILE_NAME), dump_changelog(changelog))
+        print(
+            f"Added {len(changelog['added'])}, removed {len(changelog['removed'])}",
+            f"and changed {len(changelog['changed'])} nodes, written to {args.output_dir}",
+        )
+        if args.profile is not None:
+            profiler.write_report(args.profile)
+        return
+
+    if args.multi_project is not None:
+        from .multi_project import Project, export_projects
+
+        rows = read_batch_file(args.multi_project, ("name", "manifest.json", "catalog.json"))
+        projects = [Project(*fields) for fields in rows]
+        profiler = Profiler(enabled=args.profile is not None or args.pstats is not None, pstats_path=args.pstats)
+        with profiler:
+            rendered_count = export_projects(
+                projects,
+                Path(args.output_dir),
+                jobs=args.jobs,
+                template_dir_path=args.template_dir,
+                strict=args.strict,
+                select=select,
+                exclude=exclude,
+                profiler=profiler,
+                json_backend=args.json_backend,
+                column_table=column_table,
+                lineage_diagram=lineage_diagram,
             )
-            parsed_json_dict["macros"][k] = m
-
-    top_level_key = "sources"
-    for k, manifest_data in manifest_json[top_level_key].items():
-        # Store basic info of tables to dataclass.
-        if k.startswith("source."):
-            catalog_data = catalog_json[top_level_key][k]
-
-            columns = {}
-            for column in catalog_data["columns"].values():
-                column_info_from_manifest = manifest_data["columns"].get(column["name"])
-                if column_info_from_manifest is not None:
-                    description_from_manifest = column_info_from_manifest["description"]
-                else:
-                    description_from_manifest = None
-
-                columns[column["name"]] = Column(
-                    type_=column["type"],
-                    index=column["index"],
-                    name=column["name"],
-                    comment=column["comment"],
-                    description_from_manifest=description_from_manifest,
-                )
-
-            d = SourceData(
-                name=manifest_data["name"],
-                columns=columns,
-                description=manifest_data["description"],
-                tags=manifest_data["tags"],
-                owner=catalog_data["metadata"]["owner"],
-                package_name=manifest_data["package_name"],
-                database=manifest_data["database"],
-                schema_=manifest_data["schema"],
-                resource_type=manifest_data["resource_type"],
-                # -- below property exists pnly source node
-                loader=manifest_data["loader"],
-                source_name=manifest_data["source_name"],
+            print(
+                f"Rendered {sum(rendered_count.values())} pages",
+                f"({', '.join(f'{k}: {v}' for k, v in sorted(rendered_count.items()))})",
             )
-
-            parsed_json_dict[top_level_key][k] = d
-
-    parsed_json = ParsedJson(
-        nodes=parsed_json_dict["nodes"],
-        tests=parsed_json_dict["tests"],
-        macros=parsed_json_dict["macros"],
-        sources=parsed_json_dict["sources"],
-        parent_map=manifest_json["parent_map"],
-        child_map=manifest_json["child_map"],
-    )
-
-    for name, macro_data in parsed_json.macros.items():
-        format_macro_data(name=name, macro_data=macro_data, output_dir_path=output_dir_path)
-
-    # TODO: deal with other nodes property analysis, exposure, metric and docs.
-    for parent_node, child_node_list in parsed_json.child_map.items():
-        if (
-            not parent_node.startswith("model.")
-            and not parent_node.startswith("source.")
-            and not parent_node.startswith("seed.")
-        ):
-            continue
-
-        referenced_by = {"models": [], "tests": []}
-        for child_node in child_node_list:
-            if child_node.startswith("model.") or child_node.startswith("seed."):
-                referenced_by["models"].append(child_node)
-            elif child_node.startswith("test."):
-                target_col_name = parsed_json.tests[child_node].column_name
-                if target_col_name is None:
-                    continue
-
-                # TODO: Refactor. This is too complex to understand what is doing here.
-                #       This process is "Store relationship between tests and tables".
-                if parent_node.startswith("model."):
-                    parsed_json.nodes[parent_node].columns[target_col_name].test.add(
-                        parsed_json.tests[child_node].test_metadata_name
-                    )
-                elif parent_node.startswith("source."):
-                    parsed_json.sources[parent_node].columns[target_col_name].test.add(
-                        parsed_json.tests[child_node].test_metadata_name
-                    )
-
-                # remove test id at the end of child_node name
-                test_name_removed_test_id = ".".join(child_node.split(".")[:-1])
-                format_test_data(
-                    test_name_removed_test_id, parsed_json.tests[child_node], output_dir_path=output_dir_path
-                )
-                referenced_by["tests"].append(test_name_removed_test_id)
-
-        # format reference info
-        for reference_by_key in referenced_by.keys():
-            referenced_by[reference_by_key] = (
-                "<br>".join(model2filepath(referenced_by[reference_by_key]))
-                if len(referenced_by[reference_by_key]) > 0
-                else "&nbsp;"
+        if args.profile is not None:
+            profiler.write_report(args.profile)
+        return
+
+    if args.batch is not None:
+        triples = read_batch_file(args.batch)
+    else:
+        triples = [(args.manifest_json, args.catalog_json, args.output_dir)]
+
+    cache = None
+    if args.cache_dir is not None:
+        from .cache import ParsedJsonCache
+
+        cache = ParsedJsonCache(args.cache_dir, max_bytes=args.cache_max_mb << 20)
+
+    # with --batch, the profile covers every export.
+    profiler = Profiler(enabled=args.profile is not None or args.pstats is not None, pstats_path=args.pstats)
+    with profiler:
+        for manifest_json, catalog_json, output_dir in triples:
+            rendered_count = parse_docs_data(
+                Path(manifest_json),
+                Path(catalog_json),
+                Path(output_dir),
+                stream=args.stream,
+                incremental=args.incremental,
+                jobs=args.jobs,
+                template_dir_path=args.template_dir,
+                strict=args.strict,
+                select=select,
+                exclude=exclude,
+                profiler=profiler,
+                json_backend=args.json_backend,
+                cache=cache,
+                search_index=args.search_index,
+                column_table=column_table,
+                lineage_diagram=lineage_diagram,
+                shard=args.shard,
+                index_pages=args.index_pages,
             )
-
-        if parent_node.startswith("model."):
-            node_data = parsed_json.nodes[parent_node]
-            format_models_data(parent_node, node_data, referenced_by, output_dir_path)
-        if parent_node.startswith("seed."):
-            node_data = parsed_json.nodes[parent_node]
-            format_seeds_data(parent_node, node_data, referenced_by, output_dir_path)
-        if parent_node.startswith("source."):
-            node_data = parsed_json.sources[parent_node]
-            format_source_data(parent_node, node_data, referenced_by, output_dir_path)
-
-
-def main():
-    from argparse import ArgumentParser
-
-    from pydantic import BaseModel, Field
-
-    # This argments implementation is referenced by
-    # https://qiita.com/ShotaOki/items/c777d600b2f854d30241
-    class Argments(BaseModel):
-        manifest_json: str
-        catalog_json: str
-        output_dir: str = "output"
-
-        @classmethod
-        def parse_args(cls):
-            parser = ArgumentParser()
-            for k in cls.schema()["properties"].keys():
-                parser.add_argument(f"-{k[0:1]}", f"--{k}")
-            _args = {k: v for k, v in parser.parse_args().__dict__.items() if v is not None}
-            return cls.parse_obj(_args)
-
-    args = Argments.parse_args()
-    manifest_json_path = Path(args.manifest_json)
-    catalog_json_path = Path(args.catalog_json)
-    output_dir_path = Path(args.output_dir)
-
-    output_dir_path.mkdir(exist_ok=True, parents=True)
-
-    parse_docs_data(manifest_json_path, catalog_json_path, output_dir_path)
+            print(
+                f"Rendered {sum(rendered_count.values())} pages",
+                f"({', '.join(f'{k}: {v}' for k, v in sorted(rendered_count.items()))})",
+                *([f"of shard {args.shard}"] if args.shard is not None else []),
+                *([f"to {output_dir}"] if args.batch is not None else []),
+            )
+    if args.profile is not None:
+        profiler.write_report(args.profile)
 
 
 if __name__ == "__main__":
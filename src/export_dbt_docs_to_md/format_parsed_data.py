@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+from itertools import islice
 from pathlib import Path
 from re import M, sub
 from textwrap import dedent
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Union
+
+from .column_table import FULL_COLUMN_TABLE, ColumnTable, column_sidecars, select_list
+from .templates import DEFAULT_TEMPLATES, PageTemplate
 
-from data_model import Column, Macro, ManifestData, SourceData, Test
+if TYPE_CHECKING:
+    from .data_model import Column, Macro, ManifestData, SourceData, Test
 
 
 def model2filepath(data_model_list: list[str]) -> list[str]:
@@ -17,67 +25,108 @@ def model2filepath(data_model_list: list[str]) -> list[str]:
     return [i.replace(".", "/") for i in data_model_list]
 
 
-def format_column_info(column_info_list: list[Column]):
-    formatted_str = ""
-    for column_info in column_info_list.values():
-        formatted_str += dedent("| {name} | {type_} | {description} | {test} |\n").format(
-            name=column_info.name,
-            type_=column_info.type_,
-            description=column_info.description_from_manifest
-            if column_info.description_from_manifest is not None and column_info.description_from_manifest != ""
-            else "&nbsp;",
-            test="<br>".join(column_info.test) if len(column_info.test) > 0 else "&nbsp;",
-        )
-    return formatted_str
+class Page(NamedTuple):
+    """
+    page to be rendered. resource_type is one of model, seed, source, test and macro.
+    file_path is relative to the output root.
+    """
 
+    node_id: str
+    resource_type: str
+    node_data: Union[ManifestData, SourceData, Test, Macro]
+    referenced_by: Optional[dict[str, str]]
+    file_path: Path
+    # transitive upstream/downstream of model pages, and the lineage diagram of model and source pages
+    lineage: Optional[dict[str, str]] = None
 
-# TODO: separate nodes and source function because nodes and source docs are slightly different format.
-def format_models_data(
-    name: str, manifest_data: ManifestData, referenced_by: dict[str, str], output_dir_path: str | Path
+
+def format_lineage_diagram(lineage: Optional[dict[str, str]]) -> str:
+    """
+    lineage diagram of a page surrounded by empty lines, or an empty string without a diagram
+    """
+    diagram = lineage.get("diagram", "") if lineage is not None else ""
+    return f"\n{diagram}\n" if diagram else ""
+
+
+def format_node_list(node_list: list[str]) -> str:
+    """
+    format node ids as <br> joined file paths for a markdown table cell
+    """
+    return "<br>".join(model2filepath(node_list)) if len(node_list) > 0 else "&nbsp;"
+
+
+def page_filepath(name: str, sub_dir_name: str, output_dir_path: str | Path) -> Path:
+    """
+    file path of the page of node `name`, e.g. output_dir/<package>/model/<package>/<model>.md
+    """
+    return Path(output_dir_path) / sub_dir_name / f"{model2filepath([name])[0]}.md"
+
+
+def _format_column_rows(columns: Iterable[Column], template: PageTemplate) -> str:
+    return "".join(
+        [
+            template.render(
+                name=column_info.name,
+                type_=column_info.type_,
+                description=column_info.description_from_manifest
+                if column_info.description_from_manifest is not None and column_info.description_from_manifest != ""
+                else "&nbsp;",
+                test="<br>".join(sorted(column_info.test)) if len(column_info.test) > 0 else "&nbsp;",
+            )
+            for column_info in columns
+        ]
+    )
+
+
+def format_column_info(
+    column_info_list: dict[str, Column], template: PageTemplate = DEFAULT_TEMPLATES["column_row"]
 ) -> str:
-    markdown_str = dedent(
-        """
-    # {table_name}
-    {materialized}
-
-    ## Details
-    | TAGS   | OWNER   | TYPE    | PACKAGE   | LANGUAGE   | RELATION   |
-    | ---    | ---     | ---     | ---       | ---        | ---        |
-    | {tags} | {owner} | {type_} | {package} | {language} | {relation} |
-
-    ## Description
-    {description}
-
-    ## Columns
-    | COLUMN | TYPE | DESCRIPTION | TESTS |
-    | ---    | ---  | ---         | ---   |
-    {formatted_column_info}
-
-    ## Referenced By
-    | Models                 | Tests                 |
-    | ---                    | ---                   |
-    | {referenced_by_models} | {referenced_by_tests} |
-
-    ## Depends On
-    | Models |
-    | ---    |
-    | {depends_on} |
-
-    ## Code
-    ### Source
-    ```sql
-    {raw_code}
-    ```
-    ### Compiled
-    ```sql
-    {compiled_code}
-    ```
+    return _format_column_rows(column_info_list.values(), template)
+
+
+def format_column_table(
+    column_info_list: dict[str, Column],
+    templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+    file_path: Optional[Path] = None,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
+) -> str:
+    """
+    rows of the column table of the page at file_path, capped at column_table.max_columns with a row linking
+    to the sidecar files of the other columns.
     """
-    ).format(
+    n_columns = len(column_info_list)
+    if file_path is None or not column_table.is_capped(n_columns):
+        return format_column_info(column_info_list, templates["column_row"])
+
+    links = [
+        f"[{sidecar.file_path.name}]({sidecar.file_path.name})"
+        for sidecar in column_sidecars(file_path, n_columns, column_table)
+    ]
+    overflow_row = templates["column_row"].render(
+        name="&hellip;",
+        type_="&nbsp;",
+        description=f"{n_columns - column_table.max_columns} more columns, see {', '.join(links)}",
+        test="&nbsp;",
+    )
+    shown = islice(column_info_list.values(), column_table.max_columns)
+    return _format_column_rows(shown, templates["column_row"]) + overflow_row
+
+
+# TODO: separate nodes and source function because nodes and source docs are slightly different format.
+def render_models_data(
+    manifest_data: ManifestData,
+    referenced_by: dict[str, str],
+    templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+    lineage: Optional[dict[str, str]] = None,
+    file_path: Optional[Path] = None,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
+) -> str:
+    lineage = lineage if lineage is not None else {"upstream": "&nbsp;", "downstream": "&nbsp;"}
+    return templates["model"].render(
         table_name=manifest_data.name,
         materialized=manifest_data.materialized,
         tags=manifest_data.tags if len(manifest_data.tags) > 0 else "untagged",
-        owner=manifest_data.owner,
+        owner=manifest_data.owner if manifest_data.owner is not None and manifest_data.owner != "" else "&nbsp;",
         type_=manifest_data.materialized,
         package=manifest_data.package_name,
         language=manifest_data.language,
@@ -85,55 +134,30 @@ def format_models_data(
         description=manifest_data.description
         if manifest_data.description is not None and manifest_data.description != ""
         else "This source is not currently documented",
-        formatted_column_info=format_column_info(manifest_data.columns),
+        formatted_column_info=format_column_table(manifest_data.columns, templates, file_path, column_table),
         referenced_by_models=referenced_by["models"],
         referenced_by_tests=referenced_by["tests"],
         depends_on="<br>".join(model2filepath(manifest_data.depends_on)),
+        upstream=lineage["upstream"],
+        downstream=lineage["downstream"],
+        lineage_diagram=format_lineage_diagram(lineage),
         raw_code=manifest_data.raw_code,
         compiled_code=sub(r"^\n", "", manifest_data.compiled_code.strip(), flags=M),
     )
 
-    output_dir_path = output_dir_path / manifest_data.package_name
-    file_path = output_dir_path / f"{model2filepath([name])[0]}.md"
-    file_path.parent.mkdir(exist_ok=True, parents=True)
-    with open(file_path, mode="w") as f:
-        f.write(markdown_str)
 
-
-def format_seeds_data(
-    name: str, manifest_data: ManifestData, referenced_by: dict[str, str], output_dir_path: str | Path
+def render_seeds_data(
+    manifest_data: ManifestData,
+    referenced_by: dict[str, str],
+    templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+    file_path: Optional[Path] = None,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
 ) -> str:
-    markdown_str = dedent(
-        """
-    # {table_name}
-    {materialized}
-
-    ## Details
-    | TAGS   | OWNER   | TYPE    | PACKAGE   | LANGUAGE   | RELATION   |
-    | ---    | ---     | ---     | ---       | ---        | ---        |
-    | {tags} | {owner} | {type_} | {package} | {language} | {relation} |
-
-    ## Description
-    {description}
-
-    ## Columns
-    | COLUMN | TYPE | DESCRIPTION | TESTS |
-    | ---    | ---  | ---         | ---   |
-    {formatted_column_info}
-
-    ## Code
-    ### Example SQL
-    ```sql
-    select
-        {columns}
-    from {database}.{schema}.{table_name}
-    ```
-    """
-    ).format(
+    return templates["seed"].render(
         table_name=manifest_data.name,
         materialized=manifest_data.materialized,
         tags=manifest_data.tags if len(manifest_data.tags) > 0 else "untagged",
-        owner=manifest_data.owner,
+        owner=manifest_data.owner if manifest_data.owner is not None and manifest_data.owner != "" else "&nbsp;",
         type_=manifest_data.materialized,
         package=manifest_data.package_name,
         language=manifest_data.language,
@@ -141,58 +165,26 @@ def format_seeds_data(
         description=manifest_data.description
         if manifest_data.description is not None and manifest_data.description != ""
         else "This seed is not currently documented",
-        formatted_column_info=format_column_info(manifest_data.columns),
-        columns=",\n    ".join([col for col in manifest_data.columns.keys()]),
+        formatted_column_info=format_column_table(manifest_data.columns, templates, file_path, column_table),
+        columns=select_list(list(manifest_data.columns.keys()), column_table),
         database=manifest_data.database,
         schema=manifest_data.schema_,
     )
 
-    output_dir_path = output_dir_path / manifest_data.package_name
-    file_path = output_dir_path / f"{model2filepath([name])[0]}.md"
-    file_path.parent.mkdir(exist_ok=True, parents=True)
-    with open(file_path, mode="w") as f:
-        f.write(markdown_str)
-
 
-def format_source_data(
-    name: str, source_data: SourceData, referenced_by: dict[str, str], output_dir_path: str | Path
+def render_source_data(
+    source_data: SourceData,
+    referenced_by: dict[str, str],
+    templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+    file_path: Optional[Path] = None,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
+    lineage: Optional[dict[str, str]] = None,
 ) -> str:
-    markdown_str = dedent(
-        """
-    # {table_name}
-    {resource_type} table
-
-    ## Details
-    | TAGS   | OWNER   | TYPE  | PACKAGE   | RELATION   | LOADER   | SOURCE        |
-    | ---    | ---     | ---   | ---       | ---        | ---      | ---           |
-    | {tags} | {owner} | table | {package} | {relation} | {loader} | {source_name} |
-
-    ## Description
-    {description}
-
-    ## Columns
-    | COLUMN | TYPE | DESCRIPTION | TESTS |
-    | ---    | ---  | ---         | ---   |
-    {formatted_column_info}
-
-    ## Referenced By
-    | Models                 | Tests                 |
-    | ---                    | ---                   |
-    | {referenced_by_models} | {referenced_by_tests} |
-
-    ## Code
-    ### Sample SQL
-    ```sql
-    select
-        {columns}
-    from {database}.{schema}.{table_name}
-    ```
-    """
-    ).format(
+    return templates["source"].render(
         table_name=source_data.name,
         resource_type=source_data.resource_type,
         tags=source_data.tags if len(source_data.tags) > 0 else "untagged",
-        owner=source_data.owner,
+        owner=source_data.owner if source_data.owner is not None and source_data.owner != "" else "&nbsp;",
         # type_=source_data.resource_type, # there is no info that is table or view or sth...
         package=source_data.package_name,
         relation=source_data.name,
@@ -201,46 +193,20 @@ def format_source_data(
         description=source_data.description
         if source_data.description is not None and source_data.description != ""
         else "This source is not currently documented",
-        formatted_column_info=format_column_info(source_data.columns),
+        formatted_column_info=format_column_table(source_data.columns, templates, file_path, column_table),
         referenced_by_models=referenced_by["models"],
         referenced_by_tests=referenced_by["tests"],
-        columns=",\n    ".join([col for col in source_data.columns.keys()]),
+        lineage_diagram=format_lineage_diagram(lineage),
+        columns=select_list(list(source_data.columns.keys()), column_table),
         database=source_data.database,
         schema=source_data.schema_,
     )
 
-    output_dir_path = output_dir_path / source_data.package_name
-    file_path = output_dir_path / f"{model2filepath([name])[0]}.md"
-    file_path.parent.mkdir(exist_ok=True, parents=True)
-    with open(file_path, mode="w") as f:
-        f.write(markdown_str)
-
-
-def format_test_data(name: str, test_data: Test, output_dir_path: str | Path) -> str:
-    markdown_str = dedent(
-        """
-    # {test_name}
-    {materialized}
-
-    ## Description
-    {description}
-
-    ## Depends On
-    | Models |
-    | ---    |
-    | {depends_on} |
-
-    ## Code
-    ### Source
-    ```sql
-    {raw_code}
-    ```
-    ### Compiled
-    ```sql
-    {compiled_code}
-    ```
-    """
-    ).format(
+
+def render_test_data(
+    test_data: Test, templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES
+) -> str:
+    return templates["test"].render(
         test_name=test_data.name,
         materialized=test_data.materialized,
         description=test_data.description
@@ -251,42 +217,14 @@ def format_test_data(name: str, test_data: Test, output_dir_path: str | Path) ->
         compiled_code=sub(r"^\n", "", test_data.compiled_code.strip(), flags=M),
     )
 
-    output_dir_path = output_dir_path / "tests"
-    file_path = output_dir_path / f"{model2filepath([name])[0]}.md"
-    file_path.parent.mkdir(exist_ok=True, parents=True)
-    with open(file_path, mode="w") as f:
-        f.write(markdown_str)
-
-
-def format_macro_data(name: str, macro_data: Macro, output_dir_path: str | Path) -> str:
-    markdown_str = dedent(
-        """
-    # {macro_name}
-    {resource_type}
-
-    ## Description
-    {description}
-
-    ## Arguments
-    {arguments}
-
-    ## Referenced By
-    | Models |
-    | ---    |
-    | {referenced_by} |
 
-    ## Depends On
-    | Models              | Macros              |
-    | ---                 | ---                 |
-    | {depends_on_models} | {depends_on_macros} |
-
-    ## Code
-    ### Source
-    ```sql
-    {macro_sql}
-    ```
-    """
-    ).format(
+def render_macro_data(
+    macro_data: Macro,
+    templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+    referenced_by: Optional[dict[str, str]] = None,
+) -> str:
+    referenced_by = referenced_by if referenced_by is not None else {"models": "&nbsp;", "macros": "&nbsp;"}
+    return templates["macro"].render(
         macro_name=macro_data.name,
         resource_type=macro_data.resource_type,
         description=macro_data.description
@@ -295,15 +233,106 @@ def format_macro_data(name: str, macro_data: Macro, output_dir_path: str | Path)
         arguments=macro_data.arguments
         if macro_data.arguments is None and macro_data.arguments != ""
         else "Details are not available for this macro",
-        # referenced_by="<br>".join(model2filepath(macro_data.referenced_by)),
-        referenced_by="&nbsp;",
+        referenced_by=referenced_by["models"],
+        referenced_by_macros=referenced_by["macros"],
         depends_on_models="<br>".join(model2filepath(macro_data.depends_on.get("models", ["&nbsp;"]))),
         depends_on_macros="<br>".join(model2filepath(macro_data.depends_on.get("macros", ["&nbsp;"]))),
         macro_sql=dedent(macro_data.macro_sql),
     )
 
-    output_dir_path = output_dir_path / macro_data.package_name
-    file_path = output_dir_path / f"{model2filepath([name])[0]}.md"
-    file_path.parent.mkdir(exist_ok=True, parents=True)
-    with open(file_path, mode="w") as f:
-        f.write(markdown_str)
+
+def render_page(
+    page: Page, templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES, column_table: ColumnTable = FULL_COLUMN_TABLE
+) -> str:
+    if page.resource_type == "model":
+        return render_models_data(
+            page.node_data, page.referenced_by, templates, page.lineage, page.file_path, column_table
+        )
+    if page.resource_type == "seed":
+        return render_seeds_data(page.node_data, page.referenced_by, templates, page.file_path, column_table)
+    if page.resource_type == "source":
+        return render_source_data(
+            page.node_data, page.referenced_by, templates, page.file_path, column_table, page.lineage
+        )
+    if page.resource_type == "test":
+        return render_test_data(page.node_data, templates)
+    if page.resource_type == "macro":
+        return render_macro_data(page.node_data, templates, page.referenced_by)
+    raise ValueError(f"Invalid resource_type: {page.resource_type}")
+
+
+def page_sidecar_paths(page: Page, column_table: ColumnTable = FULL_COLUMN_TABLE) -> list[Path]:
+    if page.resource_type not in ("model", "seed", "source"):
+        return []
+    return [sidecar.file_path for sidecar in column_sidecars(page.file_path, len(page.node_data.columns), column_table)]
+
+
+def render_page_files(
+    page: Page, templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES, column_table: ColumnTable = FULL_COLUMN_TABLE
+) -> list[tuple[Path, str]]:
+    """
+    Return (file_path, markdown) of the page and of its column sidecar files, the page first.
+    """
+    files = [(page.file_path, render_page(page, templates, column_table))]
+    if page.resource_type not in ("model", "seed", "source"):
+        return files
+
+    columns = list(page.node_data.columns.values())
+    for sidecar in column_sidecars(page.file_path, len(columns), column_table):
+        markdown_str = templates["column_page"].render(
+            table_name=page.node_data.name,
+            first_column=sidecar.start + 1,
+            last_column=sidecar.stop,
+            n_columns=len(columns),
+            page=page.file_path.name,
+            formatted_column_info=_format_column_rows(columns[sidecar.start : sidecar.stop], templates["column_row"]),
+        )
+        files.append((sidecar.file_path, markdown_str))
+    return files
+
+
+def write_page_files(page: Page, output_dir_path: str | Path) -> Path:
+    """
+    Render the page and its column sidecar files into output_dir_path, and return the file path of the page.
+    This writes one page at a time, use parallel_render.write_pages() to write many pages.
+    """
+    from .output_sink import DirectorySink
+
+    with DirectorySink(output_dir_path) as sink:
+        for file_path, markdown_str in render_page_files(page):
+            sink.write(file_path, markdown_str)
+    return Path(output_dir_path) / page.file_path
+
+
+# the format_*_data functions write a single page with the default templates, see write_page_files().
+def format_models_data(
+    name: str, manifest_data: ManifestData, referenced_by: dict[str, str], output_dir_path: str | Path
+) -> Path:
+    file_path = page_filepath(name, manifest_data.package_name, Path())
+    return write_page_files(Page(name, "model", manifest_data, referenced_by, file_path), output_dir_path)
+
+
+def format_seeds_data(
+    name: str, manifest_data: ManifestData, referenced_by: dict[str, str], output_dir_path: str | Path
+) -> Path:
+    file_path = page_filepath(name, manifest_data.package_name, Path())
+    return write_page_files(Page(name, "seed", manifest_data, referenced_by, file_path), output_dir_path)
+
+
+def format_source_data(
+    name: str, source_data: SourceData, referenced_by: dict[str, str], output_dir_path: str | Path
+) -> Path:
+    file_path = page_filepath(name, source_data.package_name, Path())
+    return write_page_files(Page(name, "source", source_data, referenced_by, file_path), output_dir_path)
+
+
+def format_test_data(name: str, test_data: Test, output_dir_path: str | Path) -> Path:
+    file_path = page_filepath(name, "tests", Path())
+    return write_page_files(Page(name, "test", test_data, None, file_path), output_dir_path)
+
+
+def format_macro_data(
+    name: str, macro_data: Macro, output_dir_path: str | Path, referenced_by: Optional[dict[str, str]] = None
+) -> Path:
+    file_path = page_filepath(name, macro_data.package_name, Path())
+    return write_page_files(Page(name, "macro", macro_data, referenced_by, file_path), output_dir_path)
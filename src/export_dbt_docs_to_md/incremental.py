@@ -0,0 +1,129 @@
+"""
+Persisted export state for incremental export.
+
+The state file in the output dir holds a content hash and the written page path (and column sidecar paths) per node.
+A page is rendered again only when the hash of its inputs changed or the page file is gone,
+and pages of nodes which no longer exist are pruned.
+"""
+
+from dataclasses import fields, is_dataclass
+from hashlib import sha256
+from json import dump, dumps, load
+from pathlib import Path
+from sys import modules
+from typing import Any, Iterable, Optional
+
+STATE_FILE_NAME = ".export_dbt_docs_to_md_state.json"
+# bump this when the page layout changes so that every page is rendered again.
+STATE_VERSION = 3
+
+
+def _default(obj: Any):
+    # a pydantic model (--strict) exists only if pydantic is already imported.
+    pydantic = modules.get("pydantic")
+    if pydantic is not None and isinstance(obj, pydantic.BaseModel):
+        return obj.dict()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, (set, frozenset)):
+        # set order differs between processes, sort it to get a stable hash.
+        return sorted(obj)
+    raise TypeError(f"Invalid type: {type(obj)}")
+
+
+def node_hash(*inputs: Any) -> str:
+    """
+    content hash of page inputs, e.g. the node itself (manifest and catalog entry) and its referenced_by.
+    """
+    return sha256(dumps(inputs, sort_keys=True, default=_default).encode()).hexdigest()
+
+
+class ExportState:
+    def __init__(self, output_dir_path: str | Path, enabled: bool = True):
+        self.output_dir_path = Path(output_dir_path)
+        self.enabled = enabled
+        self.pages: dict[str, dict[str, str]] = {}
+        self._seen: set[str] = set()
+        self.rendered_count = 0
+        self.skipped_count = 0
+
+    @property
+    def state_file_path(self) -> Path:
+        return self.output_dir_path / STATE_FILE_NAME
+
+    @classmethod
+    def load(cls, output_dir_path: str | Path, enabled: bool = True) -> "ExportState":
+        state = cls(output_dir_path, enabled=enabled)
+        if not enabled or not state.state_file_path.exists():
+            return state
+
+        with open(state.state_file_path) as f:
+            state_json = load(f)
+        if state_json.get("version") == STATE_VERSION:
+            state.pages = state_json["pages"]
+        return state
+
+    def digest(self, *inputs: Any) -> Optional[str]:
+        if not self.enabled:
+            return None
+        return node_hash(*inputs)
+
+    def is_changed(self, node_id: str, digest: Optional[str]) -> bool:
+        """
+        Return True if the page of node_id has to be rendered.
+        """
+        if not self.enabled:
+            return True
+
+        already_seen = node_id in self._seen
+        self._seen.add(node_id)
+        page = self.pages.get(node_id)
+        if page is not None and page["hash"] == digest and (self.output_dir_path / page["path"]).exists():
+            if not already_seen:
+                self.skipped_count += 1
+            return False
+        return True
+
+    def update(self, node_id: str, digest: Optional[str], file_path: Path, sidecar_paths: Iterable[Path] = ()):
+        """
+        file_path and sidecar_paths (column sidecar files of the page) are relative to the output dir.
+        Sidecar files which the page had before but no longer has are removed.
+        """
+        self.rendered_count += 1
+        if not self.enabled:
+            return
+        sidecars = [Path(sidecar_path).as_posix() for sidecar_path in sidecar_paths]
+        old_page = self.pages.get(node_id)
+        if old_page is not None:
+            for stale_path in set(old_page.get("sidecars", [])) - set(sidecars):
+                (self.output_dir_path / stale_path).unlink(missing_ok=True)
+        self.pages[node_id] = {"hash": digest, "path": Path(file_path).as_posix()}
+        if sidecars:
+            self.pages[node_id]["sidecars"] = sidecars
+
+    def prune(self) -> list[Path]:
+        """
+        Remove pages of nodes which were not seen in this export.
+        """
+        if not self.enabled:
+            return []
+
+        removed = []
+        removed_pages = [self.pages.pop(node_id) for node_id in set(self.pages.keys()) - self._seen]
+        # e.g. a test whose id changed but whose page name did not, keeps its page.
+        live_paths = {path for page in self.pages.values() for path in (page["path"], *page.get("sidecars", []))}
+        for page in removed_pages:
+            for file_path in (page["path"], *page.get("sidecars", [])):
+                if file_path in live_paths:
+                    continue
+                file_path = self.output_dir_path / file_path
+                if file_path.exists():
+                    file_path.unlink()
+                    removed.append(file_path)
+        return removed
+
+    def save(self):
+        if not self.enabled:
+            return
+        with open(self.state_file_path, mode="w") as f:
+            dump({"version": STATE_VERSION, "pages": self.pages}, f, indent=1, sort_keys=True)
@@ -0,0 +1,42 @@
+"""
+Join manifest.json nodes with their catalog.json entries.
+
+catalog.json has no entry for nodes which are not materialized in the warehouse, e.g. ephemeral models
+or models which failed to build. Such nodes are built from manifest.json only (columns documented in manifest.json,
+no owner), and are reported once per export instead of aborting it with a KeyError.
+"""
+
+from typing import Any, Optional
+from warnings import warn
+
+# number of unmatched node ids shown in the warning
+MAX_REPORTED_NODES = 5
+
+
+class CatalogIndex:
+    """
+    catalog.json entries of models, seeds and sources by unique_id, built in one pass over the catalog.
+    """
+
+    def __init__(self, catalog_json: Any):
+        self.entries: dict[str, Any] = {}
+        for top_level_key in ("nodes", "sources"):
+            self.entries.update(catalog_json.get(top_level_key) or {})
+        self.unmatched: list[str] = []
+
+    def get(self, node_id: str) -> Optional[Any]:
+        """
+        Return the catalog entry of node_id, or None if catalog.json has none.
+        """
+        catalog_data = self.entries.get(node_id)
+        if catalog_data is None:
+            self.unmatched.append(node_id)
+        return catalog_data
+
+    def report_unmatched(self):
+        if not self.unmatched:
+            return
+        shown = ", ".join(self.unmatched[:MAX_REPORTED_NODES])
+        if len(self.unmatched) > MAX_REPORTED_NODES:
+            shown += f" and {len(self.unmatched) - MAX_REPORTED_NODES} more"
+        warn(f"{len(self.unmatched)} nodes are not in catalog.json, built from manifest.json: {shown}", stacklevel=3)
@@ -0,0 +1,81 @@
+"""
+Decode manifest.json and catalog.json with the fastest installed JSON library.
+
+msgspec and orjson decode straight from a memory-mapped file, so the raw bytes are not copied into a str first.
+With msgspec the documents are decoded into the structs of msgspec_data_model.py,
+and fields the exporter does not read are skipped without building dicts for them.
+The stdlib json module is the fallback.
+"""
+
+from importlib.util import find_spec
+from json import load
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import Any, Optional
+
+JSON_BACKENDS = ("msgspec", "orjson", "json")
+
+
+def default_backend() -> str:
+    for backend in JSON_BACKENDS:
+        if backend == "json" or find_spec(backend) is not None:
+            return backend
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    if backend is None:
+        return default_backend()
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Invalid json backend: {backend}. Supported backends are {', '.join(JSON_BACKENDS)}")
+    if backend != "json" and find_spec(backend) is None:
+        raise ValueError(f"json backend {backend} is not installed")
+    return backend
+
+
+def _decode_mapped(json_path: str | Path, decode) -> Any:
+    with open(json_path, mode="rb") as f:
+        try:
+            mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # an empty file cannot be mapped, let the decoder raise its error.
+            return decode(f.read())
+        with mapped, memoryview(mapped) as buf:
+            return decode(buf)
+
+
+def load_json(json_path: str | Path, backend: Optional[str] = None, struct_type: Optional[type] = None) -> Any:
+    """
+    decode a JSON file. With the msgspec backend, `struct_type` is the struct to decode into.
+    """
+    backend = resolve_backend(backend)
+    if backend == "msgspec":
+        from msgspec.json import Decoder
+
+        decoder = Decoder() if struct_type is None else Decoder(struct_type)
+        return _decode_mapped(json_path, decoder.decode)
+    if backend == "orjson":
+        from orjson import loads
+
+        return _decode_mapped(json_path, loads)
+
+    with open(json_path) as f:
+        return load(f)
+
+
+def load_manifest_and_catalog(
+    manifest_json_path: str | Path, catalog_json_path: str | Path, backend: Optional[str] = None
+) -> tuple[Any, Any]:
+    """
+    Return manifest.json and catalog.json as dicts, or as msgspec structs with the msgspec backend.
+    Entries of both are read with `entry["key"]` and `entry.get("key")`.
+    """
+    backend = resolve_backend(backend)
+    manifest_type = catalog_type = None
+    if backend == "msgspec":
+        from .msgspec_data_model import Catalog, Manifest
+
+        manifest_type, catalog_type = Manifest, Catalog
+    return (
+        load_json(manifest_json_path, backend, struct_type=manifest_type),
+        load_json(catalog_json_path, backend, struct_type=catalog_type),
+    )
@@ -0,0 +1,164 @@
+"""
+Lineage index over child_map and macro dependencies.
+
+Node ids are mapped to integers once and edges are stored as compressed adjacency arrays
+(offsets + targets), so that a direct lookup is a slice and a transitive
+upstream/downstream query is a single BFS, linear in the visited subgraph.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .data_model import ParsedJson
+
+
+TABLE_RESOURCE_TYPES = ("model", "seed", "source")
+
+
+def _build_adjacency(n_nodes: int, edges: list[tuple[int, int]]) -> tuple[array, array]:
+    offsets = array("l", [0] * (n_nodes + 1))
+    for src, _ in edges:
+        offsets[src + 1] += 1
+    for i in range(n_nodes):
+        offsets[i + 1] += offsets[i]
+
+    targets = array("l", [0] * len(edges))
+    cursor = array("l", offsets[:-1])
+    for src, dst in edges:
+        targets[cursor[src]] = dst
+        cursor[src] += 1
+    return offsets, targets
+
+
+class LineageIndex:
+    def __init__(self, node_ids: Iterable[str], edges: Iterable[tuple[str, str]]):
+        """
+        edges are (parent, child) pairs of node ids.
+        """
+        self.node_ids: list[str] = []
+        self.ids: dict[str, int] = {}
+        for node_id in node_ids:
+            self._add_node(node_id)
+
+        edge_ids = []
+        seen_edges = set()
+        for parent, child in edges:
+            edge = (self._add_node(parent), self._add_node(child))
+            if edge not in seen_edges:
+                seen_edges.add(edge)
+                edge_ids.append(edge)
+
+        self.resource_types = [node_id.split(".")[0] for node_id in self.node_ids]
+        n_nodes = len(self.node_ids)
+        self._child_offsets, self._child_targets = _build_adjacency(n_nodes, edge_ids)
+        self._parent_offsets, self._parent_targets = _build_adjacency(n_nodes, [(c, p) for p, c in edge_ids])
+
+    def _add_node(self, node_id: str) -> int:
+        i = self.ids.get(node_id)
+        if i is None:
+            i = self.ids[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+        return i
+
+    @classmethod
+    def from_parsed_json(cls, parsed_json: ParsedJson) -> "LineageIndex":
+        """
+        edges from child_map, models/seeds -> macros they use, and macros -> macros they use.
+        """
+
+        def edges():
+            for parent_node, child_node_list in parsed_json.child_map.items():
+                for child_node in child_node_list:
+                    yield parent_node, child_node
+            for node_id, node_data in parsed_json.nodes.items():
+                for macro_id in node_data.depends_on_macros:
+                    yield macro_id, node_id
+            for macro_id, macro_data in parsed_json.macros.items():
+                for depends_on_macro_id in macro_data.depends_on.get("macros", []):
+                    yield depends_on_macro_id, macro_id
+
+        return cls(parsed_json.child_map.keys(), edges())
+
+    def _neighbors(self, offsets: array, targets: array, i: int) -> array:
+        return targets[offsets[i] : offsets[i + 1]]
+
+    def children(self, node_id: str) -> list[str]:
+        i = self.ids.get(node_id)
+        if i is None:
+            return []
+        return [self.node_ids[j] for j in self._neighbors(self._child_offsets, self._child_targets, i)]
+
+    def parents(self, node_id: str) -> list[str]:
+        i = self.ids.get(node_id)
+        if i is None:
+            return []
+        return [self.node_ids[j] for j in self._neighbors(self._parent_offsets, self._parent_targets, i)]
+
+    def _traverse(
+        self,
+        offsets: array,
+        targets: array,
+        node_ids: Iterable[str],
+        resource_types: Optional[tuple[str, ...]],
+        depth: Optional[int],
+    ) -> list[str]:
+        starts = [self.ids[node_id] for node_id in node_ids if node_id in self.ids]
+        visited = bytearray(len(self.node_ids))
+        for i in starts:
+            visited[i] = 1
+
+        found = []
+        level = starts
+        n_hops = 0
+        while level and (depth is None or n_hops < depth):
+            next_level = []
+            for i in level:
+                for j in targets[offsets[i] : offsets[i + 1]]:
+                    if visited[j]:
+                        continue
+                    visited[j] = 1
+                    # only nodes of resource_types are followed, e.g. lineage through tables does not pass tests.
+                    if resource_types is not None and self.resource_types[j] not in resource_types:
+                        continue
+                    found.append(self.node_ids[j])
+                    next_level.append(j)
+            level = next_level
+            n_hops += 1
+        return found
+
+    def upstream_all(
+        self,
+        node_ids: Iterable[str],
+        resource_types: Optional[tuple[str, ...]] = TABLE_RESOURCE_TYPES,
+        depth: Optional[int] = None,
+    ) -> list[str]:
+        """
+        all transitive parents of node_ids within depth hops, excluding node_ids themselves
+        """
+        return self._traverse(self._parent_offsets, self._parent_targets, node_ids, resource_types, depth)
+
+    def downstream_all(
+        self,
+        node_ids: Iterable[str],
+        resource_types: Optional[tuple[str, ...]] = TABLE_RESOURCE_TYPES,
+        depth: Optional[int] = None,
+    ) -> list[str]:
+        """
+        all transitive children of node_ids within depth hops, excluding node_ids themselves
+        """
+        return self._traverse(self._child_offsets, self._child_targets, node_ids, resource_types, depth)
+
+    def upstream(self, node_id: str, resource_types: Optional[tuple[str, ...]] = TABLE_RESOURCE_TYPES) -> list[str]:
+        """
+        all transitive parents of node_id
+        """
+        return self.upstream_all([node_id], resource_types)
+
+    def downstream(self, node_id: str, resource_types: Optional[tuple[str, ...]] = TABLE_RESOURCE_TYPES) -> list[str]:
+        """
+        all transitive children of node_id
+        """
+        return self.downstream_all([node_id], resource_types)
@@ -0,0 +1,136 @@
+"""
+Mermaid or DOT lineage diagrams of model and source pages.
+
+The diagram of a node shows the models, seeds and sources within `depth` hops upstream and downstream of it.
+A hub node, with more than max_degree parents (or children), is not expanded further, and its parents (or children)
+are collapsed into a single "N more" node, so a page next to e.g. a calendar model does not draw thousands of edges.
+Subgraphs are memoized per (node, direction, depth), so a neighbourhood shared by many pages is computed once
+per export instead of once per page.
+"""
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .lineage import TABLE_RESOURCE_TYPES, LineageIndex
+
+DIAGRAM_FORMATS = ("mermaid", "dot")
+DEFAULT_DEPTH = 2
+DEFAULT_MAX_DEGREE = 50
+
+UPSTREAM = "upstream"
+DOWNSTREAM = "downstream"
+
+
+@dataclass(frozen=True)
+class LineageDiagram:
+    format: str = "mermaid"
+    depth: int = DEFAULT_DEPTH
+    max_degree: int = DEFAULT_MAX_DEGREE
+
+    def __post_init__(self):
+        if self.format not in DIAGRAM_FORMATS:
+            raise ValueError(
+                f"Invalid lineage diagram format: {self.format}. Supported formats are {', '.join(DIAGRAM_FORMATS)}"
+            )
+        if self.depth < 1:
+            raise ValueError(f"depth must be positive: {self.depth}")
+        if self.max_degree < 1:
+            raise ValueError(f"max_degree must be positive: {self.max_degree}")
+
+
+class Subgraph(NamedTuple):
+    # (parent, child) node ids
+    edges: frozenset[tuple[str, str]]
+    # (hub node id, direction, number of hidden neighbours)
+    collapsed: frozenset[tuple[str, str, int]]
+
+
+_EMPTY_SUBGRAPH = Subgraph(frozenset(), frozenset())
+
+
+class LineageDiagramBuilder:
+    def __init__(self, lineage: LineageIndex, diagram: LineageDiagram):
+        self.lineage = lineage
+        self.diagram = diagram
+        self._neighbors: dict[tuple[str, str], list[str]] = {}
+        self._subgraphs: dict[tuple[str, str, int], Subgraph] = {}
+
+    def _table_neighbors(self, node_id: str, direction: str) -> list[str]:
+        key = (node_id, direction)
+        neighbors = self._neighbors.get(key)
+        if neighbors is None:
+            nodes = self.lineage.parents(node_id) if direction == UPSTREAM else self.lineage.children(node_id)
+            neighbors = self._neighbors[key] = sorted(n for n in nodes if n.split(".")[0] in TABLE_RESOURCE_TYPES)
+        return neighbors
+
+    def subgraph(self, node_id: str, direction: str, depth: int) -> Subgraph:
+        """
+        edges within depth hops from node_id in direction, with hub nodes collapsed.
+        """
+        if depth <= 0:
+            return _EMPTY_SUBGRAPH
+        key = (node_id, direction, depth)
+        subgraph = self._subgraphs.get(key)
+        if subgraph is not None:
+            return subgraph
+
+        neighbors = self._table_neighbors(node_id, direction)
+        if len(neighbors) > self.diagram.max_degree:
+            subgraph = Subgraph(frozenset(), frozenset([(node_id, direction, len(neighbors))]))
+        else:
+            edges = set()
+            collapsed = set()
+            for neighbor in neighbors:
+                edges.add((neighbor, node_id) if direction == UPSTREAM else (node_id, neighbor))
+                neighbor_subgraph = self.subgraph(neighbor, direction, depth - 1)
+                edges.update(neighbor_subgraph.edges)
+                collapsed.update(neighbor_subgraph.collapsed)
+            subgraph = Subgraph(frozenset(edges), frozenset(collapsed))
+        self._subgraphs[key] = subgraph
+        return subgraph
+
+    def render(self, node_id: str) -> str:
+        """
+        fenced mermaid or dot code block of the lineage of node_id, or an empty string if it has no lineage.
+        """
+        upstream = self.subgraph(node_id, UPSTREAM, self.diagram.depth)
+        downstream = self.subgraph(node_id, DOWNSTREAM, self.diagram.depth)
+        edges = sorted(upstream.edges | downstream.edges)
+        collapsed = sorted(upstream.collapsed | downstream.collapsed)
+        if not edges and not collapsed:
+            return ""
+        if self.diagram.format == "dot":
+            return _render_dot(node_id, edges, collapsed)
+        return _render_mermaid(node_id, edges, collapsed)
+
+
+def _node_ids(node_id: str, edges: list[tuple[str, str]], collapsed: list[tuple[str, str, int]]) -> list[str]:
+    return sorted({node_id, *(n for edge in edges for n in edge), *(hub for hub, _, _ in collapsed)})
+
+
+def _render_mermaid(node_id: str, edges: list[tuple[str, str]], collapsed: list[tuple[str, str, int]]) -> str:
+    keys = {n: f"n{i}" for i, n in enumerate(_node_ids(node_id, edges, collapsed))}
+    lines = ["```mermaid", "graph LR"]
+    lines.extend(f'    {key}["{n.replace(chr(34), "#quot;")}"]' for n, key in keys.items())
+    lines.extend(f"    {keys[parent]} --> {keys[child]}" for parent, child in edges)
+    for i, (hub, direction, n_hidden) in enumerate(collapsed):
+        lines.append(f'    h{i}(["{n_hidden} more"])')
+        lines.append(f"    h{i} -.-> {keys[hub]}" if direction == UPSTREAM else f"    {keys[hub]} -.-> h{i}")
+    lines.append(f"    style {keys[node_id]} stroke-width:3px")
+    lines.append("```")
+    return "\n".join(lines)
+
+
+def _render_dot(node_id: str, edges: list[tuple[str, str]], collapsed: list[tuple[str, str, int]]) -> str:
+    def quote(name: str) -> str:
+        return '"' + name.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    lines = ["```dot", "digraph lineage {", "    rankdir=LR;", f"    {quote(node_id)} [style=bold];"]
+    lines.extend(f"    {quote(parent)} -> {quote(child)};" for parent, child in edges)
+    for i, (hub, direction, n_hidden) in enumerate(collapsed):
+        lines.append(f'    h{i} [label="{n_hidden} more", shape=plaintext];')
+        edge = f"h{i} -> {quote(hub)}" if direction == UPSTREAM else f"{quote(hub)} -> h{i}"
+        lines.append(f"    {edge} [style=dashed];")
+    lines.append("}")
+    lines.append("```")
+    return "\n".join(lines)
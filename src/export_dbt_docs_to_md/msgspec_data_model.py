@@ -0,0 +1,122 @@
+"""
+msgspec structs of the manifest.json and catalog.json entries read by build_parsed_data.py.
+
+Decoding into these structs skips every other field without building a dict for it,
+and the structs support `entry["key"]` and `entry.get("key")`, so the builders take them as they take dicts.
+Only used when msgspec is installed, see json_decoder.py.
+
+A field missing from the file is UNSET, not a default value: `entry["key"]` raises KeyError and
+`entry.get("key", default)` returns default, exactly as with the dicts of the other backends,
+so every backend accepts and rejects the same artifacts and renders the same pages.
+"""
+
+from typing import Any, Optional, Union
+
+from msgspec import UNSET, Struct, UnsetType
+
+
+class _Entry(Struct):
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, UNSET)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, UNSET)
+        return default if value is UNSET else value
+
+
+class ManifestColumn(_Entry):
+    name: Union[str, UnsetType] = UNSET
+    description: Union[str, UnsetType] = UNSET
+    data_type: Union[Optional[str], UnsetType] = UNSET
+
+
+class NodeConfig(_Entry):
+    materialized: Union[Optional[str], UnsetType] = UNSET
+
+
+class TestMetadata(_Entry):
+    name: Union[str, UnsetType] = UNSET
+
+
+class NodeEntry(_Entry):
+    """
+    manifest.json["nodes"] entry, models, seeds, tests and other nodes
+    """
+
+    name: str
+    resource_type: str
+    package_name: str
+    database: Union[Optional[str], UnsetType] = UNSET
+    schema: Union[Optional[str], UnsetType] = UNSET
+    original_file_path: Union[str, UnsetType] = UNSET
+    fqn: Union[list[str], UnsetType] = UNSET
+    tags: Union[list[str], UnsetType] = UNSET
+    description: Union[str, UnsetType] = UNSET
+    columns: Union[dict[str, ManifestColumn], UnsetType] = UNSET
+    config: Union[NodeConfig, UnsetType] = UNSET
+    depends_on: Union[dict[str, list[str]], UnsetType] = UNSET
+    language: Union[Optional[str], UnsetType] = UNSET
+    raw_code: Union[str, UnsetType] = UNSET
+    compiled_code: Union[Optional[str], UnsetType] = UNSET
+    # -- below properties exist only in test nodes
+    refs: Union[list[Any], UnsetType] = UNSET
+    column_name: Union[Optional[str], UnsetType] = UNSET
+    test_metadata: Union[Optional[TestMetadata], UnsetType] = UNSET
+
+
+class SourceEntry(_Entry):
+    name: str
+    resource_type: str
+    package_name: str
+    source_name: str
+    database: Union[Optional[str], UnsetType] = UNSET
+    schema: Union[Optional[str], UnsetType] = UNSET
+    original_file_path: Union[str, UnsetType] = UNSET
+    fqn: Union[list[str], UnsetType] = UNSET
+    tags: Union[list[str], UnsetType] = UNSET
+    description: Union[str, UnsetType] = UNSET
+    columns: Union[dict[str, ManifestColumn], UnsetType] = UNSET
+    loader: Union[str, UnsetType] = UNSET
+
+
+class MacroEntry(_Entry):
+    name: str
+    resource_type: str
+    package_name: str
+    original_file_path: Union[str, UnsetType] = UNSET
+    depends_on: Union[dict[str, list[str]], UnsetType] = UNSET
+    arguments: Union[list[Any], UnsetType] = UNSET
+    macro_sql: Union[str, UnsetType] = UNSET
+    description: Union[str, UnsetType] = UNSET
+
+
+class Manifest(_Entry):
+    nodes: Union[dict[str, NodeEntry], UnsetType] = UNSET
+    sources: Union[dict[str, SourceEntry], UnsetType] = UNSET
+    macros: Union[dict[str, MacroEntry], UnsetType] = UNSET
+    parent_map: Union[dict[str, list[str]], UnsetType] = UNSET
+    child_map: Union[dict[str, list[str]], UnsetType] = UNSET
+
+
+class CatalogColumn(_Entry):
+    type: str
+    index: int
+    name: str
+    comment: Union[Optional[str], UnsetType] = UNSET
+
+
+class CatalogMetadata(_Entry):
+    owner: Union[Optional[str], UnsetType] = UNSET
+
+
+class CatalogEntry(_Entry):
+    metadata: CatalogMetadata
+    columns: Union[dict[str, CatalogColumn], UnsetType] = UNSET
+
+
+class Catalog(_Entry):
+    nodes: Union[dict[str, CatalogEntry], UnsetType] = UNSET
+    sources: Union[dict[str, CatalogEntry], UnsetType] = UNSET
@@ -0,0 +1,160 @@
+"""
+Export several dbt projects into one output tree, rendering pages shared by projects once.
+
+Projects often install the same packages (e.g. dbt_utils), so many of their pages have identical inputs.
+Every project is resolved first, and a page whose node (see incremental.node_hash) is found in two or more projects
+is rendered once under _shared/. Referenced by and lineage differ between projects, so they are not part of the key
+and are left out of shared pages. Each project gets its own pages under <project name>/ and
+a shared_pages.md page listing the shared pages it uses with their referenced by in the project.
+
+    output_dir/
+        _shared/dbt_utils/macro/dbt_utils/star.md
+        project_a/project_a/model/project_a/orders.md
+        project_a/shared_pages.md
+        project_b/...
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .api import DocsProject
+from .column_table import FULL_COLUMN_TABLE, ColumnTable
+from .format_parsed_data import Page
+from .incremental import node_hash
+from .lineage_diagram import LineageDiagram
+from .output_sink import DirectorySink
+from .parallel_render import write_pages
+from .profiler import DISABLED_PROFILER, Profiler
+from .templates import PageTemplate
+
+SHARED_DIR_NAME = "_shared"
+SHARED_PAGES_FILE_NAME = "shared_pages.md"
+
+
+class Project(NamedTuple):
+    name: str
+    manifest_json_path: str | Path
+    catalog_json_path: str | Path
+
+
+def _cell(values: list[str]) -> str:
+    values = [v for v in values if v != "&nbsp;"]
+    return "<br>".join(values) if values else "&nbsp;"
+
+
+def _shared_pages_markdown(project_name: str, shared_pages: list[tuple[Page, Path]]) -> str:
+    rows = []
+    for page, file_path in shared_pages:
+        referenced_by = _cell(list(page.referenced_by.values()) if page.referenced_by is not None else [])
+        lineage = page.lineage if page.lineage is not None else {}
+        upstream, downstream = lineage.get("upstream", "&nbsp;"), lineage.get("downstream", "&nbsp;")
+        link = f"[{file_path.as_posix()}](../{file_path.as_posix()})"
+        rows.append(f"| {page.node_id} | {link} | {referenced_by} | {upstream} | {downstream} |\n")
+    return (
+        f"# {project_name} shared pages\n\n"
+        "| NODE | PAGE | REFERENCED BY | UPSTREAM | DOWNSTREAM |\n| --- | --- | --- | --- | --- |\n"
+        f"{''.join(rows)}"
+    )
+
+
+def _without_back_references(page: Page) -> Page:
+    # referenced by and lineage are of one project, see _shared_pages_markdown for them.
+    referenced_by = {k: "&nbsp;" for k in page.referenced_by.keys()} if page.referenced_by is not None else None
+    return page._replace(referenced_by=referenced_by, lineage=None)
+
+
+def assign_shared_pages(
+    resolved: list[tuple[str, list[Page]]],
+) -> tuple[list[Page], dict[str, list[tuple[Page, Path]]]]:
+    """
+    Return pages to render, with file paths relative to the output root, and shared pages used by each project
+    with their file paths. resolved is (project name, pages) per project.
+    Pages are keyed by their node, so that a package page is shared whichever nodes of a project refer to it.
+    """
+    keys = [[node_hash(page.node_id, page.node_data) for page in pages] for _, pages in resolved]
+    projects_per_key = Counter(key for project_keys in keys for key in set(project_keys))
+
+    pages_to_render = []
+    shared_paths: dict[str, Path] = {}
+    claimed_paths: set[Path] = set()
+    shared_pages_per_project = {}
+    for (project_name, pages), project_keys in zip(resolved, keys, strict=True):
+        shared_pages = []
+        for page, key in zip(pages, project_keys, strict=True):
+            if projects_per_key[key] < 2:
+                pages_to_render.append(page._replace(file_path=Path(project_name) / page.file_path))
+                continue
+            if key not in shared_paths:
+                # another version of the page (e.g. another package version) has its own dir.
+                shared_path = Path(SHARED_DIR_NAME) / page.file_path
+                if shared_path in claimed_paths:
+                    shared_path = Path(SHARED_DIR_NAME) / key[:12] / page.file_path
+                claimed_paths.add(shared_path)
+                shared_paths[key] = shared_path
+                pages_to_render.append(_without_back_references(page)._replace(file_path=shared_path))
+            shared_pages.append((page, shared_paths[key]))
+        shared_pages_per_project[project_name] = shared_pages
+    return pages_to_render, shared_pages_per_project
+
+
+def export_projects(
+    projects: list[Project],
+    output_dir_path: str | Path,
+    jobs: int = 1,
+    template_dir_path: Optional[str | Path] = None,
+    strict: bool = False,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    profiler: Profiler = DISABLED_PROFILER,
+    json_backend: Optional[str] = None,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
+    lineage_diagram: Optional[LineageDiagram] = None,
+) -> Counter:
+    """
+    Return the number of rendered pages per project name, and of shared pages under SHARED_DIR_NAME.
+    See parse_docs_data() for the other arguments.
+    """
+    names = [project.name for project in projects]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Project names must be unique: {', '.join(names)}")
+    if SHARED_DIR_NAME in names:
+        raise ValueError(f"{SHARED_DIR_NAME} can not be a project name")
+
+    templates: Optional[dict[str, PageTemplate]] = None
+    resolved = []
+    for project in projects:
+        with profiler.phase("load_and_build"):
+            docs_project = DocsProject.load(
+                project.manifest_json_path,
+                project.catalog_json_path,
+                strict=strict,
+                select=select,
+                exclude=exclude,
+                template_dir_path=template_dir_path,
+                json_backend=json_backend,
+                column_table=column_table,
+                lineage_diagram=lineage_diagram,
+            )
+        templates = docs_project.templates
+        with profiler.phase("resolve"):
+            pages, _ = docs_project.resolve()
+        resolved.append((project.name, pages))
+
+    pages_to_render, shared_pages_per_project = assign_shared_pages(resolved)
+    del resolved
+
+    rendered_count = Counter()
+    with DirectorySink(output_dir_path) as sink:
+        written = write_pages(
+            pages_to_render, sink, jobs=jobs, templates=templates, profiler=profiler, column_table=column_table
+        )
+        # the loop runs write_pages to its end, where it waits for the writers and raises a failed write.
+        for page in written:
+            rendered_count[page.file_path.parts[0]] += 1
+        for project_name, shared_pages in shared_pages_per_project.items():
+            sink.write(Path(project_name) / SHARED_PAGES_FILE_NAME, _shared_pages_markdown(project_name, shared_pages))
+    profiler.count("pages_shared", rendered_count[SHARED_DIR_NAME])
+    return rendered_count
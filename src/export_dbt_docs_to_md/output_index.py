@@ -0,0 +1,130 @@
+"""
+Index pages and a manifest of every emitted file, accumulated while pages are written.
+
+Pages are laid out as <package>/<resource_type>/... (column tests as tests/test/...), and the index pages follow that:
+
+    output_dir/
+        index.md                      links to the index of each package
+        <package>/index.md            links to the index of each resource type of the package
+        <package>/model/index.md      links to every model page of the package
+        files.json                    size and sha256 of every emitted file
+
+files.json is
+
+    {
+        "version": 1,
+        "files": {relative_path: {"kind": ..., "node_id": ..., "size": ..., "sha256": ...}, ...}
+    }
+
+where kind is page, sidecar (column sidecar files), index or search_index, and node_id is null except for pages
+and sidecars. Sizes are in bytes of the UTF-8 encoded file.
+Files are recorded from the rendered markdown in the render loop, so the output tree is never walked.
+Pages skipped by incremental export keep their entries of the previous files.json.
+"""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from json import dumps, load
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .format_parsed_data import Page
+    from .output_sink import OutputSink
+
+INDEX_FILE_NAME = "index.md"
+FILES_MANIFEST_FILE_NAME = "files.json"
+# bump this when the layout of files.json changes.
+FILES_MANIFEST_VERSION = 1
+
+PAGE = "page"
+SIDECAR = "sidecar"
+INDEX = "index"
+SEARCH_INDEX = "search_index"
+
+
+def file_entry(kind: str, node_id: Optional[str], markdown_str: str) -> dict:
+    content = markdown_str.encode()
+    return {"kind": kind, "node_id": node_id, "size": len(content), "sha256": sha256(content).hexdigest()}
+
+
+class OutputIndex:
+    def __init__(self):
+        # relative path -> entry of files.json
+        self.files: dict[str, dict] = {}
+
+    def add(self, page: Page, files: list[tuple[Path, str]]):
+        """
+        Record the rendered files of page, the page first as render_page_files() returns them.
+        """
+        for i, (file_path, markdown_str) in enumerate(files):
+            self.files[file_path.as_posix()] = file_entry(PAGE if i == 0 else SIDECAR, page.node_id, markdown_str)
+
+    def add_file(self, relative_path: Path, markdown_str: str, kind: str):
+        self.files[relative_path.as_posix()] = file_entry(kind, None, markdown_str)
+
+    def add_previous(self, output_dir_path: str | Path, previous_pages: dict[str, dict]):
+        """
+        Record pages written by an earlier export, e.g. skipped by incremental export.
+        previous_pages is {node_id: {"path": ..., "sidecars": [...]}} as in the incremental export state.
+        Entries are taken from the files.json in output_dir_path, and only files missing there are read.
+        """
+        output_dir_path = Path(output_dir_path)
+        previous_files = {}
+        files_manifest_path = output_dir_path / FILES_MANIFEST_FILE_NAME
+        if files_manifest_path.exists():
+            with open(files_manifest_path) as f:
+                files_manifest = load(f)
+            if files_manifest.get("version") == FILES_MANIFEST_VERSION:
+                previous_files = files_manifest["files"]
+        for node_id, page in previous_pages.items():
+            for kind, relative_path in [(PAGE, page["path"]), *((SIDECAR, p) for p in page.get("sidecars", []))]:
+                entry = previous_files.get(relative_path)
+                if entry is None or entry["node_id"] != node_id:
+                    entry = file_entry(kind, node_id, (output_dir_path / relative_path).read_text())
+                self.files[relative_path] = entry
+
+    def index_pages(self) -> Iterator[tuple[Path, str]]:
+        """
+        Yield (relative_path, markdown) of the root, package and resource type index pages.
+        """
+        # package dir -> resource type dir -> [(node_id, page path relative to the resource type dir)]
+        tree: dict[str, dict[str, list[tuple[str, str]]]] = {}
+        for relative_path, entry in self.files.items():
+            if entry["kind"] != PAGE:
+                continue
+            package_dir, resource_type_dir, *rest = PurePosixPath(relative_path).parts
+            pages = tree.setdefault(package_dir, {}).setdefault(resource_type_dir, [])
+            pages.append((entry["node_id"], "/".join(rest)))
+
+        root_rows = []
+        for package_dir, resource_types in sorted(tree.items()):
+            package_rows = []
+            for resource_type_dir, pages in sorted(resource_types.items()):
+                rows = "".join(f"| {node_id} | [{path}]({path}) |\n" for node_id, path in sorted(pages))
+                yield (
+                    Path(package_dir) / resource_type_dir / INDEX_FILE_NAME,
+                    f"# {package_dir} {resource_type_dir}\n\n| NODE | PAGE |\n| --- | --- |\n{rows}",
+                )
+                link = f"{resource_type_dir}/{INDEX_FILE_NAME}"
+                package_rows.append(f"| [{resource_type_dir}]({link}) | {len(pages)} |\n")
+            yield (
+                Path(package_dir) / INDEX_FILE_NAME,
+                f"# {package_dir}\n\n| RESOURCE TYPE | PAGES |\n| --- | --- |\n{''.join(package_rows)}",
+            )
+            n_pages = sum(len(pages) for pages in resource_types.values())
+            root_rows.append(f"| [{package_dir}]({package_dir}/{INDEX_FILE_NAME}) | {n_pages} |\n")
+        yield Path(INDEX_FILE_NAME), f"# Index\n\n| PACKAGE | PAGES |\n| --- | --- |\n{''.join(root_rows)}"
+
+    def dump_files_manifest(self) -> str:
+        return dumps({"version": FILES_MANIFEST_VERSION, "files": dict(sorted(self.files.items()))}, indent=1)
+
+    def write(self, sink: OutputSink):
+        """
+        Write the index pages, then files.json recording every file including them.
+        """
+        for relative_path, markdown_str in self.index_pages():
+            sink.write(relative_path, markdown_str)
+            self.add_file(relative_path, markdown_str, INDEX)
+        sink.write(Path(FILES_MANIFEST_FILE_NAME), self.dump_files_manifest())
@@ -0,0 +1,155 @@
+"""
+Output sinks which receive rendered pages by their path relative to the output root.
+
+- DirectorySink writes a directory tree, creating each directory only once.
+- TarSink/ZipSink stream every page into a single archive file.
+- MemorySink keeps pages in a dict for library callers.
+
+Every sink raises ValueError when a file is written twice while the sink is open, since an archive can not
+replace an entry and the same export would otherwise differ between sinks.
+"""
+
+from io import BytesIO
+from pathlib import Path, PurePosixPath
+from tarfile import TarFile, TarInfo
+from tarfile import open as open_tarfile
+from threading import Lock
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".zip")
+
+
+class OutputSink:
+    # True if write() can be called from several threads at once.
+    thread_safe = False
+    # True if the output is a directory tree which can be updated in place (e.g. incremental export).
+    is_directory = False
+
+    def __init__(self):
+        self._names: set[str] = set()
+        self._names_lock = Lock()
+
+    def _claim(self, relative_path: Path) -> str:
+        """
+        Return the archive name of relative_path, raise ValueError if it is already written.
+        """
+        name = PurePosixPath(relative_path).as_posix()
+        with self._names_lock:
+            if name in self._names:
+                raise ValueError(f"Duplicate file in output: {name}")
+            self._names.add(name)
+        return name
+
+    def write(self, relative_path: Path, markdown_str: str):
+        raise NotImplementedError
+
+    def is_unchanged(self, relative_path: Path, markdown_str: str) -> bool:
+        """
+        Return True if the page at relative_path already has the content markdown_str.
+        """
+        return False
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        # e.g. watch mode writes the changed pages again in each update.
+        self._names = set()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DirectorySink(OutputSink):
+    thread_safe = True
+    is_directory = True
+
+    def __init__(self, output_dir_path: str | Path):
+        super().__init__()
+        self.output_dir_path = Path(output_dir_path)
+        self.output_dir_path.mkdir(exist_ok=True, parents=True)
+        self._created_dirs = {self.output_dir_path}
+
+    def write(self, relative_path: Path, markdown_str: str):
+        self._claim(relative_path)
+        file_path = self.output_dir_path / relative_path
+        if file_path.parent not in self._created_dirs:
+            file_path.parent.mkdir(exist_ok=True, parents=True)
+            self._created_dirs.add(file_path.parent)
+        with open(file_path, mode="w") as f:
+            f.write(markdown_str)
+
+    def is_unchanged(self, relative_path: Path, markdown_str: str) -> bool:
+        try:
+            with open(self.output_dir_path / relative_path) as f:
+                return f.read() == markdown_str
+        except FileNotFoundError:
+            return False
+
+
+class TarSink(OutputSink):
+    def __init__(self, archive_path: str | Path):
+        super().__init__()
+        archive_path = Path(archive_path)
+        archive_path.parent.mkdir(exist_ok=True, parents=True)
+        # stream mode, the archive is written sequentially without seeking.
+        mode = "w|gz" if archive_path.name.endswith((".tar.gz", ".tgz")) else "w|"
+        self._tar: TarFile = open_tarfile(str(archive_path), mode=mode)
+        self._lock = Lock()
+
+    def write(self, relative_path: Path, markdown_str: str):
+        name = self._claim(relative_path)
+        data = markdown_str.encode()
+        tar_info = TarInfo(name)
+        tar_info.size = len(data)
+        with self._lock:
+            self._tar.addfile(tar_info, BytesIO(data))
+
+    def close(self):
+        self._tar.close()
+
+
+class ZipSink(OutputSink):
+    def __init__(self, archive_path: str | Path):
+        super().__init__()
+        archive_path = Path(archive_path)
+        archive_path.parent.mkdir(exist_ok=True, parents=True)
+        self._zip = ZipFile(archive_path, mode="w", compression=ZIP_DEFLATED)
+        self._lock = Lock()
+
+    def write(self, relative_path: Path, markdown_str: str):
+        name = self._claim(relative_path)
+        # fixed timestamp to keep the archive reproducible.
+        zip_info = ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+        zip_info.compress_type = ZIP_DEFLATED
+        with self._lock:
+            self._zip.writestr(zip_info, markdown_str)
+
+    def close(self):
+        self._zip.close()
+
+
+class MemorySink(OutputSink):
+    def __init__(self):
+        super().__init__()
+        self.pages: dict[str, str] = {}
+
+    def write(self, relative_path: Path, markdown_str: str):
+        self.pages[self._claim(relative_path)] = markdown_str
+
+
+def is_archive_path(output_path: str | Path) -> bool:
+    return Path(output_path).name.endswith(ARCHIVE_SUFFIXES)
+
+
+def open_sink(output_path: str | Path) -> OutputSink:
+    """
+    open archive sink if output_path ends with .tar, .tar.gz, .tgz or .zip, otherwise directory sink.
+    """
+    output_path = Path(output_path)
+    if output_path.name.endswith(".zip"):
+        return ZipSink(output_path)
+    if is_archive_path(output_path):
+        return TarSink(output_path)
+    return DirectorySink(output_path)
@@ -0,0 +1,125 @@
+"""
+Render and write pages, optionally in parallel.
+
+Template formatting is CPU bound, so it is fanned out across a process pool.
+Rendered pages go through a bounded queue to writer threads (see writer_pipeline.py), so rendering and the blocking
+file writes overlap. Archives are written by a single writer in the given order, and the content is the same as a
+serial run.
+"""
+
+from collections import deque
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from .column_table import FULL_COLUMN_TABLE, ColumnTable
+from .format_parsed_data import Page, render_page_files
+from .output_index import OutputIndex
+from .output_sink import OutputSink
+from .profiler import DISABLED_PROFILER, Profiler
+from .templates import DEFAULT_TEMPLATES, PageTemplate
+from .writer_pipeline import DEFAULT_QUEUE_SIZE, WriterPipeline
+
+# upper bound of pages per task sent to a render worker
+MAX_CHUNK_SIZE = 64
+# tasks in flight per render worker, submitted as the rendered pages are consumed
+TASKS_PER_JOB = 2
+
+
+def _count_page(page: Page, files: list[tuple[Path, str]], profiler: Profiler):
+    if profiler.enabled:
+        profiler.count("pages")
+        profiler.count(f"pages.{page.resource_type}")
+        profiler.count("column_sidecars", len(files) - 1)
+        profiler.count("bytes_rendered", sum(len(markdown_str.encode()) for _, markdown_str in files))
+
+
+def _render_chunk(
+    pages: list[Page], templates: dict[str, PageTemplate], column_table: ColumnTable
+) -> list[list[tuple[Path, str]]]:
+    return [render_page_files(page, templates, column_table) for page in pages]
+
+
+def _render_in_pool(
+    render_pool, render_chunk: Callable, pages: list[Page], chunksize: int, max_tasks: int
+) -> Iterator[list[tuple[Path, str]]]:
+    """
+    render pages in the pool and yield them in order.
+    Executor.map() submits every chunk at once, so the rendered pages would pile up in memory while the writers
+    fall behind. Here at most max_tasks chunks are in flight, and the next chunk is submitted as one is consumed.
+    """
+    chunks = (pages[i : i + chunksize] for i in range(0, len(pages), chunksize))
+    futures = deque()
+    for chunk in chunks:
+        futures.append(render_pool.submit(render_chunk, chunk))
+        if len(futures) >= max_tasks:
+            break
+    while futures:
+        rendered = futures.popleft().result()
+        chunk = next(chunks, None)
+        if chunk is not None:
+            futures.append(render_pool.submit(render_chunk, chunk))
+        yield from rendered
+
+
+def _timed(rendered: Iterator[list[tuple[Path, str]]], profiler: Profiler) -> Iterator[list[tuple[Path, str]]]:
+    # with a process pool, this is the time spent waiting for the workers.
+    while True:
+        with profiler.phase("render"):
+            files = next(rendered, None)
+        if files is None:
+            return
+        yield files
+
+
+def write_pages(
+    pages: list[Page],
+    sink: OutputSink,
+    jobs: int = 1,
+    templates: dict[str, PageTemplate] = DEFAULT_TEMPLATES,
+    profiler: Profiler = DISABLED_PROFILER,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    column_table: ColumnTable = FULL_COLUMN_TABLE,
+    output_index: Optional[OutputIndex] = None,
+) -> Iterator[Page]:
+    """
+    render pages and write them to sink, and yield the queued pages in order.
+    Column sidecar files of wide tables (see column_table.py) are written after their page.
+    Pages are written by the writer pipeline, and a failed write is raised at the latest when the generator finishes,
+    so iterate it to its end.
+    With output_index, the rendered files are recorded for index pages and files.json, see output_index.py.
+    """
+    render_pool = None
+    if jobs <= 1 or len(pages) <= 1:
+        rendered = (render_page_files(page, templates, column_table) for page in pages)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        render_pool = ProcessPoolExecutor(max_workers=jobs)
+        # large chunks keep the pickling overhead low, several chunks per worker keep the load balanced.
+        chunksize = max(1, min(len(pages) // (jobs * 4), MAX_CHUNK_SIZE))
+        render_chunk = partial(_render_chunk, templates=templates, column_table=column_table)
+        rendered = _render_in_pool(render_pool, render_chunk, pages, chunksize, jobs * TASKS_PER_JOB)
+
+    # phases are recorded in this thread only. write is the time blocked on a full queue
+    # and the time waiting for the writers to drain it at the end.
+    pipeline = WriterPipeline(sink, writers=jobs, queue_size=queue_size)
+    try:
+        with pipeline:
+            for page, files in zip(pages, _timed(iter(rendered), profiler)):
+                with profiler.phase("write"):
+                    for file_path, markdown_str in files:
+                        pipeline.put(file_path, markdown_str)
+                _count_page(page, files, profiler)
+                if output_index is not None:
+                    output_index.add(page, files)
+                yield page
+            with profiler.phase("write"):
+                pipeline.close()
+    finally:
+        if render_pool is not None:
+            render_pool.shutdown(cancel_futures=True)
+    profiler.count("pages_unchanged", pipeline.stats.pages_unchanged)
+    # pages whose file already had the same content are rendered but not written.
+    profiler.count("bytes_written", pipeline.stats.bytes_written)
+    profiler.add_stats("writer", pipeline.stats.as_dict())
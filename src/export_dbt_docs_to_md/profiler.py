@@ -0,0 +1,121 @@
+"""
+Per-phase profiling of an export.
+
+Each phase records wall time, CPU time and peak traced memory (tracemalloc), and a phase entered
+several times (e.g. render and write per page) accumulates. Counters hold pages, bytes rendered and written, and nodes.
+A disabled Profiler does nothing, so that it can be passed around unconditionally.
+"""
+
+import tracemalloc
+from cProfile import Profile
+from collections import Counter
+from contextlib import contextmanager
+from json import dump
+from pathlib import Path
+from platform import python_version
+from sys import platform
+from time import perf_counter, process_time
+from typing import Iterator, Optional
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:
+    # not available on windows
+    getrusage = None
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, pstats_path: Optional[str | Path] = None):
+        self.enabled = enabled
+        self.pstats_path = pstats_path
+        self.phases: dict[str, dict[str, float]] = {}
+        self.counts: Counter = Counter()
+        # stats reported by components as they are, e.g. the writer pipeline
+        self.stats: dict[str, dict] = {}
+        self._peak_stack: list[int] = []
+        self._cprofile: Optional[Profile] = None
+        self._started_tracemalloc = False
+
+    def start(self):
+        if not self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.pstats_path is not None:
+            self._cprofile = Profile()
+            self._cprofile.enable()
+
+    def stop(self):
+        if not self.enabled:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.pstats_path)
+            self._cprofile = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        # keep the peak of the enclosing phase before resetting it for this one.
+        if self._peak_stack:
+            self._peak_stack[-1] = max(self._peak_stack[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._peak_stack.append(0)
+        wall_start, cpu_start = perf_counter(), process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = perf_counter() - wall_start, process_time() - cpu_start
+            peak = max(self._peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+            if self._peak_stack:
+                self._peak_stack[-1] = max(self._peak_stack[-1], peak)
+
+            stats = self.phases.setdefault(
+                name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_bytes": 0, "calls": 0}
+            )
+            stats["wall_seconds"] += wall
+            stats["cpu_seconds"] += cpu
+            stats["peak_bytes"] = max(stats["peak_bytes"], peak)
+            stats["calls"] += 1
+
+    def count(self, key: str, n: int = 1):
+        if self.enabled:
+            self.counts[key] += n
+
+    def add_stats(self, key: str, stats: dict):
+        if self.enabled:
+            self.stats[key] = stats
+
+    def report(self) -> dict:
+        max_rss = None
+        if getrusage is not None:
+            # ru_maxrss is KiB on linux and bytes on macOS.
+            max_rss = getrusage(RUSAGE_SELF).ru_maxrss * (1 if platform == "darwin" else 1024)
+        return {
+            "python": python_version(),
+            "phases": self.phases,
+            "counts": dict(sorted(self.counts.items())),
+            "stats": self.stats,
+            "max_rss_bytes": max_rss,
+        }
+
+    def write_report(self, report_path: str | Path):
+        with open(report_path, mode="w") as f:
+            dump(self.report(), f, indent=2)
+
+
+DISABLED_PROFILER = Profiler(enabled=False)
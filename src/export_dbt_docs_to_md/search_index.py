@@ -0,0 +1,100 @@
+"""
+Inverted index of the exported pages, written as search_index.json next to them.
+
+    {
+        "version": 1,
+        "documents": [[node_id, resource_type, relative_path, name], ...],
+        "terms": {term: [document index, ...], ...}
+    }
+
+Terms are lowercased words of node names, column names, descriptions, tags and owners.
+Identifiers such as customer_id are indexed as a whole and split by "_", so both `customer_id` and `customer` hit.
+A search is a dict lookup per term and an intersection of the posting lists, without reading any page.
+"""
+
+from json import dumps
+from re import compile
+from typing import Iterable, Iterator, Optional
+
+from .api import DocsProject, test_page_name
+from .format_parsed_data import page_filepath
+
+SEARCH_INDEX_FILE_NAME = "search_index.json"
+# bump this when the layout of search_index.json changes.
+SEARCH_INDEX_VERSION = 1
+
+_WORD = compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> Iterator[str]:
+    if not text:
+        return
+    for word in _WORD.findall(text.lower()):
+        yield word
+        if "_" in word:
+            yield from (part for part in word.split("_") if part)
+
+
+def _node_texts(node_id: str, node_data) -> Iterator[Optional[str]]:
+    yield node_data.name
+    yield node_data.description
+    if node_id.startswith("macro.") or node_id.startswith("test."):
+        return
+    yield node_data.owner
+    yield from node_data.tags
+    for column in node_data.columns.values():
+        yield column.name
+        yield column.description_from_manifest
+
+
+def build_search_index(project: DocsProject, node_ids: Optional[Iterable[str]] = None) -> dict:
+    """
+    Build the index of node_ids, or of every page of project.
+    """
+    parsed_json = project.parsed_json
+    documents = []
+    terms: dict[str, list[int]] = {}
+    for node_id in project.node_ids() if node_ids is None else node_ids:
+        resource_type = node_id.split(".")[0]
+        if resource_type == "macro":
+            node_data = parsed_json.macros[node_id]
+            file_path = page_filepath(node_id, node_data.package_name, "")
+        elif resource_type == "test":
+            node_data = parsed_json.tests[node_id]
+            file_path = page_filepath(test_page_name(node_id), "tests", "")
+        elif resource_type == "source":
+            node_data = parsed_json.sources[node_id]
+            file_path = page_filepath(node_id, node_data.package_name, "")
+        else:
+            node_data = parsed_json.nodes[node_id]
+            file_path = page_filepath(node_id, node_data.package_name, "")
+
+        document_index = len(documents)
+        documents.append([node_id, resource_type, file_path.as_posix(), node_data.name])
+        for text in _node_texts(node_id, node_data):
+            for term in tokenize(text):
+                postings = terms.setdefault(term, [])
+                # documents are added in order, so checking the last one is enough to keep postings unique.
+                if not postings or postings[-1] != document_index:
+                    postings.append(document_index)
+
+    return {"version": SEARCH_INDEX_VERSION, "documents": documents, "terms": terms}
+
+
+def dump_search_index(search_index: dict) -> str:
+    # compact separators, the index of a large project is mostly integers.
+    return dumps(search_index, separators=(",", ":"), sort_keys=True)
+
+
+def search(search_index: dict, query: str) -> list[list[str]]:
+    """
+    Return documents ([node_id, resource_type, relative_path, name]) which contain every term of query.
+    """
+    query_terms = set(_WORD.findall(query.lower()))
+    if not query_terms:
+        return []
+    postings_list = sorted((search_index["terms"].get(term, []) for term in query_terms), key=len)
+    matched = set(postings_list[0])
+    for postings in postings_list[1:]:
+        matched.intersection_update(postings)
+    return [search_index["documents"][i] for i in sorted(matched)]
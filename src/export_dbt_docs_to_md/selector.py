@@ -0,0 +1,130 @@
+"""
+Resolve dbt style node selection (--select/--exclude) before any node is built.
+
+Supported syntax, as in `dbt ls --select`:
+- space separated selectors are a union, comma separated criteria are an intersection.
+- methods: tag:, package:, path:, resource_type:, fqn: and a bare name (node name or fqn).
+  Values can contain shell style wildcards, e.g. `tag:finance_*`.
+- graph operators: `+model` (ancestors), `model+` (descendants), `2+model+1` (within n hops).
+
+Tests whose parent is selected are selected too, like dbt's eager indirect selection.
+"""
+
+from fnmatch import fnmatchcase
+from re import compile
+from typing import Iterable, Optional
+
+from .lineage import LineageIndex
+
+SELECTOR_METHODS = ("tag", "package", "path", "resource_type", "fqn")
+CRITERION_PATTERN = compile(r"^(?:(\d*)(\+))?(.*?)(?:(\+)(\d*))?$")
+
+
+def selector_attributes(node_id: str, manifest_data: dict) -> dict:
+    """
+    the small part of a manifest.json node/source/macro entry needed for selection
+    """
+    return {
+        "name": manifest_data.get("name", node_id.split(".")[-1]),
+        "resource_type": node_id.split(".")[0],
+        "package_name": manifest_data.get("package_name", node_id.split(".")[1]),
+        "path": manifest_data.get("original_file_path", ""),
+        "tags": manifest_data.get("tags", []),
+        "fqn": manifest_data.get("fqn", [manifest_data.get("package_name", ""), manifest_data.get("name", "")]),
+    }
+
+
+def _match_path(node_path: str, value: str) -> bool:
+    value = value.rstrip("/")
+    return node_path == value or node_path.startswith(value + "/") or fnmatchcase(node_path, value)
+
+
+def _match_fqn(fqn: list[str], value: str) -> bool:
+    # fqn selects the node itself or everything under it, e.g. `my_project.staging`
+    value_parts = value.split(".")
+    if len(value_parts) > len(fqn):
+        return False
+    return all(fnmatchcase(part, value_part) for part, value_part in zip(fqn, value_parts))
+
+
+def _match(attributes: dict, method: str, value: str) -> bool:
+    if method == "tag":
+        return any(fnmatchcase(tag, value) for tag in attributes["tags"])
+    if method == "package":
+        return fnmatchcase(attributes["package_name"], value)
+    if method == "path":
+        return _match_path(attributes["path"], value)
+    if method == "resource_type":
+        return attributes["resource_type"] == value
+    if method == "fqn":
+        return fnmatchcase(attributes["name"], value) or _match_fqn(attributes["fqn"], value)
+    raise ValueError(f"Invalid selector method: {method}. Supported methods are {', '.join(SELECTOR_METHODS)}")
+
+
+def _select_criterion(
+    criterion: str, node_attributes: dict[str, dict], lineage: LineageIndex
+) -> set[str]:
+    parents_depth, parents, body, children, children_depth = CRITERION_PATTERN.match(criterion).groups()
+    method, _, value = body.rpartition(":")
+    if method == "":
+        method = "fqn"
+    if value == "":
+        raise ValueError(f"Invalid selector: {criterion}")
+
+    selected = {node_id for node_id, attributes in node_attributes.items() if _match(attributes, method, value)}
+    if parents:
+        depth = int(parents_depth) if parents_depth else None
+        selected.update(lineage.upstream_all(list(selected), resource_types=None, depth=depth))
+    if children:
+        depth = int(children_depth) if children_depth else None
+        selected.update(lineage.downstream_all(list(selected), resource_types=None, depth=depth))
+    return selected
+
+
+def _select(selectors: Iterable[str], node_attributes: dict[str, dict], lineage: LineageIndex) -> set[str]:
+    selected = set()
+    for selector in selectors:
+        for union_term in selector.split():
+            intersection = None
+            for criterion in union_term.split(","):
+                matched = _select_criterion(criterion, node_attributes, lineage)
+                intersection = matched if intersection is None else intersection & matched
+            selected |= intersection
+    return selected
+
+
+def select_node_ids(
+    select: Optional[Iterable[str]],
+    exclude: Optional[Iterable[str]],
+    node_attributes: dict[str, dict],
+    child_map: dict[str, list[str]],
+) -> set[str]:
+    """
+    node_attributes has selector_attributes() of every node, source and macro.
+    Return the selected node ids, or all node ids if select is empty.
+    """
+    lineage = LineageIndex(node_attributes.keys(), ((p, c) for p, cs in child_map.items() for c in cs))
+    if select:
+        selected = _select(select, node_attributes, lineage) & node_attributes.keys()
+    else:
+        selected = set(node_attributes.keys())
+
+    # tests of selected tables are rendered with them.
+    selected.update(
+        child_node
+        for child_node in lineage.downstream_all(list(selected), resource_types=("test",), depth=1)
+        if child_node in node_attributes
+    )
+
+    if exclude:
+        selected -= _select(exclude, node_attributes, lineage)
+    return selected
+
+
+def filter_selected(node_map: dict[str, list[str]], selected: Optional[set[str]]) -> dict[str, list[str]]:
+    """
+    keep selected nodes and their edges to selected nodes, so that pages do not refer to nodes without a page.
+    """
+    if selected is None:
+        return node_map
+    return {k: [node_id for node_id in v if node_id in selected] for k, v in node_map.items() if k in selected}
@@ -0,0 +1,154 @@
+"""
+Split an export across N workers, e.g. CI runners, with `--shard i/N`, then merge their records into one index.
+
+Every worker loads the whole project, so referenced by and lineage are resolved from the full child_map
+and links to pages of other shards are correct, but renders and writes only the pages of its shard.
+Pages are assigned by estimated cost (columns and code size), the most expensive first, each to the least loaded shard.
+The assignment depends only on the project, so every worker computes the same one without coordination.
+
+Each worker writes a record of its files to _shards/shard_<i>_of_<N>.json:
+
+    {
+        "version": 2,
+        "shard": i,
+        "count": N,
+        "total_pages": pages of every shard,
+        "files": {relative_path: entry of files.json, ...}
+    }
+
+Once the outputs of every worker are in one dir, `--merge_shards` checks that every shard is there
+and writes the index pages and files.json of every shard, see output_index.py.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from heapq import heapify, heapreplace
+from json import dumps, loads
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .output_index import PAGE, OutputIndex
+
+if TYPE_CHECKING:
+    from .api import DocsProject
+
+SHARD_DIR_NAME = "_shards"
+# bump this when the layout of shard records changes.
+SHARD_RECORD_VERSION = 2
+
+# estimated cost of a page, in units of an empty page.
+COLUMN_COST = 0.1
+CODE_CHARS_PER_COST = 2000
+
+
+@dataclass(frozen=True)
+class Shard:
+    # 1 based, as in `--shard 1/4`
+    index: int
+    count: int
+
+    def __post_init__(self):
+        if self.count < 1:
+            raise ValueError(f"shard count must be positive: {self.count}")
+        if not 1 <= self.index <= self.count:
+            raise ValueError(f"shard index must be between 1 and {self.count}: {self.index}")
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    @property
+    def record_path(self) -> Path:
+        return Path(SHARD_DIR_NAME) / f"shard_{self.index}_of_{self.count}.json"
+
+
+def parse_shard(text: str) -> Shard:
+    """
+    parse `i/N`, e.g. 2/4 for the second of 4 shards
+    """
+    index, sep, count = text.partition("/")
+    if not sep:
+        raise ValueError(f"Invalid shard: {text}. Expected i/N, e.g. 1/4")
+    return Shard(int(index), int(count))
+
+
+def page_cost(project: DocsProject, node_id: str) -> float:
+    parsed_json = project.parsed_json
+    if node_id.startswith("macro."):
+        return 1 + len(parsed_json.macros[node_id].macro_sql) / CODE_CHARS_PER_COST
+    if node_id.startswith("test."):
+        test_data = parsed_json.tests[node_id]
+        return 1 + (len(test_data.raw_code) + len(test_data.compiled_code)) / CODE_CHARS_PER_COST
+    if node_id.startswith("source."):
+        return 1 + len(parsed_json.sources[node_id].columns) * COLUMN_COST
+    node_data = parsed_json.nodes[node_id]
+    code_size = len(node_data.raw_code) + len(node_data.compiled_code)
+    return 1 + len(node_data.columns) * COLUMN_COST + code_size / CODE_CHARS_PER_COST
+
+
+def assign_shards(costs: dict[str, float], count: int) -> list[list[str]]:
+    """
+    Split node ids into count shards of about the same total cost.
+    Ties are broken by node id and shard index, so the result does not depend on the order of costs.
+    """
+    shards: list[list[str]] = [[] for _ in range(count)]
+    # (total cost, shard index) of every shard, the least loaded on top.
+    loads_heap = [(0.0, i) for i in range(count)]
+    heapify(loads_heap)
+    for node_id in sorted(costs.keys(), key=lambda node_id: (-costs[node_id], node_id)):
+        total, i = loads_heap[0]
+        shards[i].append(node_id)
+        heapreplace(loads_heap, (total + costs[node_id], i))
+    return shards
+
+
+def shard_node_ids(project: DocsProject, shard: Shard) -> list[str]:
+    """
+    node ids of the pages of shard, in the order of project.node_ids().
+    """
+    node_ids = project.node_ids()
+    costs = {node_id: page_cost(project, node_id) for node_id in node_ids}
+    selected = set(assign_shards(costs, shard.count)[shard.index - 1])
+    return [node_id for node_id in node_ids if node_id in selected]
+
+
+def dump_shard_record(shard: Shard, output_index: OutputIndex, total_pages: int) -> str:
+    record = {
+        "version": SHARD_RECORD_VERSION,
+        "shard": shard.index,
+        "count": shard.count,
+        "total_pages": total_pages,
+        "files": output_index.files,
+    }
+    return dumps(record, ensure_ascii=False)
+
+
+def merge_shards(output_dir_path: str | Path) -> int:
+    """
+    Write the index pages and files.json of every shard recorded in output_dir_path, and return the number of pages.
+    Raise ValueError if a shard is missing or the records are of different exports.
+    """
+    from .output_sink import DirectorySink
+
+    output_dir_path = Path(output_dir_path)
+    records = [loads(p.read_text()) for p in sorted((output_dir_path / SHARD_DIR_NAME).glob("shard_*_of_*.json"))]
+    if not records:
+        raise ValueError(f"No shard records in {output_dir_path / SHARD_DIR_NAME}")
+    if any(record.get("version") != SHARD_RECORD_VERSION for record in records):
+        raise ValueError(f"Shard records of another version in {output_dir_path / SHARD_DIR_NAME}")
+    count = records[0]["count"]
+    total_pages = records[0]["total_pages"]
+    if any(record["count"] != count or record["total_pages"] != total_pages for record in records):
+        raise ValueError("Shard records are of exports with different shard counts or projects")
+    missing = sorted(set(range(1, count + 1)) - {record["shard"] for record in records})
+    if missing:
+        raise ValueError(f"Missing shards: {', '.join(f'{i}/{count}' for i in missing)}")
+
+    output_index = OutputIndex()
+    for record in records:
+        output_index.files.update(record["files"])
+    n_pages = sum(1 for entry in output_index.files.values() if entry["kind"] == PAGE)
+    if n_pages != total_pages:
+        raise ValueError(f"Shards have {n_pages} pages, expected {total_pages}")
+    output_index.write(DirectorySink(output_dir_path))
+    return n_pages
@@ -0,0 +1,226 @@
+"""
+Load manifest.json and catalog.json incrementally.
+
+json.load keeps the whole document (and its decoded dict) in memory, which is several GB for a large manifest.
+This module walks the top level object with a chunked reader and decodes one node entry at a time,
+so peak memory depends on the largest single entry rather than on the file size.
+"""
+
+from __future__ import annotations
+
+from json import JSONDecodeError, JSONDecoder
+from pathlib import Path
+from re import compile
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TextIO
+
+from .build_parsed_data import (
+    build_macro_data,
+    build_models_data,
+    build_parsed_json,
+    build_source_data,
+    build_test_data,
+)
+from .join import CatalogIndex
+from .selector import filter_selected, select_node_ids, selector_attributes
+
+if TYPE_CHECKING:
+    from .data_model import ParsedJson
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = compile(r"[ \t\n\r]*")
+# characters which can continue a number
+NUMBER_CHARS = frozenset(".eE+-0123456789")
+
+
+class JsonObjectStream:
+    """
+    Cursor over a JSON document that decodes object members one by one.
+
+    Iterate object members with `keys()`, and read the value under the cursor with `value()` or `items()`.
+    A value that is not read by the caller is skipped entry by entry before the next key is returned.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        # absolute offset of self._buf[0] in the document
+        self._offset = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(size)
+        if chunk == "":
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                raise JSONDecodeError("Unexpected end of document", self._buf, self._pos)
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    def _tell(self) -> int:
+        return self._offset + self._pos
+
+    def value(self) -> Any:
+        """
+        decode the whole value under the cursor
+        """
+        self._peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except JSONDecodeError:
+                # value continues past the buffer. grow geometrically so large entries stay linear.
+                if not self._fill(max(self._chunk_size, len(self._buf))):
+                    raise
+                continue
+            # a number may be cut at the buffer end, e.g. "1687512345." or "2.5e", and decode as a shorter one.
+            # decode it again with more data while nothing but whitespace or number characters follow it.
+            rest = WHITESPACE.match(self._buf, end).end()
+            if (rest == len(self._buf) or self._buf[end] in NUMBER_CHARS) and self._fill(self._chunk_size):
+                continue
+            self._pos = end
+            return obj
+
+    def skip(self):
+        """
+        discard the value under the cursor without decoding it as a whole
+        """
+        if self._peek() == "{":
+            for _ in self.keys():
+                pass
+        else:
+            self.value()
+
+    def keys(self) -> Iterator[str]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self.value()
+            self._expect(":")
+            self._peek()
+            value_start = self._tell()
+            yield key
+            if self._tell() == value_start:
+                self.skip()
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        for key in self.keys():
+            yield key, self.value()
+
+
+def _load_catalog_streaming(catalog_json_path: str | Path) -> dict[str, dict[str, dict]]:
+    """
+    keep only the catalog fields used for rendering, that is owner and columns.
+    """
+    catalog = {"nodes": {}, "sources": {}}
+    with open(catalog_json_path) as f:
+        stream = JsonObjectStream(f)
+        for top_level_key in stream.keys():
+            if top_level_key not in catalog:
+                continue
+            for k, catalog_data in stream.items():
+                catalog[top_level_key][k] = {
+                    "metadata": {"owner": catalog_data["metadata"]["owner"]},
+                    "columns": catalog_data["columns"],
+                }
+    return catalog
+
+
+def _select_node_ids_streaming(
+    manifest_json_path: str | Path, select: Optional[list[str]], exclude: Optional[list[str]]
+) -> set[str]:
+    """
+    first pass over manifest.json which keeps only selector attributes and child_map.
+    """
+    node_attributes = {}
+    child_map = {}
+    with open(manifest_json_path) as f:
+        stream = JsonObjectStream(f)
+        for top_level_key in stream.keys():
+            if top_level_key in ("nodes", "sources", "macros"):
+                for k, manifest_data in stream.items():
+                    node_attributes[k] = selector_attributes(k, manifest_data)
+            elif top_level_key == "child_map":
+                child_map = dict(stream.items())
+    return select_node_ids(select, exclude, node_attributes, child_map)
+
+
+def load_parsed_json_streaming(
+    manifest_json_path: str | Path,
+    catalog_json_path: str | Path,
+    strict: bool = False,
+    select: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+) -> ParsedJson:
+    # selection needs child_map at the end of manifest.json, so it is resolved in a separate pass.
+    selected = _select_node_ids_streaming(manifest_json_path, select, exclude) if select or exclude else None
+    catalog_index = CatalogIndex(_load_catalog_streaming(catalog_json_path))
+
+    parsed_json_dict = {
+        "nodes": {},
+        "tests": {},
+        "macros": {},
+        "sources": {},
+        "parent_map": {},
+        "child_map": {},
+    }
+    with open(manifest_json_path) as f:
+        stream = JsonObjectStream(f)
+        for top_level_key in stream.keys():
+            if top_level_key == "nodes":
+                for k in stream.keys():
+                    if selected is not None and k not in selected:
+                        continue
+                    if k.startswith("model.") or k.startswith("seed."):
+                        parsed_json_dict["nodes"][k] = build_models_data(stream.value(), catalog_index.get(k), strict)
+                    elif k.startswith("test."):
+                        parsed_json_dict["tests"][k] = build_test_data(stream.value(), strict)
+
+            elif top_level_key == "macros":
+                for k in stream.keys():
+                    # dbt-docs ignores dbt default macro. skip the body without building it.
+                    if selected is not None and k not in selected:
+                        continue
+                    if k.startswith("macro.") and not k.startswith("macro.dbt."):
+                        parsed_json_dict["macros"][k] = build_macro_data(stream.value(), strict)
+
+            elif top_level_key == "sources":
+                for k in stream.keys():
+                    if selected is not None and k not in selected:
+                        continue
+                    if k.startswith("source."):
+                        parsed_json_dict["sources"][k] = build_source_data(stream.value(), catalog_index.get(k), strict)
+
+            elif top_level_key in ("parent_map", "child_map"):
+                parsed_json_dict[top_level_key] = filter_selected(dict(stream.items()), selected)
+
+    catalog_index.report_unmatched()
+    return build_parsed_json(parsed_json_dict, strict)
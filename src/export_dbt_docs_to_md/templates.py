@@ -0,0 +1,273 @@
+"""
+Page templates for markdown rendering.
+
+Each template is dedented and parsed once at load time, and rendered by joining
+its literal parts and field values, instead of running dedent and str.format on every page.
+Templates use str.format style `{field}` placeholders without format spec or conversion.
+
+Custom layouts can be supplied as files in a template dir. The file name is the template name (e.g. model.md,
+seed.md, source.md, test.md, macro.md, column_row.md, column_page.md), and missing files fall back to the default.
+"""
+
+from hashlib import sha256
+from pathlib import Path
+from string import Formatter
+from textwrap import dedent
+from typing import Any, Optional
+
+TEMPLATE_NAMES = ("model", "seed", "source", "test", "macro", "column_row", "column_page")
+
+
+class PageTemplate:
+    def __init__(self, source: str, name: str = "template"):
+        """
+        name is used in errors, e.g. the template file name.
+        """
+        self.source = source
+        self.name = name
+        self._pieces: list[tuple[str, Optional[str]]] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if field_name is not None and (not field_name.isidentifier() or format_spec or conversion):
+                raise ValueError(f"Invalid field {{{field_name}}} in {name}, expected a {{field}} without format spec")
+            self._pieces.append((literal, field_name))
+
+    @property
+    def field_names(self) -> list[str]:
+        return [field_name for _, field_name in self._pieces if field_name is not None]
+
+    def render(self, **values: Any) -> str:
+        parts = []
+        try:
+            for literal, field_name in self._pieces:
+                parts.append(literal)
+                if field_name is not None:
+                    parts.append(str(values[field_name]))
+        except KeyError as e:
+            raise ValueError(
+                f"Unknown field {{{e.args[0]}}} in {self.name}, available fields: {', '.join(sorted(values))}"
+            ) from None
+        return "".join(parts)
+
+    def __reduce__(self):
+        # compiled pieces are rebuilt in a worker process.
+        return (PageTemplate, (self.source, self.name))
+
+
+MODEL_TEMPLATE = dedent(
+    """
+    # {table_name}
+    {materialized}
+
+    ## Details
+    | TAGS   | OWNER   | TYPE    | PACKAGE   | LANGUAGE   | RELATION   |
+    | ---    | ---     | ---     | ---       | ---        | ---        |
+    | {tags} | {owner} | {type_} | {package} | {language} | {relation} |
+
+    ## Description
+    {description}
+
+    ## Columns
+    | COLUMN | TYPE | DESCRIPTION | TESTS |
+    | ---    | ---  | ---         | ---   |
+    {formatted_column_info}
+
+    ## Referenced By
+    | Models                 | Tests                 |
+    | ---                    | ---                   |
+    | {referenced_by_models} | {referenced_by_tests} |
+
+    ## Depends On
+    | Models |
+    | ---    |
+    | {depends_on} |
+
+    ## Lineage
+    | Upstream   | Downstream   |
+    | ---        | ---          |
+    | {upstream} | {downstream} |
+    {lineage_diagram}
+    ## Code
+    ### Source
+    ```sql
+    {raw_code}
+    ```
+    ### Compiled
+    ```sql
+    {compiled_code}
+    ```
+    """
+)
+
+
+SEED_TEMPLATE = dedent(
+    """
+    # {table_name}
+    {materialized}
+
+    ## Details
+    | TAGS   | OWNER   | TYPE    | PACKAGE   | LANGUAGE   | RELATION   |
+    | ---    | ---     | ---     | ---       | ---        | ---        |
+    | {tags} | {owner} | {type_} | {package} | {language} | {relation} |
+
+    ## Description
+    {description}
+
+    ## Columns
+    | COLUMN | TYPE | DESCRIPTION | TESTS |
+    | ---    | ---  | ---         | ---   |
+    {formatted_column_info}
+
+    ## Code
+    ### Example SQL
+    ```sql
+    select
+        {columns}
+    from {database}.{schema}.{table_name}
+    ```
+    """
+)
+
+
+SOURCE_TEMPLATE = dedent(
+    """
+    # {table_name}
+    {resource_type} table
+
+    ## Details
+    | TAGS   | OWNER   | TYPE  | PACKAGE   | RELATION   | LOADER   | SOURCE        |
+    | ---    | ---     | ---   | ---       | ---        | ---      | ---           |
+    | {tags} | {owner} | table | {package} | {relation} | {loader} | {source_name} |
+
+    ## Description
+    {description}
+
+    ## Columns
+    | COLUMN | TYPE | DESCRIPTION | TESTS |
+    | ---    | ---  | ---         | ---   |
+    {formatted_column_info}
+
+    ## Referenced By
+    | Models                 | Tests                 |
+    | ---                    | ---                   |
+    | {referenced_by_models} | {referenced_by_tests} |
+    {lineage_diagram}
+    ## Code
+    ### Sample SQL
+    ```sql
+    select
+        {columns}
+    from {database}.{schema}.{table_name}
+    ```
+    """
+)
+
+
+TEST_TEMPLATE = dedent(
+    """
+    # {test_name}
+    {materialized}
+
+    ## Description
+    {description}
+
+    ## Depends On
+    | Models |
+    | ---    |
+    | {depends_on} |
+
+    ## Code
+    ### Source
+    ```sql
+    {raw_code}
+    ```
+    ### Compiled
+    ```sql
+    {compiled_code}
+    ```
+    """
+)
+
+
+MACRO_TEMPLATE = dedent(
+    """
+    # {macro_name}
+    {resource_type}
+
+    ## Description
+    {description}
+
+    ## Arguments
+    {arguments}
+
+    ## Referenced By
+    | Models          | Macros                 |
+    | ---             | ---                    |
+    | {referenced_by} | {referenced_by_macros} |
+
+    ## Depends On
+    | Models              | Macros              |
+    | ---                 | ---                 |
+    | {depends_on_models} | {depends_on_macros} |
+
+    ## Code
+    ### Source
+    ```sql
+    {macro_sql}
+    ```
+    """
+)
+
+
+COLUMN_ROW_TEMPLATE = "| {name} | {type_} | {description} | {test} |\n"
+
+
+# sidecar page of the columns of a wide table, see column_table.py
+COLUMN_PAGE_TEMPLATE = dedent(
+    """
+    # {table_name}
+    Columns {first_column} to {last_column} of {n_columns}, back to [{table_name}]({page})
+
+    ## Columns
+    | COLUMN | TYPE | DESCRIPTION | TESTS |
+    | ---    | ---  | ---         | ---   |
+    {formatted_column_info}
+    """
+)
+
+DEFAULT_TEMPLATES = {
+    "model": PageTemplate(MODEL_TEMPLATE, "default model template"),
+    "seed": PageTemplate(SEED_TEMPLATE, "default seed template"),
+    "source": PageTemplate(SOURCE_TEMPLATE, "default source template"),
+    "test": PageTemplate(TEST_TEMPLATE, "default test template"),
+    "macro": PageTemplate(MACRO_TEMPLATE, "default macro template"),
+    "column_row": PageTemplate(COLUMN_ROW_TEMPLATE, "default column_row template"),
+    "column_page": PageTemplate(COLUMN_PAGE_TEMPLATE, "column_page_template"),
+}
+
+
+def load_templates(template_dir_path: Optional[str | Path] = None) -> dict[str, PageTemplate]:
+    """
+    load <name>.md in template_dir_path over the default templates.
+    """
+    templates = dict(DEFAULT_TEMPLATES)
+    if template_dir_path is None:
+        return templates
+
+    template_dir_path = Path(template_dir_path)
+    if not template_dir_path.is_dir():
+        raise FileNotFoundError(f"Template dir is not found: {template_dir_path}")
+    for name in TEMPLATE_NAMES:
+        template_file_path = template_dir_path / f"{name}.md"
+        if template_file_path.exists():
+            templates[name] = PageTemplate(template_file_path.read_text(), str(template_file_path))
+    return templates
+
+
+def templates_fingerprint(templates: dict[str, PageTemplate]) -> str:
+    """
+    hash of the template sources, so that pages are rendered again when a template changes.
+    """
+    digest = sha256()
+    for name in sorted(templates.keys()):
+        digest.update(f"{name}\0{templates[name].source}\0".encode())
+    return digest.hexdigest()
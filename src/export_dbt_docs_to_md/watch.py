@@ -0,0 +1,229 @@
+"""
+Watch manifest.json and catalog.json, and re-render only the pages affected by a change.
+
+The decoded artifacts and built nodes of the last export stay in memory. On a change, nodes whose entries are
+unchanged are reused (see build_parsed_json_from_artifacts), and pages are re-rendered only for
+- changed, added nodes and nodes whose child_map entry changed (referenced by),
+- tables whose column tests changed, macros used by changed nodes or macros,
+- models whose upstream/downstream lineage changed, i.e. around a changed edge between tables.
+Pages of removed nodes are deleted. Files are polled by mtime and size, so no extra dependency is needed.
+"""
+
+from __future__ import annotations
+
+import sys
+from os import stat_result
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .api import (
+    DocsProject,
+    attach_tests,
+    build_parsed_json_from_artifacts,
+    build_test_parent_map,
+    is_table_node,
+    load_artifacts,
+)
+from .column_table import FULL_COLUMN_TABLE, ColumnTable
+from .lineage_diagram import LineageDiagram
+from .format_parsed_data import page_sidecar_paths
+from .output_sink import DirectorySink
+from .parallel_render import write_pages
+from .search_index import SEARCH_INDEX_FILE_NAME, build_search_index, dump_search_index
+from .templates import load_templates
+
+if TYPE_CHECKING:
+    from .data_model import ParsedJson
+
+
+def _signature(file_path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat: stat_result = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _clear_column_tests(parsed_json: ParsedJson):
+    # reused nodes keep the tests attached by the previous export.
+    for node_map in (parsed_json.nodes, parsed_json.sources):
+        for node_data in node_map.values():
+            for column in node_data.columns.values():
+                column.test.clear()
+
+
+def _changed_ids(old_map: dict[str, Any], new_map: dict[str, Any]) -> set[str]:
+    # unchanged nodes are the same objects, see build_parsed_json_from_artifacts
+    changed = {k for k, v in new_map.items() if old_map.get(k) is not v}
+    changed.update(old_map.keys() - new_map.keys())
+    return changed
+
+
+class Watcher:
+    def __init__(
+        self,
+        manifest_json_path: str | Path,
+        catalog_json_path: str | Path,
+        output_dir_path: str | Path,
+        jobs: int = 1,
+        template_dir_path: Optional[str | Path] = None,
+        strict: bool = False,
+        select: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        json_backend: Optional[str] = None,
+        search_index: bool = False,
+        column_table: ColumnTable = FULL_COLUMN_TABLE,
+        lineage_diagram: Optional[LineageDiagram] = None,
+    ):
+        self.manifest_json_path = Path(manifest_json_path)
+        self.catalog_json_path = Path(catalog_json_path)
+        self.sink = DirectorySink(output_dir_path)
+        self.jobs = jobs
+        self.templates = load_templates(template_dir_path)
+        self.build_kwargs = {"strict": strict, "select": select, "exclude": exclude}
+        self.json_backend = json_backend
+        self.search_index = search_index
+        self.column_table = column_table
+        self.lineage_diagram = lineage_diagram
+
+        self.artifacts: Optional[tuple[Any, Any]] = None
+        self.project: Optional[DocsProject] = None
+        # written page and its column sidecar files per node id, to delete pages of removed nodes.
+        self.file_paths: dict[str, list[Path]] = {}
+        self._signatures = self._current_signatures()
+
+    def _current_signatures(self) -> tuple:
+        return _signature(self.manifest_json_path), _signature(self.catalog_json_path)
+
+    def _write(self, node_ids: list[str]) -> int:
+        pages = [self.project.page(node_id) for node_id in node_ids]
+        with self.sink:
+            written = write_pages(
+                pages, self.sink, jobs=self.jobs, templates=self.templates, column_table=self.column_table
+            )
+            for page in written:
+                file_paths = [page.file_path, *page_sidecar_paths(page, self.column_table)]
+                # sidecar files which the page no longer has
+                for stale_path in set(self.file_paths.get(page.node_id, [])) - set(file_paths):
+                    (self.sink.output_dir_path / stale_path).unlink(missing_ok=True)
+                self.file_paths[page.node_id] = file_paths
+            if self.search_index:
+                self.sink.write(Path(SEARCH_INDEX_FILE_NAME), dump_search_index(build_search_index(self.project)))
+        return len(pages)
+
+    def export(self) -> int:
+        """
+        build every node and render every page, return the number of rendered pages.
+        """
+        manifest_json, catalog_json = load_artifacts(self.manifest_json_path, self.catalog_json_path, self.json_backend)
+        parsed_json = build_parsed_json_from_artifacts(manifest_json, catalog_json, **self.build_kwargs)
+        self.artifacts = manifest_json, catalog_json
+        self.project = DocsProject(
+            parsed_json, self.templates, column_table=self.column_table, lineage_diagram=self.lineage_diagram
+        )
+        return self._write(self.project.node_ids())
+
+    def _affected_node_ids(self, old_project: DocsProject, new_project: DocsProject) -> set[str]:
+        old_json, new_json = old_project.parsed_json, new_project.parsed_json
+        changed_nodes = _changed_ids(old_json.nodes, new_json.nodes) | _changed_ids(old_json.sources, new_json.sources)
+        changed_tests = _changed_ids(old_json.tests, new_json.tests)
+        changed_macros = _changed_ids(old_json.macros, new_json.macros)
+        affected = changed_nodes | changed_tests | changed_macros
+
+        # referenced by of parents, and lineage around changed edges between tables.
+        lineage_seeds = set()
+        for k in old_json.child_map.keys() | new_json.child_map.keys():
+            old_children, new_children = old_json.child_map.get(k, []), new_json.child_map.get(k, [])
+            if old_children == new_children:
+                continue
+            affected.add(k)
+            changed_table_children = {c for c in set(old_children) ^ set(new_children) if is_table_node(c)}
+            if changed_table_children or k not in old_json.child_map or k not in new_json.child_map:
+                lineage_seeds.add(k)
+                lineage_seeds.update(changed_table_children)
+        for project in (old_project, new_project):
+            affected.update(lineage_seeds)
+            affected.update(project.lineage.upstream_all(lineage_seeds))
+            affected.update(project.lineage.downstream_all(lineage_seeds))
+
+            # tables of changed column tests
+            for test_node in changed_tests:
+                affected.update(project.test_parent_map.get(test_node, []))
+            # macros referenced by changed nodes and macros
+            for node_id in changed_nodes | changed_macros:
+                affected.update(p for p in project.lineage.parents(node_id) if p.startswith("macro."))
+        return affected
+
+    def update(self) -> tuple[int, int]:
+        """
+        re-render pages affected by changes of the artifacts, return the numbers of rendered and removed pages.
+        """
+        manifest_json, catalog_json = load_artifacts(self.manifest_json_path, self.catalog_json_path, self.json_backend)
+        old_project = self.project
+        parsed_json = build_parsed_json_from_artifacts(
+            manifest_json, catalog_json, **self.build_kwargs, previous=(*self.artifacts, old_project.parsed_json)
+        )
+        _clear_column_tests(parsed_json)
+        test_parent_map = build_test_parent_map(parsed_json)
+        attach_tests(parsed_json, test_parent_map)
+        new_project = DocsProject(parsed_json, self.templates, test_parent_map, self.column_table, self.lineage_diagram)
+
+        affected = self._affected_node_ids(old_project, new_project)
+        self.artifacts = manifest_json, catalog_json
+        self.project = new_project
+
+        page_node_ids = new_project.node_ids()
+        removed = self.file_paths.keys() - set(page_node_ids)
+        for node_id in removed:
+            for file_path in self.file_paths.pop(node_id):
+                (self.sink.output_dir_path / file_path).unlink(missing_ok=True)
+        return self._write([node_id for node_id in page_node_ids if node_id in affected]), len(removed)
+
+    def changed(self) -> bool:
+        signatures = self._current_signatures()
+        if signatures == self._signatures:
+            return False
+        self._signatures = signatures
+        return True
+
+    def run(self, interval: float = 0.5, log: Callable[[str], None] = print):
+        """
+        export once, then poll the artifacts every interval seconds until interrupted.
+        """
+        start = perf_counter()
+        log(f"Rendered {self.export()} pages in {perf_counter() - start:.2f} s, watching for changes")
+        while True:
+            sleep(interval)
+            if not self.changed():
+                continue
+            # dbt writes manifest.json and catalog.json one after another, wait until both are written.
+            while True:
+                sleep(interval)
+                if not self.changed():
+                    break
+            start = perf_counter()
+            try:
+                rendered, removed = self.update()
+            except (OSError, ValueError, KeyError) as e:
+                # e.g. a half written file, the next change is tried again.
+                print(f"Failed to update: {e!r}", file=sys.stderr)
+                continue
+            log(f"Rendered {rendered} pages and removed {removed} pages in {perf_counter() - start:.2f} s")
+
+
+def watch(
+    manifest_json_path: str | Path,
+    catalog_json_path: str | Path,
+    output_dir_path: str | Path,
+    interval: float = 0.5,
+    **watcher_kwargs: Any,
+):
+    """
+    see Watcher for watcher_kwargs
+    """
+    watcher = Watcher(manifest_json_path, catalog_json_path, output_dir_path, **watcher_kwargs)
+    try:
+        watcher.run(interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,159 @@
+"""
+Bounded producer/consumer pipeline between rendering and writing.
+
+Rendered pages are put on a bounded queue and writer threads drain it in batches, so rendering and blocking writes
+overlap and the total time approaches max(render, write) instead of their sum.
+put() blocks while the queue is full (backpressure), so at most queue_size rendered pages are held in memory.
+Files whose content is unchanged are not written again, which keeps their mtime for doc site builders.
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Optional
+from warnings import warn
+
+from .output_sink import OutputSink
+
+DEFAULT_QUEUE_SIZE = 256
+# pages taken from the queue at once by a writer
+BATCH_SIZE = 32
+_DONE = object()
+
+
+@dataclass
+class WriterStats:
+    pages_written: int = 0
+    pages_unchanged: int = 0
+    bytes_written: int = 0
+    # summed over the writer threads
+    write_seconds: float = 0.0
+    # time the producer was blocked on a full queue
+    wait_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.pages_written + self.pages_unchanged) / self.elapsed_seconds
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_written / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "pages_per_second": self.pages_per_second, "bytes_per_second": self.bytes_per_second}
+
+
+class WriterPipeline:
+    def __init__(
+        self,
+        sink: OutputSink,
+        writers: int = 1,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        skip_unchanged: bool = True,
+    ):
+        """
+        A sink which is not thread safe (e.g. archives) is written by a single writer in the order of put().
+        """
+        self.sink = sink
+        self.writers = max(1, writers) if sink.thread_safe else 1
+        self.skip_unchanged = skip_unchanged
+        self.stats = WriterStats()
+        self._queue: Queue = Queue(maxsize=max(1, queue_size))
+        self._lock = Lock()
+        self._error: Optional[BaseException] = None
+        self._threads: list[Thread] = []
+        self._start = 0.0
+
+    def start(self):
+        self._start = perf_counter()
+        self._threads = [Thread(target=self._run, daemon=True) for _ in range(self.writers)]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, relative_path: Path, markdown_str: str):
+        """
+        Queue a page to write, blocking while the queue is full. Raise the error of a failed write, if any.
+        """
+        if self._error is not None:
+            raise self._error
+        try:
+            self._queue.put_nowait((relative_path, markdown_str))
+        except Full:
+            wait_start = perf_counter()
+            self._queue.put((relative_path, markdown_str))
+            self.stats.wait_seconds += perf_counter() - wait_start
+
+    def close(self):
+        """
+        Wait until every queued page is written. Raise the error of a failed write, if any.
+        """
+        if not self._threads:
+            return
+        for _ in self._threads:
+            self._queue.put(_DONE)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.stats.elapsed_seconds = perf_counter() - self._start
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "WriterPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+            return
+        # the error of the producer is raised, a write error is reported as a warning instead of hiding it.
+        try:
+            self.close()
+        except Exception as e:
+            warn(f"Writing pages failed too: {e!r}", stacklevel=2)
+
+    def _write_batch(self, batch: list[tuple[Path, str]]):
+        written = unchanged = n_bytes = 0
+        start = perf_counter()
+        for relative_path, markdown_str in batch:
+            if self._error is not None:
+                # keep draining the queue so that the producer is not blocked forever.
+                continue
+            try:
+                if self.skip_unchanged and self.sink.is_unchanged(relative_path, markdown_str):
+                    unchanged += 1
+                    continue
+                self.sink.write(relative_path, markdown_str)
+            except BaseException as e:
+                self._error = e
+                continue
+            written += 1
+            n_bytes += len(markdown_str.encode())
+        elapsed = perf_counter() - start
+        with self._lock:
+            self.stats.pages_written += written
+            self.stats.pages_unchanged += unchanged
+            self.stats.bytes_written += n_bytes
+            self.stats.write_seconds += elapsed
+
+    def _run(self):
+        while True:
+            batch = []
+            item = self._queue.get()
+            while item is not _DONE:
+                batch.append(item)
+                if len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+            self._write_batch(batch)
+            # each writer gets one _DONE, which is queued after every page.
+            if item is _DONE:
+                return
@@ -0,0 +1,36 @@
+from json import dump
+from pathlib import Path
+
+import pytest
+from synthetic import generate
+
+
+def write_json(path: Path, obj: dict) -> Path:
+    with open(path, mode="w") as f:
+        dump(obj, f)
+    return path
+
+
+def read_tree(dir_path: Path) -> dict[str, bytes]:
+    """
+    content of every file under dir_path by relative path
+    """
+    return {p.relative_to(dir_path).as_posix(): p.read_bytes() for p in sorted(dir_path.rglob("*")) if p.is_file()}
+
+
+@pytest.fixture
+def artifacts() -> tuple[dict, dict]:
+    """
+    (manifest_json, catalog_json) of a small synthetic project with float timestamps as dbt writes them.
+    """
+    manifest_json, catalog_json = generate(60, n_columns=4, tests_per_column=0.5, n_macros=5)
+    for i, entry in enumerate([*manifest_json["nodes"].values(), *manifest_json["macros"].values()]):
+        entry["created_at"] = 1687512345.123456 + i
+        entry["config"] = {**entry.get("config", {}), "score": -2.5e-3 * i}
+    return manifest_json, catalog_json
+
+
+@pytest.fixture
+def artifact_paths(tmp_path: Path, artifacts: tuple[dict, dict]) -> tuple[Path, Path]:
+    manifest_json, catalog_json = artifacts
+    return write_json(tmp_path / "manifest.json", manifest_json), write_json(tmp_path / "catalog.json", catalog_json)
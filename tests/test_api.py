@@ -0,0 +1,78 @@
+import pytest
+
+from export_dbt_docs_to_md import DocsProject, parse_docs_data, render_pages
+from export_dbt_docs_to_md.column_table import ColumnTable
+
+from conftest import read_tree, write_json
+
+
+def add_relationships_test(manifest_json: dict, parents: list[str], column_name: str) -> str:
+    """
+    add a column test with several parents, as dbt writes a relationships test, and return its node id
+    """
+    test_node = "test.synthetic.relationships_model_30_column_0__column_0__ref_model_31_.5a2f1c9e0b"
+    template = next(v for k, v in manifest_json["nodes"].items() if k.startswith("test."))
+    manifest_json["nodes"][test_node] = {
+        **template,
+        "unique_id": test_node,
+        "name": test_node.split(".")[2],
+        "depends_on": {"macros": ["macro.dbt.test_relationships"], "nodes": parents},
+        "column_name": column_name,
+        "test_metadata": {"name": "relationships", "kwargs": {"column_name": column_name}, "namespace": None},
+    }
+    manifest_json["parent_map"][test_node] = parents
+    manifest_json["child_map"][test_node] = []
+    for parent in parents:
+        manifest_json["child_map"][parent].append(test_node)
+    return test_node
+
+
+def test_test_with_several_parents_is_rendered_once(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    parents = ["model.synthetic.model_30", "model.synthetic.model_31"]
+    test_node = add_relationships_test(manifest_json, parents, "column_0")
+    manifest_json_path = write_json(tmp_path / "manifest.json", manifest_json)
+    catalog_json_path = write_json(tmp_path / "catalog.json", catalog_json)
+
+    project = DocsProject.load(manifest_json_path, catalog_json_path)
+    assert project.test_parent_map[test_node] == parents
+    assert project.node_ids().count(test_node) == 1
+
+    rendered_count = parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "output")
+    assert rendered_count["test"] == len(project.test_parent_map)
+    tree = read_tree(tmp_path / "output")
+    test_pages = [k for k in tree if k.startswith("tests/") and test_node.split(".")[2] in k]
+    assert len(test_pages) == 1
+    # the test is attached to the column of every parent
+    for parent in parents:
+        column = project.parsed_json.nodes[parent].columns["column_0"]
+        assert "relationships" in column.test
+
+
+def test_render_matches_the_exported_pages(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "output")
+    tree = read_tree(tmp_path / "output")
+    project = DocsProject.load(*artifact_paths)
+    for node_id in project.node_ids():
+        relative_path, markdown_str = project.render(node_id)
+        assert tree[relative_path] == markdown_str.encode(), node_id
+
+
+def test_pages_and_render_pages_match_the_export(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "output", column_table=ColumnTable("split", 2))
+    tree = read_tree(tmp_path / "output")
+    project = DocsProject.load(*artifact_paths, column_table=ColumnTable("split", 2))
+    pages = {relative_path: markdown_str.encode() for relative_path, markdown_str in project.pages()}
+    # column sidecar files are rendered too
+    assert any(".columns." in relative_path for relative_path in pages)
+    assert pages == tree
+    rendered = render_pages(*artifact_paths, column_table=ColumnTable("split", 2))
+    assert {relative_path: markdown_str.encode() for relative_path, markdown_str in rendered} == tree
+
+
+def test_render_of_a_node_without_page(artifacts):
+    project = DocsProject.load(*artifacts)
+    with pytest.raises(KeyError):
+        project.render("model.synthetic.no_such_model")
+    with pytest.raises(KeyError):
+        project.render("macro.dbt.test_not_null")
@@ -0,0 +1,118 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from export_dbt_docs_to_md import DocsProject, api, cache
+from export_dbt_docs_to_md.cache import CACHE_SUFFIX, ParsedJsonCache
+
+from conftest import write_json
+
+
+@pytest.fixture
+def decode_count(monkeypatch) -> list[int]:
+    """
+    number of times manifest.json and catalog.json are decoded
+    """
+    count = [0]
+    load_artifacts = api.load_artifacts
+
+    def counting_load_artifacts(*args, **kwargs):
+        count[0] += 1
+        return load_artifacts(*args, **kwargs)
+
+    monkeypatch.setattr(api, "load_artifacts", counting_load_artifacts)
+    return count
+
+
+def test_hit_skips_decoding(tmp_path, artifact_paths, decode_count):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    built = DocsProject.load(*artifact_paths, cache=parsed_json_cache)
+    cached = DocsProject.load(*artifact_paths, cache=parsed_json_cache)
+    assert decode_count[0] == 1
+    assert cached.parsed_json == built.parsed_json
+    assert cached.render("model.synthetic.model_30") == built.render("model.synthetic.model_30")
+
+
+def test_edited_input_misses(tmp_path, artifacts, artifact_paths, decode_count):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    DocsProject.load(*artifact_paths, cache=parsed_json_cache)
+    manifest_json, _ = artifacts
+    manifest_json["nodes"]["model.synthetic.model_30"]["description"] = "edited"
+    write_json(artifact_paths[0], manifest_json)
+    project = DocsProject.load(*artifact_paths, cache=parsed_json_cache)
+    assert decode_count[0] == 2
+    assert project.parsed_json.nodes["model.synthetic.model_30"].description == "edited"
+
+
+def test_version_and_options_are_part_of_the_key(tmp_path, artifact_paths, monkeypatch):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    key = parsed_json_cache.key(*artifact_paths, strict=False, select=None, exclude=None)
+    assert parsed_json_cache.key(*artifact_paths, strict=False, select=None, exclude=None) == key
+    assert parsed_json_cache.key(*artifact_paths, strict=True, select=None, exclude=None) != key
+    assert parsed_json_cache.key(*artifact_paths, strict=False, select=["tag:a"], exclude=None) != key
+    monkeypatch.setattr(cache, "CACHE_VERSION", cache.CACHE_VERSION + 1)
+    assert parsed_json_cache.key(*artifact_paths, strict=False, select=None, exclude=None) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(cache, "tool_version", lambda: "0.0.0-other")
+    assert parsed_json_cache.key(*artifact_paths, strict=False, select=None, exclude=None) != key
+
+
+def test_selection_is_cached_separately(tmp_path, artifact_paths, decode_count):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    everything = DocsProject.load(*artifact_paths, cache=parsed_json_cache)
+    selected = DocsProject.load(*artifact_paths, cache=parsed_json_cache, select=["model_30"])
+    assert decode_count[0] == 2
+    assert set(selected.parsed_json.nodes.keys()) == {"model.synthetic.model_30"}
+    assert len(everything.parsed_json.nodes) > 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, artifact_paths):
+    parsed_json = api.load_parsed_json(*artifact_paths)
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    parsed_json_cache.put("a", parsed_json)
+    entry_size = (tmp_path / "cache" / f"a{CACHE_SUFFIX}").stat().st_size
+    parsed_json_cache.max_bytes = entry_size * 2
+    parsed_json_cache.put("b", parsed_json)
+    # a is used after b, so b is the least recently used one
+    for i, key in enumerate(("b", "a")):
+        os.utime(tmp_path / "cache" / f"{key}{CACHE_SUFFIX}", (1_000_000 + i, 1_000_000 + i))
+    parsed_json_cache.put("c", parsed_json)
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == [f"a{CACHE_SUFFIX}", f"c{CACHE_SUFFIX}"]
+    assert parsed_json_cache.get("b") is None
+    assert parsed_json_cache.get("a") == parsed_json
+
+
+def test_entry_larger_than_the_cache_is_kept(tmp_path, artifact_paths):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache", max_bytes=1)
+    parsed_json_cache.put("a", api.load_parsed_json(*artifact_paths))
+    assert (tmp_path / "cache" / f"a{CACHE_SUFFIX}").exists()
+
+
+def test_failed_put_leaves_no_temp_file(tmp_path, monkeypatch):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+
+    def failing_dump(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache.pickle, "dump", failing_dump)
+    with pytest.raises(OSError, match="disk full"):
+        parsed_json_cache.put("a", object())
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_broken_entry_is_built_again(tmp_path):
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / f"a{CACHE_SUFFIX}").write_bytes(b"truncated")
+    assert parsed_json_cache.get("a") is None
+    assert not (tmp_path / "cache" / f"a{CACHE_SUFFIX}").exists()
+
+
+def test_parallel_puts_of_the_same_key(tmp_path, artifact_paths):
+    parsed_json = api.load_parsed_json(*artifact_paths)
+    parsed_json_cache = ParsedJsonCache(tmp_path / "cache")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: parsed_json_cache.put("a", parsed_json), range(8)))
+    assert [p.name for p in (tmp_path / "cache").iterdir()] == [f"a{CACHE_SUFFIX}"]
+    assert parsed_json_cache.get("a") == parsed_json
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.export_dbt_docs_to_md import main, read_batch_file
+
+from conftest import read_tree
+
+# modules which only an export needs
+HEAVY_MODULES = [
+    "pydantic",
+    "concurrent.futures.process",
+    "export_dbt_docs_to_md.api",
+    "export_dbt_docs_to_md.build_parsed_data",
+    "export_dbt_docs_to_md.format_parsed_data",
+]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--incremental"],
+        ["--index_pages"],
+        ["--stream"],
+        ["--cache_dir", "cache"],
+        ["--profile", "profile.json"],
+        ["--pstats", "export.pstats"],
+        ["-o", "docs.zip"],
+        ["-o", "docs.tar.gz"],
+    ],
+)
+def test_watch_rejects_unsupported_options(monkeypatch, capsys, options: list[str]):
+    monkeypatch.setattr(sys, "argv", ["export_dbt_docs_to_md", "-m", "m.json", "-c", "c.json", "--watch", *options])
+    with pytest.raises(SystemExit) as e:
+        main()
+    assert e.value.code == 2
+    assert "--watch" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("options", [["--help"], ["-o", "docs"], ["-m", "m.json", "-c", "c.json", "--jobs", "x"]])
+def test_help_and_argument_errors_do_not_import_the_exporter(options: list[str]):
+    code = (
+        "import sys\n"
+        "from export_dbt_docs_to_md.export_dbt_docs_to_md import main\n"
+        f"sys.argv = ['export_dbt_docs_to_md', *{options!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(*sorted(set({HEAVY_MODULES!r}) & set(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1] / "src")}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == ""
+
+
+def test_batch(tmp_path, monkeypatch, capsys, artifact_paths):
+    manifest_json_path, catalog_json_path = artifact_paths
+    batch_file_path = tmp_path / "batch.txt"
+    batch_file_path.write_text(
+        "# manifest.json catalog.json output_dir\n"
+        f"{manifest_json_path} {catalog_json_path} {tmp_path / 'a'}\n"
+        "\n"
+        f"{manifest_json_path} {catalog_json_path} '{tmp_path / 'b c'}'\n"
+    )
+    monkeypatch.setattr(sys, "argv", ["export_dbt_docs_to_md", "--batch", str(batch_file_path)])
+    main()
+    assert capsys.readouterr().out.count("Rendered ") == 2
+
+    parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "expected")
+    assert read_tree(tmp_path / "a") == read_tree(tmp_path / "b c") == read_tree(tmp_path / "expected")
+
+
+def test_batch_file_with_a_missing_field(tmp_path):
+    batch_file_path = tmp_path / "batch.txt"
+    batch_file_path.write_text("m.json c.json docs\nm.json c.json\n")
+    with pytest.raises(ValueError, match="batch.txt:2: expected manifest.json catalog.json output_dir"):
+        read_batch_file(batch_file_path)
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.column_table import ColumnSidecar, ColumnTable, column_sidecars, select_list
+
+from conftest import read_tree, write_json
+
+MODEL_DIR = Path("synthetic/model/synthetic")
+
+
+def column_rows(markdown_str: str) -> list[str]:
+    return [line.split("|")[1].strip() for line in markdown_str.splitlines() if line.startswith("| column_")]
+
+
+def test_invalid_column_table():
+    with pytest.raises(ValueError, match="Invalid column table strategy: wide"):
+        ColumnTable("wide")
+    with pytest.raises(ValueError, match="max_columns must be positive"):
+        ColumnTable("split", 0)
+
+
+def test_column_sidecars():
+    page_file_path = MODEL_DIR / "model_30.md"
+    assert column_sidecars(page_file_path, 7, ColumnTable()) == []
+    assert column_sidecars(page_file_path, 3, ColumnTable("split", 3)) == []
+    assert column_sidecars(page_file_path, 7, ColumnTable("truncate", 3)) == [
+        ColumnSidecar(MODEL_DIR / "model_30.columns.md", 0, 7)
+    ]
+    assert column_sidecars(page_file_path, 7, ColumnTable("split", 3)) == [
+        ColumnSidecar(MODEL_DIR / "model_30.columns.2.md", 3, 6),
+        ColumnSidecar(MODEL_DIR / "model_30.columns.3.md", 6, 7),
+    ]
+
+
+def test_select_list():
+    column_names = ["a", "b", "c"]
+    assert select_list(column_names, ColumnTable("truncate", 3)) == "a,\n    b,\n    c"
+    assert select_list(column_names, ColumnTable("split", 2)) == "a,\n    b\n    -- and 1 more columns"
+
+
+def test_truncate(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "output", column_table=ColumnTable("truncate", 3))
+    page = (tmp_path / "output" / MODEL_DIR / "model_30.md").read_text()
+    assert column_rows(page) == ["column_0", "column_1", "column_2"]
+    assert "| &hellip; | &nbsp; | 1 more columns, see [model_30.columns.md](model_30.columns.md) |" in page
+
+    sidecar = (tmp_path / "output" / MODEL_DIR / "model_30.columns.md").read_text()
+    assert "# model_30\nColumns 1 to 4 of 4, back to [model_30](model_30.md)\n" in sidecar
+    assert column_rows(sidecar) == ["column_0", "column_1", "column_2", "column_3"]
+    # the sample SQL of seeds lists the first columns only
+    seed_page = (tmp_path / "output" / "synthetic/seed/synthetic/seed_7.md").read_text()
+    assert "column_2\n    -- and 1 more columns" in seed_page
+    # macro and test pages have no column table
+    sidecars = [p for p in read_tree(tmp_path / "output") if ".columns." in p]
+    assert {p.split("/")[1] for p in sidecars} == {"model", "seed", "source"}
+
+
+def test_split(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "output", column_table=ColumnTable("split", 1))
+    page = (tmp_path / "output" / MODEL_DIR / "model_30.md").read_text()
+    assert column_rows(page) == ["column_0"]
+    links = ", ".join(f"[model_30.columns.{part}.md](model_30.columns.{part}.md)" for part in (2, 3, 4))
+    assert f"3 more columns, see {links} |" in page
+    for part in (2, 3, 4):
+        sidecar = (tmp_path / "output" / MODEL_DIR / f"model_30.columns.{part}.md").read_text()
+        assert f"Columns {part} to {part} of 4" in sidecar
+        assert column_rows(sidecar) == [f"column_{part - 1}"]
+    assert not (tmp_path / "output" / MODEL_DIR / "model_30.columns.5.md").exists()
+
+
+def test_incremental_export_deletes_stale_sidecars(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    manifest_json_path = write_json(tmp_path / "manifest.json", manifest_json)
+    catalog_json_path = write_json(tmp_path / "catalog.json", catalog_json)
+    column_table = ColumnTable("split", 1)
+    parse_docs_data(
+        manifest_json_path, catalog_json_path, tmp_path / "output", incremental=True, column_table=column_table
+    )
+    assert (tmp_path / "output" / MODEL_DIR / "model_30.columns.4.md").exists()
+
+    # model_30 drops two columns, so it has two sidecar files less
+    for column_name in ("column_2", "column_3"):
+        manifest_json["nodes"]["model.synthetic.model_30"]["columns"].pop(column_name)
+        catalog_json["nodes"]["model.synthetic.model_30"]["columns"].pop(column_name)
+    write_json(manifest_json_path, manifest_json)
+    write_json(catalog_json_path, catalog_json)
+    rendered = parse_docs_data(
+        manifest_json_path, catalog_json_path, tmp_path / "output", incremental=True, column_table=column_table
+    )
+    assert rendered["model"] == 1
+    sidecars = sorted(p.name for p in (tmp_path / "output" / MODEL_DIR).glob("model_30.columns.*"))
+    assert sidecars == ["model_30.columns.2.md"]
+
+    parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "full", column_table=column_table)
+    incremental_tree = read_tree(tmp_path / "output")
+    incremental_tree.pop(".export_dbt_docs_to_md_state.json")
+    assert incremental_tree == read_tree(tmp_path / "full")
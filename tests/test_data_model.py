@@ -0,0 +1,22 @@
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.api import load_parsed_json
+from export_dbt_docs_to_md.compact_data_model import ManifestData
+
+from conftest import read_tree
+
+
+def test_compact_and_strict_models_render_the_same_pages(tmp_path, artifact_paths):
+    pytest.importorskip("pydantic")
+    parse_docs_data(*artifact_paths, tmp_path / "compact")
+    parse_docs_data(*artifact_paths, tmp_path / "strict", strict=True)
+    assert read_tree(tmp_path / "strict") == read_tree(tmp_path / "compact")
+
+
+def test_compact_nodes_have_no_instance_dict(artifact_paths):
+    parsed_json = load_parsed_json(*artifact_paths)
+    node_data = parsed_json.nodes["model.synthetic.model_30"]
+    assert isinstance(node_data, ManifestData)
+    # slots keep per node memory low on huge projects
+    assert not hasattr(node_data, "__dict__")
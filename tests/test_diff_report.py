@@ -0,0 +1,59 @@
+from copy import deepcopy
+from json import loads
+
+from conftest import write_json
+
+from export_dbt_docs_to_md.diff_report import diff_artifacts, dump_changelog, render_changelog_markdown
+
+
+def test_diff_artifacts(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    new_manifest_json, new_catalog_json = deepcopy(manifest_json), deepcopy(catalog_json)
+    model = "model.synthetic.model_30"
+    new_manifest_json["nodes"][model]["description"] = "new description"
+    new_manifest_json["nodes"][model]["raw_code"] += "\n-- changed"
+    new_catalog_json["nodes"][model]["columns"]["column_0"]["type"] = "NUMERIC"
+    del new_catalog_json["nodes"][model]["columns"]["column_1"]
+    new_manifest_json["macros"]["macro.synthetic.macro_5"] = {
+        **manifest_json["macros"]["macro.synthetic.macro_4"],
+        "unique_id": "macro.synthetic.macro_5",
+        "name": "macro_5",
+    }
+    del new_manifest_json["macros"]["macro.synthetic.macro_0"]
+    # snapshots are not exported, so they are not compared either
+    new_manifest_json["nodes"]["snapshot.synthetic.snapshot_0"] = {
+        **manifest_json["nodes"][model],
+        "unique_id": "snapshot.synthetic.snapshot_0",
+        "resource_type": "snapshot",
+    }
+
+    changelog = diff_artifacts(
+        write_json(tmp_path / "old_manifest.json", manifest_json),
+        write_json(tmp_path / "old_catalog.json", catalog_json),
+        write_json(tmp_path / "new_manifest.json", new_manifest_json),
+        write_json(tmp_path / "new_catalog.json", new_catalog_json),
+    )
+    assert changelog["added"] == [{"node_id": "macro.synthetic.macro_5", "resource_type": "macro"}]
+    assert changelog["removed"] == [{"node_id": "macro.synthetic.macro_0", "resource_type": "macro"}]
+    assert [entry["node_id"] for entry in changelog["changed"]] == [model]
+    changes = changelog["changed"][0]["changes"]
+    old_description = manifest_json["nodes"][model]["description"]
+    assert {"change": "description", "old": old_description, "new": "new description"} in changes
+    assert {"change": "code"} in changes
+    assert {"change": "column_type", "column": "column_0", "old": "STRING", "new": "NUMERIC"} in changes
+    assert {"change": "column_removed", "column": "column_1", "type": "INT64"} in changes
+    assert changelog["summary"] == {
+        "macro": {"added": 1, "removed": 1, "changed": 0},
+        "model": {"added": 0, "removed": 0, "changed": 1},
+    }
+
+    assert loads(dump_changelog(changelog)) == changelog
+    markdown_str = render_changelog_markdown(changelog)
+    assert f"### {model}" in markdown_str
+    assert "column `column_0` type: `STRING` → `NUMERIC`" in markdown_str
+
+
+def test_diff_of_same_artifacts_is_empty(artifact_paths):
+    changelog = diff_artifacts(*artifact_paths, *artifact_paths)
+    assert changelog["added"] == changelog["removed"] == changelog["changed"] == []
+    assert "| &nbsp; | 0 | 0 | 0 |" in render_changelog_markdown(changelog)
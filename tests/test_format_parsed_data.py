@@ -0,0 +1,35 @@
+import pytest
+
+from export_dbt_docs_to_md import DocsProject
+
+
+def details_row(markdown_str: str) -> list[str]:
+    """
+    cells of the row under the Details header
+    """
+    lines = markdown_str.splitlines()
+    header = next(i for i, line in enumerate(lines) if line.startswith("| TAGS"))
+    return [cell.strip() for cell in lines[header + 2].strip("|").split("|")]
+
+
+@pytest.mark.parametrize(
+    "node_id", ["model.synthetic.model_30", "seed.synthetic.seed_7", "source.synthetic.raw.source_0"]
+)
+def test_missing_owner_renders_as_nbsp(artifacts, node_id):
+    manifest_json, catalog_json = artifacts
+    catalog_key = "sources" if node_id.startswith("source.") else "nodes"
+    # a null owner in catalog.json, and no catalog.json entry at all
+    catalog_json[catalog_key][node_id]["metadata"]["owner"] = None
+    _, markdown_str = DocsProject.load(manifest_json, catalog_json).render(node_id)
+    assert details_row(markdown_str)[1] == "&nbsp;"
+
+    del catalog_json[catalog_key][node_id]
+    with pytest.warns(UserWarning, match="not in catalog.json"):
+        _, markdown_str = DocsProject.load(manifest_json, catalog_json).render(node_id)
+    assert details_row(markdown_str)[1] == "&nbsp;"
+    assert "None" not in details_row(markdown_str)
+
+
+def test_owner_renders_as_is(artifacts):
+    _, markdown_str = DocsProject.load(*artifacts).render("model.synthetic.model_30")
+    assert details_row(markdown_str)[1] == "owner"
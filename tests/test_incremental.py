@@ -0,0 +1,74 @@
+from export_dbt_docs_to_md import parse_docs_data
+
+from conftest import read_tree, write_json
+
+
+def export(tmp_path, manifest_json, catalog_json, **kwargs):
+    manifest_json_path = write_json(tmp_path / "manifest.json", manifest_json)
+    catalog_json_path = write_json(tmp_path / "catalog.json", catalog_json)
+    return parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "output", incremental=True, **kwargs)
+
+
+def test_rerun_renders_nothing(tmp_path, artifacts):
+    first = export(tmp_path, *artifacts)
+    assert sum(first.values()) > 0
+    assert sum(export(tmp_path, *artifacts).values()) == 0
+
+
+def test_changed_node_is_rendered_again(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    export(tmp_path, manifest_json, catalog_json)
+    manifest_json["nodes"]["model.synthetic.model_59"]["description"] = "changed"
+    rendered = export(tmp_path, manifest_json, catalog_json)
+    assert rendered["model"] == 1
+    assert "changed" in (tmp_path / "output/synthetic/model/synthetic/model_59.md").read_text()
+
+
+def test_incremental_output_equals_full_export(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    export(tmp_path, manifest_json, catalog_json)
+    manifest_json["nodes"]["model.synthetic.model_30"]["description"] = "changed"
+    export(tmp_path, manifest_json, catalog_json)
+    parse_docs_data(tmp_path / "manifest.json", tmp_path / "catalog.json", tmp_path / "full")
+    incremental_tree = read_tree(tmp_path / "output")
+    incremental_tree.pop(".export_dbt_docs_to_md_state.json")
+    assert incremental_tree == read_tree(tmp_path / "full")
+
+
+def test_pages_of_removed_nodes_are_pruned(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    export(tmp_path, manifest_json, catalog_json)
+    page_path = tmp_path / "output/synthetic/model/synthetic/model_59.md"
+    assert page_path.exists()
+    del manifest_json["nodes"]["model.synthetic.model_59"]
+    for children in manifest_json["child_map"].values():
+        if "model.synthetic.model_59" in children:
+            children.remove("model.synthetic.model_59")
+    manifest_json["child_map"].pop("model.synthetic.model_59")
+    export(tmp_path, manifest_json, catalog_json)
+    assert not page_path.exists()
+
+
+def test_page_of_renamed_test_id_is_kept(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    export(tmp_path, manifest_json, catalog_json)
+    # dbt changes the hash suffix of a test id, e.g. when its arguments change, but not its page name.
+    old_id = next(k for k, v in manifest_json["nodes"].items() if k.startswith("test.") and v["column_name"])
+    new_id = old_id.rsplit(".", 1)[0] + ".ffffffffff"
+    manifest_json["nodes"][new_id] = {**manifest_json["nodes"].pop(old_id), "unique_id": new_id}
+    for children in manifest_json["child_map"].values():
+        children[:] = [new_id if child == old_id else child for child in children]
+    manifest_json["child_map"][new_id] = manifest_json["child_map"].pop(old_id)
+    export(tmp_path, manifest_json, catalog_json)
+    page_name = old_id.rsplit(".", 1)[0].split(".", 1)[1].replace(".", "/")
+    assert (tmp_path / "output/tests/test" / f"{page_name}.md").exists()
+
+
+def test_changed_template_renders_every_page_again(tmp_path, artifacts):
+    template_dir_path = tmp_path / "templates"
+    template_dir_path.mkdir()
+    first = export(tmp_path, *artifacts, template_dir_path=template_dir_path)
+    (template_dir_path / "macro.md").write_text("# {macro_name}\n")
+    rendered = export(tmp_path, *artifacts, template_dir_path=template_dir_path)
+    assert rendered == first
+    assert (tmp_path / "output/synthetic/macro/synthetic/macro_0.md").read_text() == "# macro_0\n"
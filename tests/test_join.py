@@ -0,0 +1,87 @@
+import warnings
+
+import pytest
+
+from export_dbt_docs_to_md import stream_loader
+from export_dbt_docs_to_md.api import build_parsed_json_from_artifacts
+from export_dbt_docs_to_md.join import MAX_REPORTED_NODES, CatalogIndex
+
+from conftest import write_json
+
+
+def test_nodes_and_sources_are_joined(artifacts):
+    _, catalog_json = artifacts
+    catalog_index = CatalogIndex(catalog_json)
+    assert catalog_index.get("model.synthetic.model_30") is catalog_json["nodes"]["model.synthetic.model_30"]
+    assert (
+        catalog_index.get("source.synthetic.raw.source_0") is catalog_json["sources"]["source.synthetic.raw.source_0"]
+    )
+    assert catalog_index.unmatched == []
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        catalog_index.report_unmatched()
+
+
+def test_empty_catalog():
+    catalog_index = CatalogIndex({"nodes": None})
+    assert catalog_index.get("model.p.a") is None
+    assert catalog_index.unmatched == ["model.p.a"]
+
+
+def test_unmatched_nodes_are_reported_once():
+    catalog_index = CatalogIndex({"nodes": {}, "sources": {}})
+    node_ids = [f"model.p.m{i}" for i in range(MAX_REPORTED_NODES + 2)]
+    for node_id in node_ids:
+        assert catalog_index.get(node_id) is None
+    with pytest.warns(UserWarning) as record:
+        catalog_index.report_unmatched()
+    assert len(record) == 1
+    message = str(record[0].message)
+    assert message.startswith(f"{len(node_ids)} nodes are not in catalog.json")
+    assert ", ".join(node_ids[:MAX_REPORTED_NODES]) in message
+    assert node_ids[MAX_REPORTED_NODES] not in message
+    assert message.endswith(" and 2 more")
+
+
+def test_unmatched_nodes_are_built_from_manifest(artifacts):
+    manifest_json, catalog_json = artifacts
+    del catalog_json["nodes"]["model.synthetic.model_30"]
+    del catalog_json["sources"]["source.synthetic.raw.source_0"]
+    with pytest.warns(UserWarning, match="2 nodes are not in catalog.json") as record:
+        parsed_json = build_parsed_json_from_artifacts(manifest_json, catalog_json)
+    assert "model.synthetic.model_30" in str(record[0].message)
+    assert "source.synthetic.raw.source_0" in str(record[0].message)
+
+    node_data = parsed_json.nodes["model.synthetic.model_30"]
+    assert node_data.owner is None
+    # columns documented in manifest.json, in their order and without a type
+    manifest_columns = manifest_json["nodes"]["model.synthetic.model_30"]["columns"]
+    assert list(node_data.columns.keys()) == list(manifest_columns.keys())
+    for index, column in enumerate(node_data.columns.values(), start=1):
+        assert column.index == str(index)
+        assert column.type_ == ""
+        assert column.description_from_manifest == manifest_columns[column.name]["description"]
+    # matched nodes still take their columns and owner from catalog.json
+    assert parsed_json.nodes["model.synthetic.model_31"].owner == "owner"
+    assert parsed_json.nodes["model.synthetic.model_31"].columns["column_1"].type_ == "INT64"
+
+
+def test_catalog_entries_without_node_are_ignored(artifacts):
+    manifest_json, catalog_json = artifacts
+    catalog_json["nodes"]["model.synthetic.dropped"] = catalog_json["nodes"]["model.synthetic.model_30"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        parsed_json = build_parsed_json_from_artifacts(manifest_json, catalog_json)
+    assert "model.synthetic.dropped" not in parsed_json.nodes
+
+
+def test_streaming_loader_reports_alike(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    del catalog_json["nodes"]["model.synthetic.model_30"]
+    manifest_json_path = write_json(tmp_path / "manifest.json", manifest_json)
+    catalog_json_path = write_json(tmp_path / "catalog.json", catalog_json)
+    message = "1 nodes are not in catalog.json, built from manifest.json: model.synthetic.model_30$"
+    with pytest.warns(UserWarning, match=message):
+        streamed = stream_loader.load_parsed_json_streaming(manifest_json_path, catalog_json_path)
+    with pytest.warns(UserWarning, match="not in catalog.json"):
+        assert streamed == build_parsed_json_from_artifacts(manifest_json, catalog_json)
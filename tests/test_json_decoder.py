@@ -0,0 +1,59 @@
+from importlib.util import find_spec
+
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.api import load_parsed_json
+from export_dbt_docs_to_md.json_decoder import JSON_BACKENDS, load_json, resolve_backend
+
+from conftest import read_tree, write_json
+
+BACKENDS = [
+    pytest.param(backend, marks=pytest.mark.skipif(find_spec(backend) is None, reason=f"{backend} is not installed"))
+    for backend in JSON_BACKENDS
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_render_the_same_pages(tmp_path, artifact_paths, backend):
+    parse_docs_data(*artifact_paths, tmp_path / "json", json_backend="json")
+    parse_docs_data(*artifact_paths, tmp_path / backend, json_backend=backend)
+    assert read_tree(tmp_path / backend) == read_tree(tmp_path / "json")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("field", ["description", "compiled_code", "test_metadata"])
+def test_backends_reject_missing_fields_alike(tmp_path, artifacts, backend, field):
+    manifest_json, catalog_json = artifacts
+    node_id = next(k for k, v in manifest_json["nodes"].items() if field in v)
+    del manifest_json["nodes"][node_id][field]
+    manifest_json_path = write_json(tmp_path / "manifest.json", manifest_json)
+    catalog_json_path = write_json(tmp_path / "catalog.json", catalog_json)
+    with pytest.raises(KeyError, match=field):
+        parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "output", json_backend=backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_build_the_same_parsed_json(artifact_paths, backend):
+    parsed_json = load_parsed_json(*artifact_paths, json_backend=backend)
+    assert parsed_json == load_parsed_json(*artifact_paths, json_backend="json")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_mapped_file_is_decoded_like_json_load(tmp_path, artifacts, backend):
+    manifest_json, _ = artifacts
+    # decoded as plain dicts without a struct type
+    assert load_json(write_json(tmp_path / "manifest.json", manifest_json), backend) == manifest_json
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_empty_file_fails_to_decode(tmp_path, backend):
+    (tmp_path / "empty.json").write_text("")
+    # an empty file can not be memory-mapped, the decoder raises its own error.
+    with pytest.raises(ValueError):
+        load_json(tmp_path / "empty.json", backend)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Invalid json backend"):
+        resolve_backend("simplejson")
@@ -0,0 +1,78 @@
+from export_dbt_docs_to_md import DocsProject
+from export_dbt_docs_to_md.api import load_parsed_json
+from export_dbt_docs_to_md.lineage import LineageIndex
+
+# a -> b -> d and a -> c -> d, with a test of d
+DIAMOND = [
+    ("model.p.a", "model.p.b"),
+    ("model.p.a", "model.p.c"),
+    ("model.p.b", "model.p.d"),
+    ("model.p.c", "model.p.d"),
+    ("model.p.d", "test.p.not_null_d_id.0123456789"),
+]
+CHAIN = [
+    ("source.p.raw.s", "seed.p.x"),
+    ("seed.p.x", "model.p.m1"),
+    ("model.p.m1", "model.p.m2"),
+    ("model.p.m2", "model.p.m3"),
+]
+
+
+def index(edges: list[tuple[str, str]]) -> LineageIndex:
+    return LineageIndex([node_id for edge in edges for node_id in edge], edges)
+
+
+def test_diamond():
+    lineage = index(DIAMOND)
+    assert sorted(lineage.upstream("model.p.d")) == ["model.p.a", "model.p.b", "model.p.c"]
+    # tests are not tables, so they are not part of the lineage
+    assert sorted(lineage.downstream("model.p.a")) == ["model.p.b", "model.p.c", "model.p.d"]
+    assert sorted(lineage.downstream("model.p.a", resource_types=None)) == [
+        "model.p.b",
+        "model.p.c",
+        "model.p.d",
+        "test.p.not_null_d_id.0123456789",
+    ]
+    assert sorted(lineage.parents("model.p.d")) == ["model.p.b", "model.p.c"]
+    assert sorted(lineage.children("model.p.a")) == ["model.p.b", "model.p.c"]
+    assert lineage.upstream("model.p.a") == []
+
+
+def test_duplicate_edges_are_kept_once():
+    lineage = index([*DIAMOND, ("model.p.a", "model.p.b")])
+    assert sorted(lineage.children("model.p.a")) == ["model.p.b", "model.p.c"]
+
+
+def test_chain():
+    lineage = index(CHAIN)
+    assert lineage.upstream("model.p.m3") == ["model.p.m2", "model.p.m1", "seed.p.x", "source.p.raw.s"]
+    assert lineage.downstream("source.p.raw.s") == ["seed.p.x", "model.p.m1", "model.p.m2", "model.p.m3"]
+    assert lineage.upstream_all(["model.p.m3"], depth=2) == ["model.p.m2", "model.p.m1"]
+    # the start nodes are excluded even if they are downstream of each other
+    assert sorted(lineage.downstream_all(["seed.p.x", "model.p.m2"])) == ["model.p.m1", "model.p.m3"]
+
+
+def test_unknown_node():
+    lineage = index(CHAIN)
+    assert lineage.children("model.p.unknown") == []
+    assert lineage.parents("model.p.unknown") == []
+    assert lineage.upstream("model.p.unknown") == []
+
+
+def test_macros_through_depends_on(artifact_paths):
+    parsed_json = load_parsed_json(*artifact_paths)
+    lineage = LineageIndex.from_parsed_json(parsed_json)
+    models = sorted(parsed_json.nodes.keys())
+    # every synthetic model and seed uses macro_0, and macro_i uses macro_(i + 1)
+    assert sorted(lineage.children("macro.synthetic.macro_0")) == models
+    assert lineage.parents("macro.synthetic.macro_0") == ["macro.synthetic.macro_1"]
+    assert sorted(lineage.downstream("macro.synthetic.macro_2", resource_types=("macro",))) == [
+        "macro.synthetic.macro_0",
+        "macro.synthetic.macro_1",
+    ]
+
+    page = DocsProject.load(*artifact_paths).page("macro.synthetic.macro_0")
+    assert page.referenced_by["models"] == "<br>".join(model.replace(".", "/") for model in models)
+    assert page.referenced_by["macros"] == "&nbsp;"
+    page = DocsProject.load(*artifact_paths).page("macro.synthetic.macro_1")
+    assert page.referenced_by["macros"] == "macro/synthetic/macro_0"
@@ -0,0 +1,127 @@
+import pytest
+from bench_templates import legacy_render_models_data, sample_model
+
+from export_dbt_docs_to_md import DocsProject
+from export_dbt_docs_to_md.format_parsed_data import render_models_data
+from export_dbt_docs_to_md.lineage import LineageIndex
+from export_dbt_docs_to_md.lineage_diagram import DOWNSTREAM, UPSTREAM, LineageDiagram, LineageDiagramBuilder
+
+# source -> a -> b -> c, a -> d, with a test of b
+EDGES = [
+    ("source.p.raw.s", "model.p.a"),
+    ("model.p.a", "model.p.b"),
+    ("model.p.b", "model.p.c"),
+    ("model.p.a", "model.p.d"),
+    ("model.p.b", "test.p.not_null_b_id.0123456789"),
+]
+
+
+def builder(edges: list[tuple[str, str]], **kwargs) -> LineageDiagramBuilder:
+    lineage = LineageIndex([node_id for edge in edges for node_id in edge], edges)
+    return LineageDiagramBuilder(lineage, LineageDiagram(**kwargs))
+
+
+def section(markdown_str: str, start: str, end: str) -> str:
+    return markdown_str[markdown_str.index(start) : markdown_str.index(end)]
+
+
+def test_invalid_lineage_diagram():
+    with pytest.raises(ValueError, match="Invalid lineage diagram format: svg"):
+        LineageDiagram("svg")
+    with pytest.raises(ValueError, match="depth must be positive"):
+        LineageDiagram(depth=0)
+    with pytest.raises(ValueError, match="max_degree must be positive"):
+        LineageDiagram(max_degree=0)
+
+
+def test_mermaid():
+    assert builder(EDGES, depth=1).render("model.p.b") == "\n".join(
+        [
+            "```mermaid",
+            "graph LR",
+            '    n0["model.p.a"]',
+            '    n1["model.p.b"]',
+            '    n2["model.p.c"]',
+            "    n0 --> n1",
+            "    n1 --> n2",
+            "    style n1 stroke-width:3px",
+            "```",
+        ]
+    )
+
+
+def test_dot():
+    assert builder(EDGES, format="dot").render("model.p.b") == "\n".join(
+        [
+            "```dot",
+            "digraph lineage {",
+            "    rankdir=LR;",
+            '    "model.p.b" [style=bold];',
+            '    "model.p.a" -> "model.p.b";',
+            '    "model.p.b" -> "model.p.c";',
+            '    "source.p.raw.s" -> "model.p.a";',
+            "}",
+            "```",
+        ]
+    )
+
+
+def test_depth():
+    diagram_builder = builder(EDGES, depth=2)
+    assert diagram_builder.subgraph("model.p.c", UPSTREAM, 2).edges == {
+        ("model.p.a", "model.p.b"),
+        ("model.p.b", "model.p.c"),
+    }
+    # tests are not tables, so they are not drawn
+    assert diagram_builder.subgraph("model.p.a", DOWNSTREAM, 2).edges == {
+        ("model.p.a", "model.p.b"),
+        ("model.p.a", "model.p.d"),
+        ("model.p.b", "model.p.c"),
+    }
+    # subgraphs are memoized
+    assert diagram_builder.subgraph("model.p.a", DOWNSTREAM, 2) is diagram_builder.subgraph("model.p.a", DOWNSTREAM, 2)
+
+
+def test_hub_is_collapsed():
+    edges = [(f"model.p.m{i}", "model.p.hub") for i in range(4)] + [("model.p.hub", "model.p.x")]
+    mermaid = builder(edges, max_degree=3).render("model.p.x")
+    assert '    h0(["4 more"])' in mermaid
+    assert "model.p.m0" not in mermaid
+    dot = builder(edges, format="dot", max_degree=3).render("model.p.x")
+    assert '    h0 [label="4 more", shape=plaintext];' in dot
+    assert '    h0 -> "model.p.hub" [style=dashed];' in dot
+    # below max_degree the parents are drawn
+    assert "model.p.m0" in builder(edges, max_degree=4).render("model.p.x")
+
+
+def test_quotes_are_escaped():
+    edges = [('model.p."quoted"', "model.p.a")]
+    assert '["model.p.#quot;quoted#quot;"]' in builder(edges).render("model.p.a")
+    assert '"model.p.\\"quoted\\"" -> "model.p.a";' in builder(edges, format="dot").render("model.p.a")
+
+
+def test_node_without_lineage_has_no_diagram():
+    assert builder(EDGES).render("model.p.unknown") == ""
+
+
+def test_pages(artifacts):
+    without_diagram = DocsProject.load(*artifacts)
+    with_diagram = DocsProject.load(*artifacts, lineage_diagram=LineageDiagram())
+    for node_id in ("model.synthetic.model_30", "source.synthetic.raw.source_0"):
+        _, markdown_str = with_diagram.render(node_id)
+        assert "```mermaid\ngraph LR\n" in markdown_str
+        _, markdown_str = without_diagram.render(node_id)
+        assert "```mermaid" not in markdown_str
+    # seeds, tests and macros have no diagram
+    assert with_diagram.render("seed.synthetic.seed_7") == without_diagram.render("seed.synthetic.seed_7")
+    assert with_diagram.render("macro.synthetic.macro_0") == without_diagram.render("macro.synthetic.macro_0")
+
+
+def test_legacy_template_renders_an_empty_diagram():
+    manifest_data = sample_model(3)
+    referenced_by = {"models": "pkg/model/downstream", "tests": "&nbsp;"}
+    legacy = legacy_render_models_data(manifest_data, referenced_by)
+    assert "{lineage_diagram}" not in legacy
+    assert section(legacy, "## Lineage", "## Code") == section(
+        render_models_data(manifest_data, referenced_by), "## Lineage", "## Code"
+    )
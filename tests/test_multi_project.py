@@ -0,0 +1,59 @@
+import sys
+from copy import deepcopy
+
+import pytest
+from conftest import write_json
+
+from export_dbt_docs_to_md.export_dbt_docs_to_md import main
+from export_dbt_docs_to_md.multi_project import SHARED_DIR_NAME, SHARED_PAGES_FILE_NAME, Project, export_projects
+
+
+def test_package_pages_are_shared_whichever_nodes_refer_to_them(tmp_path, artifacts):
+    manifest_json, catalog_json = artifacts
+    # model_30 of project b does not use macro_0, so the referenced by of macro_0 differs between the projects.
+    manifest_json_b = deepcopy(manifest_json)
+    manifest_json_b["nodes"]["model.synthetic.model_30"]["depends_on"]["macros"] = []
+    catalog_json_path = write_json(tmp_path / "catalog.json", catalog_json)
+    projects = [
+        Project("a", write_json(tmp_path / "a.json", manifest_json), catalog_json_path),
+        Project("b", write_json(tmp_path / "b.json", manifest_json_b), catalog_json_path),
+    ]
+    output_dir = tmp_path / "output"
+    rendered_count = export_projects(projects, output_dir)
+
+    macro_page = output_dir / SHARED_DIR_NAME / "synthetic" / "macro" / "synthetic" / "macro_0.md"
+    assert macro_page.exists()
+    assert "model/synthetic/model_31" not in macro_page.read_text()
+    assert not (output_dir / "a" / "synthetic" / "macro" / "synthetic" / "macro_0.md").exists()
+    # the page of model_30 itself differs
+    assert (output_dir / "a" / "synthetic" / "model" / "synthetic" / "model_30.md").exists()
+    assert (output_dir / "b" / "synthetic" / "model" / "synthetic" / "model_30.md").exists()
+    assert rendered_count["a"] == rendered_count["b"] == 1
+
+    # referenced by of each project are in its shared_pages.md
+    shared_pages_a = (output_dir / "a" / SHARED_PAGES_FILE_NAME).read_text()
+    shared_pages_b = (output_dir / "b" / SHARED_PAGES_FILE_NAME).read_text()
+    macro_row_a = next(line for line in shared_pages_a.splitlines() if line.startswith("| macro.synthetic.macro_0 |"))
+    macro_row_b = next(line for line in shared_pages_b.splitlines() if line.startswith("| macro.synthetic.macro_0 |"))
+    assert "model/synthetic/model_30" in macro_row_a
+    assert "model/synthetic/model_30" not in macro_row_b
+    assert "model/synthetic/model_31" in macro_row_b
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--index_pages"],
+        ["--search_index"],
+        ["--incremental"],
+        ["--stream"],
+        ["--cache_dir", "cache"],
+        ["-o", "docs.zip"],
+    ],
+)
+def test_multi_project_rejects_unsupported_options(monkeypatch, capsys, options: list[str]):
+    monkeypatch.setattr(sys, "argv", ["export_dbt_docs_to_md", "--multi_project", "projects.txt", *options])
+    with pytest.raises(SystemExit) as e:
+        main()
+    assert e.value.code == 2
+    assert "--multi_project" in capsys.readouterr().err
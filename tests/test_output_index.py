@@ -0,0 +1,95 @@
+from collections import Counter
+from hashlib import sha256
+from json import loads
+from pathlib import PurePosixPath
+
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.column_table import ColumnTable
+from export_dbt_docs_to_md.output_index import FILES_MANIFEST_FILE_NAME, FILES_MANIFEST_VERSION, INDEX_FILE_NAME
+
+from conftest import read_tree, write_json
+
+STATE_FILE_NAME = ".export_dbt_docs_to_md_state.json"
+
+
+def export(tmp_path, artifacts, **kwargs):
+    manifest_json_path = write_json(tmp_path / "manifest.json", artifacts[0])
+    catalog_json_path = write_json(tmp_path / "catalog.json", artifacts[1])
+    parse_docs_data(
+        manifest_json_path,
+        catalog_json_path,
+        tmp_path / "output",
+        search_index=True,
+        index_pages=True,
+        column_table=ColumnTable("split", 2),
+        **kwargs,
+    )
+    return read_tree(tmp_path / "output")
+
+
+def table_rows(markdown_str: str) -> list[list[str]]:
+    """
+    cells of the rows under the table header
+    """
+    lines = [line for line in markdown_str.splitlines() if line.startswith("| ")]
+    return [[cell.strip() for cell in line.strip("|").split("|")] for line in lines[2:]]
+
+
+def check_files_manifest(tree: dict[str, bytes]):
+    files_manifest = loads(tree[FILES_MANIFEST_FILE_NAME])
+    assert files_manifest["version"] == FILES_MANIFEST_VERSION
+    files = files_manifest["files"]
+    assert set(files.keys()) == set(tree.keys()) - {FILES_MANIFEST_FILE_NAME, STATE_FILE_NAME}
+    for relative_path, entry in files.items():
+        assert entry["size"] == len(tree[relative_path])
+        assert entry["sha256"] == sha256(tree[relative_path]).hexdigest()
+
+    kinds = Counter(entry["kind"] for entry in files.values())
+    assert kinds["search_index"] == 1
+    assert kinds["sidecar"] == sum(".columns." in relative_path for relative_path in tree)
+    for entry in files.values():
+        assert (entry["node_id"] is not None) == (entry["kind"] in ("page", "sidecar"))
+    return files
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_every_file_is_in_files_json(tmp_path, artifacts, incremental):
+    check_files_manifest(export(tmp_path, artifacts, incremental=incremental))
+    if not incremental:
+        return
+    # pages skipped by the next incremental export keep their entries, changed ones get new entries.
+    artifacts[0]["nodes"]["model.synthetic.model_30"]["description"] = "changed"
+    files = check_files_manifest(export(tmp_path, artifacts, incremental=True))
+    assert files["synthetic/model/synthetic/model_30.md"]["node_id"] == "model.synthetic.model_30"
+
+
+def test_index_page_counts(tmp_path, artifacts):
+    tree = export(tmp_path, artifacts)
+    files = loads(tree[FILES_MANIFEST_FILE_NAME])["files"]
+    pages = [PurePosixPath(relative_path) for relative_path, entry in files.items() if entry["kind"] == "page"]
+    per_package = Counter(page.parts[0] for page in pages)
+    per_resource_type = Counter(page.parts[:2] for page in pages)
+    assert per_package.keys() == {"synthetic", "tests"}
+    assert per_resource_type[("synthetic", "model")] == 48
+    assert per_resource_type[("synthetic", "seed")] == 6
+
+    root_rows = table_rows(tree[INDEX_FILE_NAME].decode())
+    assert root_rows == [
+        [f"[{package}]({package}/{INDEX_FILE_NAME})", str(count)] for package, count in sorted(per_package.items())
+    ]
+    for package in per_package:
+        package_rows = table_rows(tree[f"{package}/{INDEX_FILE_NAME}"].decode())
+        assert package_rows == [
+            [f"[{resource_type}]({resource_type}/{INDEX_FILE_NAME})", str(count)]
+            for (package_dir, resource_type), count in sorted(per_resource_type.items())
+            if package_dir == package
+        ]
+    for (package, resource_type), count in per_resource_type.items():
+        rows = table_rows(tree[f"{package}/{resource_type}/{INDEX_FILE_NAME}"].decode())
+        assert len(rows) == count
+        for node_id, link in rows:
+            path = link[1:].split("]")[0]
+            assert link == f"[{path}]({path})"
+            assert files[f"{package}/{resource_type}/{path}"]["node_id"] == node_id
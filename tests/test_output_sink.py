@@ -0,0 +1,71 @@
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from export_dbt_docs_to_md import DirectorySink, MemorySink, TarSink, ZipSink, open_sink, parse_docs_data
+
+from conftest import read_tree
+
+PAGES = {"pkg/model/pkg/a.md": "# a\n", "pkg/model/pkg/b.md": "# b ✓\n", "tests/test/pkg/t.md": ""}
+
+
+def read_archive(archive_path: Path) -> dict[str, bytes]:
+    if archive_path.name.endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as f:
+            return {name: f.read(name) for name in f.namelist()}
+    with tarfile.open(archive_path) as f:
+        return {member.name: f.extractfile(member).read() for member in f.getmembers()}
+
+
+@pytest.mark.parametrize("file_name", ["out.zip", "out.tar", "out.tar.gz", "out.tgz"])
+def test_archive_round_trip(tmp_path, file_name):
+    archive_path = tmp_path / file_name
+    with open_sink(archive_path) as sink:
+        assert isinstance(sink, ZipSink if file_name.endswith(".zip") else TarSink)
+        for relative_path, markdown_str in PAGES.items():
+            sink.write(Path(relative_path), markdown_str)
+    assert read_archive(archive_path) == {k: v.encode() for k, v in PAGES.items()}
+
+
+@pytest.mark.parametrize("file_name", ["out", "out.zip", "out.tar", "out.tar.gz", "memory"])
+def test_duplicate_file_is_rejected_by_every_sink(tmp_path, file_name):
+    sink = MemorySink() if file_name == "memory" else open_sink(tmp_path / file_name)
+    with sink:
+        sink.write(Path("pkg/model/pkg/a.md"), "# a\n")
+        with pytest.raises(ValueError, match="Duplicate file in output: pkg/model/pkg/a.md"):
+            sink.write(Path("pkg/model/pkg/a.md"), "# overwritten\n")
+
+
+def test_directory_sink_can_be_written_again_once_reopened(tmp_path):
+    sink = DirectorySink(tmp_path / "out")
+    for markdown_str in ("# a\n", "# b\n"):
+        with sink:
+            sink.write(Path("a.md"), markdown_str)
+    assert (tmp_path / "out" / "a.md").read_text() == "# b\n"
+
+
+def test_directory_round_trip(tmp_path):
+    with open_sink(tmp_path / "out") as sink:
+        assert isinstance(sink, DirectorySink)
+        for relative_path, markdown_str in PAGES.items():
+            sink.write(Path(relative_path), markdown_str)
+        assert sink.is_unchanged(Path("pkg/model/pkg/a.md"), "# a\n")
+        assert not sink.is_unchanged(Path("pkg/model/pkg/a.md"), "# changed\n")
+        assert not sink.is_unchanged(Path("missing.md"), "")
+    assert read_tree(tmp_path / "out") == {k: v.encode() for k, v in PAGES.items()}
+
+
+@pytest.mark.parametrize("file_name", ["out.zip", "out.tar.gz"])
+def test_export_to_archive_equals_directory(tmp_path, artifact_paths, file_name):
+    parse_docs_data(*artifact_paths, tmp_path / "out")
+    parse_docs_data(*artifact_paths, tmp_path / file_name)
+    assert read_archive(tmp_path / file_name) == read_tree(tmp_path / "out")
+
+
+def test_export_to_memory_equals_directory(tmp_path, artifact_paths):
+    sink = MemorySink()
+    parse_docs_data(*artifact_paths, tmp_path / "unused", sink=sink)
+    parse_docs_data(*artifact_paths, tmp_path / "out")
+    assert {k: v.encode() for k, v in sink.pages.items()} == read_tree(tmp_path / "out")
@@ -0,0 +1,19 @@
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data
+
+from conftest import read_tree
+
+
+@pytest.mark.parametrize("jobs", [2, 4])
+def test_parallel_export_equals_serial_export(tmp_path, artifact_paths, jobs):
+    parse_docs_data(*artifact_paths, tmp_path / "serial", jobs=1, search_index=True, index_pages=True)
+    parse_docs_data(*artifact_paths, tmp_path / "parallel", jobs=jobs, search_index=True, index_pages=True)
+    assert read_tree(tmp_path / "parallel") == read_tree(tmp_path / "serial")
+
+
+@pytest.mark.parametrize("file_name", ["out.zip", "out.tar"])
+def test_parallel_export_to_archive_is_byte_identical(tmp_path, artifact_paths, file_name):
+    parse_docs_data(*artifact_paths, tmp_path / "serial" / file_name, jobs=1)
+    parse_docs_data(*artifact_paths, tmp_path / "parallel" / file_name, jobs=2)
+    assert (tmp_path / "parallel" / file_name).read_bytes() == (tmp_path / "serial" / file_name).read_bytes()
@@ -0,0 +1,18 @@
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.profiler import Profiler
+
+
+def profile_export(artifact_paths, output_dir_path) -> Profiler:
+    profiler = Profiler(enabled=True)
+    with profiler:
+        parse_docs_data(*artifact_paths, output_dir_path, profiler=profiler)
+    return profiler
+
+
+def test_unchanged_pages_are_not_counted_as_written(tmp_path, artifact_paths):
+    first = profile_export(artifact_paths, tmp_path / "out")
+    assert first.counts["bytes_written"] == first.counts["bytes_rendered"] > 0
+    second = profile_export(artifact_paths, tmp_path / "out")
+    assert second.counts["bytes_rendered"] == first.counts["bytes_rendered"]
+    assert second.counts["bytes_written"] == 0
+    assert second.counts["pages_unchanged"] == second.counts["pages"] + second.counts["column_sidecars"]
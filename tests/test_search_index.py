@@ -0,0 +1,80 @@
+from json import loads
+
+from export_dbt_docs_to_md import DocsProject, parse_docs_data
+from export_dbt_docs_to_md.search_index import (
+    SEARCH_INDEX_FILE_NAME,
+    SEARCH_INDEX_VERSION,
+    build_search_index,
+    search,
+    tokenize,
+)
+
+from conftest import write_json
+
+
+def test_tokenize():
+    assert list(tokenize("Orders of Customer_ID")) == ["orders", "of", "customer_id", "customer", "id"]
+    assert list(tokenize(None)) == []
+    assert list(tokenize("")) == []
+
+
+def test_every_page_is_a_document(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "docs", search_index=True)
+    search_index = loads((tmp_path / "docs" / SEARCH_INDEX_FILE_NAME).read_text())
+    assert search_index["version"] == SEARCH_INDEX_VERSION
+
+    pages = {p.relative_to(tmp_path / "docs").as_posix() for p in (tmp_path / "docs").rglob("*.md")}
+    assert {relative_path for _, _, relative_path, _ in search_index["documents"]} == pages
+    for node_id, resource_type, _, name in search_index["documents"]:
+        assert node_id.startswith(f"{resource_type}.")
+        assert name in node_id
+    # postings are sorted and unique, so a search can intersect them as they are
+    for postings in search_index["terms"].values():
+        assert postings == sorted(set(postings))
+
+
+def test_terms_of_a_model(artifact_paths):
+    search_index = build_search_index(DocsProject.load(*artifact_paths))
+    documents = search_index["documents"]
+    model_30 = next(i for i, document in enumerate(documents) if document[0] == "model.synthetic.model_30")
+    assert documents[model_30] == [
+        "model.synthetic.model_30",
+        "model",
+        "synthetic/model/synthetic/model_30.md",
+        "model_30",
+    ]
+    for term in ("model_30", "model", "30", "owner", "column_0", "column", "description"):
+        assert model_30 in search_index["terms"][term]
+    # test and macro pages have no owner
+    owned = {documents[i][1] for i in search_index["terms"]["owner"]}
+    assert owned == {"model", "seed", "source"}
+
+
+def test_search(artifact_paths):
+    search_index = build_search_index(DocsProject.load(*artifact_paths))
+    assert [document[0] for document in search(search_index, "Model_30")] == ["model.synthetic.model_30"]
+    # every term must match, results are in page order
+    tagged = search(search_index, "tag_1 model")
+    assert tagged
+    assert [document[1] for document in tagged] == ["model"] * len(tagged)
+    assert tagged == sorted(tagged, key=search_index["documents"].index)
+    assert search(search_index, "tag_1 unknown_term") == []
+    assert search(search_index, "  ") == []
+
+
+def test_description_change_is_searchable(tmp_path, artifacts, artifact_paths):
+    manifest_json, _ = artifacts
+    manifest_json["nodes"]["model.synthetic.model_30"]["description"] = "Monthly revenue by region"
+    write_json(artifact_paths[0], manifest_json)
+    search_index = build_search_index(DocsProject.load(*artifact_paths))
+    assert [document[0] for document in search(search_index, "revenue REGION")] == ["model.synthetic.model_30"]
+
+
+def test_selected_node_ids(artifact_paths):
+    project = DocsProject.load(*artifact_paths)
+    search_index = build_search_index(project, ["model.synthetic.model_30", "macro.synthetic.macro_0"])
+    assert [document[0] for document in search_index["documents"]] == [
+        "model.synthetic.model_30",
+        "macro.synthetic.macro_0",
+    ]
+    assert search_index["terms"]["macro_0"] == [1]
@@ -0,0 +1,57 @@
+import pytest
+
+from export_dbt_docs_to_md import DocsProject
+
+
+def selected_tables(artifacts, select=None, exclude=None) -> set[str]:
+    project = DocsProject.load(*artifacts, select=select, exclude=exclude)
+    return {*project.parsed_json.nodes.keys(), *project.parsed_json.sources.keys()}
+
+
+def parents(manifest_json, node_id) -> set[str]:
+    return {p for p in manifest_json["parent_map"][node_id] if not p.startswith("test.")}
+
+
+def children(manifest_json, node_id) -> set[str]:
+    return {c for c in manifest_json["child_map"][node_id] if not c.startswith("test.")}
+
+
+def test_node_name(artifacts):
+    assert selected_tables(artifacts, ["model_59"]) == {"model.synthetic.model_59"}
+
+
+def test_graph_operators(artifacts):
+    manifest_json, _ = artifacts
+    model = "model.synthetic.model_30"
+    assert selected_tables(artifacts, ["1+model_30"]) == {model, *parents(manifest_json, model)}
+    assert selected_tables(artifacts, ["model_30+1"]) == {model, *children(manifest_json, model)}
+
+
+def test_tag_union_intersection_and_exclude(artifacts):
+    manifest_json, _ = artifacts
+    tagged = {k for k, v in manifest_json["nodes"].items() if "tag_1" in v["tags"]}
+    assert tagged
+    assert selected_tables(artifacts, ["tag:tag_1"]) == tagged
+    assert selected_tables(artifacts, ["tag:tag_1 model_30"]) == tagged | {"model.synthetic.model_30"}
+    assert selected_tables(artifacts, ["tag:tag_1,resource_type:seed"]) == set()
+    assert selected_tables(artifacts, ["tag:tag_1"], ["model_31"]) == tagged - {"model.synthetic.model_31"}
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_pages_refer_to_selected_nodes_only(tmp_path, artifact_paths, stream):
+    project = DocsProject.load(*artifact_paths, select=["model_30+"], stream=stream)
+    parsed_json = project.parsed_json
+    selected = {*parsed_json.nodes.keys(), *parsed_json.sources.keys(), *parsed_json.tests.keys()}
+    for node_map in (parsed_json.child_map, parsed_json.parent_map):
+        assert set(node_map.keys()) <= selected
+        assert all(set(node_list) <= selected for node_list in node_map.values())
+
+    # referenced by and lineage are built from the maps, depends on and code are the node's own definition.
+    unselected_paths = [
+        node_id.replace(".", "/")
+        for node_id in ("model.synthetic.model_27", "seed.synthetic.seed_10", "seed.synthetic.seed_7")
+    ]
+    for node_id in project.node_ids():
+        page = project.page(node_id)
+        cells = [*(page.referenced_by or {}).values(), *(page.lineage or {}).values()]
+        assert not any(path in cell for path in unselected_paths for cell in cells), node_id
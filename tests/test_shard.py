@@ -0,0 +1,45 @@
+import pytest
+from conftest import read_tree
+
+from export_dbt_docs_to_md import DocsProject
+from export_dbt_docs_to_md.export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.shard import SHARD_DIR_NAME, Shard, assign_shards, merge_shards, parse_shard, shard_node_ids
+
+
+def test_shards_and_merge_equal_a_single_export(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "single", search_index=True, index_pages=True)
+    for i in range(1, 4):
+        parse_docs_data(*artifact_paths, tmp_path / "sharded", search_index=True, shard=Shard(i, 3))
+    n_pages = merge_shards(tmp_path / "sharded")
+
+    assert n_pages == len(DocsProject.load(*artifact_paths).node_ids())
+    sharded = {k: v for k, v in read_tree(tmp_path / "sharded").items() if not k.startswith(f"{SHARD_DIR_NAME}/")}
+    assert sharded == read_tree(tmp_path / "single")
+
+
+def test_shards_split_every_page_once(artifact_paths):
+    project = DocsProject.load(*artifact_paths)
+    shards = [shard_node_ids(project, Shard(i, 4)) for i in range(1, 5)]
+    assert all(shards)
+    assert sorted(node_id for node_ids in shards for node_id in node_ids) == sorted(project.node_ids())
+
+
+def test_assign_shards_is_deterministic():
+    costs = {f"model.p.model_{i}": 1 + (i % 7) * 0.5 for i in range(50)}
+    shards = assign_shards(costs, 4)
+    assert assign_shards(dict(reversed(list(costs.items()))), 4) == shards
+    totals = [sum(costs[node_id] for node_id in node_ids) for node_ids in shards]
+    assert max(totals) - min(totals) <= max(costs.values())
+
+
+def test_merge_fails_on_a_missing_shard(tmp_path, artifact_paths):
+    for i in (1, 3):
+        parse_docs_data(*artifact_paths, tmp_path, shard=Shard(i, 3))
+    with pytest.raises(ValueError, match="Missing shards: 2/3"):
+        merge_shards(tmp_path)
+
+
+@pytest.mark.parametrize("text", ["1", "0/4", "5/4", "1/0", "a/4"])
+def test_parse_shard_rejects_invalid_shards(text):
+    with pytest.raises(ValueError):
+        parse_shard(text)
@@ -0,0 +1,52 @@
+from functools import partial
+from io import StringIO
+from json import dumps, load
+
+import pytest
+
+from export_dbt_docs_to_md import parse_docs_data, stream_loader
+from export_dbt_docs_to_md.stream_loader import JsonObjectStream
+
+from conftest import read_tree
+
+CHUNK_SIZES = [1, 2, 3, 5, 7, 11, 13, 64, 1000]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_items_equal_json_load(artifact_paths, chunk_size):
+    manifest_json_path, _ = artifact_paths
+    with open(manifest_json_path) as f:
+        expected = load(f)
+    with open(manifest_json_path) as f:
+        assert dict(JsonObjectStream(f, chunk_size=chunk_size).items()) == expected
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_skipped_values_do_not_shift_the_cursor(artifacts, chunk_size):
+    manifest_json, _ = artifacts
+    stream = JsonObjectStream(StringIO(dumps(manifest_json)), chunk_size=chunk_size)
+    for top_level_key in stream.keys():
+        if top_level_key != "nodes":
+            continue
+        for k in stream.keys():
+            # read every other field of a node and skip the rest, e.g. the float created_at.
+            for i, field in enumerate(stream.keys()):
+                if i % 2:
+                    assert stream.value() == manifest_json["nodes"][k][field]
+
+
+@pytest.mark.parametrize("text", ["1687512345.5", "2.5e-3", "-12", "1E+2", "0.000001"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4])
+def test_numbers_cut_at_chunk_boundary(text, chunk_size):
+    stream = JsonObjectStream(StringIO(f'{{"a": {text}, "b": [{text}, {text}]}}'), chunk_size=chunk_size)
+    number = load(StringIO(text))
+    assert dict(stream.items()) == {"a": number, "b": [number, number]}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_stream_export_equals_eager_export(monkeypatch, tmp_path, artifact_paths, chunk_size):
+    manifest_json_path, catalog_json_path = artifact_paths
+    parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "eager")
+    monkeypatch.setattr(stream_loader, "JsonObjectStream", partial(JsonObjectStream, chunk_size=chunk_size))
+    parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / "stream", stream=True)
+    assert read_tree(tmp_path / "stream") == read_tree(tmp_path / "eager")
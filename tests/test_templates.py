@@ -0,0 +1,70 @@
+import pytest
+
+from export_dbt_docs_to_md import DocsProject, parse_docs_data
+from export_dbt_docs_to_md.format_parsed_data import format_macro_data, format_models_data
+from export_dbt_docs_to_md.templates import PageTemplate, load_templates
+
+from conftest import read_tree
+
+MODEL = "model.synthetic.model_30"
+MODEL_PAGE = "synthetic/model/synthetic/model_30.md"
+
+
+def test_template_dir_overrides_a_page(tmp_path, artifact_paths):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "model.md").write_text("# {table_name} owned by {owner}\n")
+    parse_docs_data(*artifact_paths, tmp_path / "default")
+    parse_docs_data(*artifact_paths, tmp_path / "custom", template_dir_path=template_dir)
+
+    default_tree, custom_tree = read_tree(tmp_path / "default"), read_tree(tmp_path / "custom")
+    assert custom_tree[MODEL_PAGE] == b"# model_30 owned by owner\n"
+    # pages without a custom template are rendered with the default one
+    assert {k: v for k, v in custom_tree.items() if "/model/" not in k} == {
+        k: v for k, v in default_tree.items() if "/model/" not in k
+    }
+
+
+def test_unknown_field_names_the_field_and_template(tmp_path, artifacts):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "model.md").write_text("# {table_name} {no_such_field}\n")
+    project = DocsProject.load(*artifacts, template_dir_path=template_dir)
+    with pytest.raises(ValueError, match=r"Unknown field \{no_such_field\} in .*model\.md"):
+        project.render(MODEL)
+
+
+@pytest.mark.parametrize("source", ["{table_name!r}", "{table_name:>10}", "{columns[0]}", "{0}"])
+def test_invalid_field_is_rejected_at_load(tmp_path, source):
+    (tmp_path / "seed.md").write_text(source)
+    with pytest.raises(ValueError, match=r"Invalid field .* in .*seed\.md"):
+        load_templates(tmp_path)
+
+
+def test_missing_template_dir(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_templates(tmp_path / "missing")
+
+
+def test_render_joins_literals_and_fields():
+    template = PageTemplate("a {x} b {y}{x}\n")
+    assert template.field_names == ["x", "y", "x"]
+    assert template.render(x=1, y="z") == "a {x} b {y}{x}\n".format(x=1, y="z")
+
+
+def test_format_functions_write_the_exported_pages(tmp_path, artifact_paths):
+    parse_docs_data(*artifact_paths, tmp_path / "export")
+    project = DocsProject.load(*artifact_paths)
+
+    macro = "macro.synthetic.macro_0"
+    macro_page = project.page(macro)
+    file_path = format_macro_data(macro, macro_page.node_data, tmp_path / "single", macro_page.referenced_by)
+    assert file_path == tmp_path / "single" / macro_page.file_path
+    assert file_path.read_text() == (tmp_path / "export" / macro_page.file_path).read_text()
+
+    # format_models_data renders without lineage, so the pages are the same up to the lineage section.
+    model_page = project.page(MODEL)
+    file_path = format_models_data(MODEL, model_page.node_data, model_page.referenced_by, tmp_path / "single")
+    assert file_path == tmp_path / "single" / model_page.file_path
+    exported = (tmp_path / "export" / model_page.file_path).read_text()
+    assert file_path.read_text().split("## Lineage")[0] == exported.split("## Lineage")[0]
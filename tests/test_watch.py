@@ -0,0 +1,64 @@
+from export_dbt_docs_to_md import parse_docs_data
+from export_dbt_docs_to_md.watch import Watcher
+
+from conftest import read_tree, write_json
+
+
+def remove_node(manifest_json: dict, catalog_json: dict, node_id: str):
+    """
+    remove a node and its tests from the artifacts, as if it was deleted from the project
+    """
+    removed = {node_id, *(c for c in manifest_json["child_map"][node_id] if c.startswith("test."))}
+    for k in removed:
+        manifest_json["nodes"].pop(k, None)
+        manifest_json["parent_map"].pop(k, None)
+        manifest_json["child_map"].pop(k, None)
+        catalog_json["nodes"].pop(k, None)
+    for node_map in (manifest_json["parent_map"], manifest_json["child_map"]):
+        for k, node_list in node_map.items():
+            node_map[k] = [n for n in node_list if n not in removed]
+
+
+def leaf_model(manifest_json: dict) -> str:
+    return next(
+        k
+        for k, children in manifest_json["child_map"].items()
+        if k.startswith("model.") and children and all(c.startswith("test.") for c in children)
+    )
+
+
+def test_update_renders_affected_pages_only(tmp_path, artifacts, artifact_paths):
+    manifest_json, catalog_json = artifacts
+    watcher = Watcher(*artifact_paths, tmp_path / "watched")
+    n_pages = watcher.export()
+    assert read_tree(tmp_path / "watched") == read_tree(parse_and_read(tmp_path, "full", *artifact_paths))
+
+    # a changed description renders the model page and the macros it uses again.
+    manifest_json["nodes"]["model.synthetic.model_30"]["description"] = "changed"
+    write_json(artifact_paths[0], manifest_json)
+    rendered, removed = watcher.update()
+    assert 0 < rendered < n_pages / 10
+    assert removed == 0
+    assert read_tree(tmp_path / "watched") == read_tree(parse_and_read(tmp_path, "changed", *artifact_paths))
+
+    # a removed model deletes its page and the pages of its tests, and its upstream pages list it no more.
+    node_id = leaf_model(manifest_json)
+    remove_node(manifest_json, catalog_json, node_id)
+    write_json(artifact_paths[0], manifest_json)
+    write_json(artifact_paths[1], catalog_json)
+    rendered, removed = watcher.update()
+    assert rendered < n_pages / 2
+    assert removed >= 1
+    assert read_tree(tmp_path / "watched") == read_tree(parse_and_read(tmp_path, "removed", *artifact_paths))
+
+
+def test_unchanged_artifacts_render_nothing(tmp_path, artifact_paths):
+    watcher = Watcher(*artifact_paths, tmp_path / "watched")
+    watcher.export()
+    assert not watcher.changed()
+    assert watcher.update() == (0, 0)
+
+
+def parse_and_read(tmp_path, name, manifest_json_path, catalog_json_path):
+    parse_docs_data(manifest_json_path, catalog_json_path, tmp_path / name)
+    return tmp_path / name
@@ -0,0 +1,118 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event, Thread
+
+import pytest
+
+from export_dbt_docs_to_md import DirectorySink, MemorySink
+from export_dbt_docs_to_md.parallel_render import _render_in_pool
+from export_dbt_docs_to_md.writer_pipeline import WriterPipeline, WriterStats
+
+from conftest import read_tree
+
+
+class BlockingSink(MemorySink):
+    """
+    a sink whose writes wait until released
+    """
+
+    thread_safe = True
+
+    def __init__(self):
+        super().__init__()
+        self.release = Event()
+
+    def write(self, relative_path: Path, markdown_str: str):
+        self.release.wait()
+        super().write(relative_path, markdown_str)
+
+
+class FailingSink(MemorySink):
+    def write(self, relative_path: Path, markdown_str: str):
+        if relative_path.name == "bad.md":
+            raise OSError("disk full")
+        super().write(relative_path, markdown_str)
+
+
+def test_put_blocks_on_a_full_queue():
+    sink = BlockingSink()
+    with WriterPipeline(sink, writers=1, queue_size=2) as pipeline:
+        # the writer takes the first page and blocks on it, then two pages fill the queue.
+        producer = Thread(target=lambda: [pipeline.put(Path(f"{i}.md"), str(i)) for i in range(5)])
+        producer.start()
+        producer.join(timeout=0.2)
+        assert producer.is_alive()
+        sink.release.set()
+        producer.join()
+    assert sink.pages == {f"{i}.md": str(i) for i in range(5)}
+    assert pipeline.stats.wait_seconds > 0
+
+
+def test_unchanged_file_is_skipped_and_keeps_its_mtime(tmp_path):
+    with WriterPipeline(DirectorySink(tmp_path)) as pipeline:
+        pipeline.put(Path("pkg/a.md"), "# a\n")
+        pipeline.put(Path("pkg/b.md"), "# b\n")
+    os.utime(tmp_path / "pkg" / "a.md", ns=(1_000_000_000, 1_000_000_000))
+
+    with WriterPipeline(DirectorySink(tmp_path)) as pipeline:
+        pipeline.put(Path("pkg/a.md"), "# a\n")
+        pipeline.put(Path("pkg/b.md"), "# b changed\n")
+    assert (tmp_path / "pkg" / "a.md").stat().st_mtime_ns == 1_000_000_000
+    assert read_tree(tmp_path) == {"pkg/a.md": b"# a\n", "pkg/b.md": b"# b changed\n"}
+    assert (pipeline.stats.pages_written, pipeline.stats.pages_unchanged) == (1, 1)
+
+    with WriterPipeline(DirectorySink(tmp_path), skip_unchanged=False) as pipeline:
+        pipeline.put(Path("pkg/a.md"), "# a\n")
+    assert (tmp_path / "pkg" / "a.md").stat().st_mtime_ns != 1_000_000_000
+
+
+@pytest.mark.parametrize("writers", [1, 4])
+def test_write_error_reaches_the_caller(writers):
+    with pytest.raises(OSError, match="disk full"):
+        with WriterPipeline(FailingSink(), writers=writers) as pipeline:
+            pipeline.put(Path("a.md"), "a")
+            pipeline.put(Path("bad.md"), "bad")
+            pipeline.put(Path("b.md"), "b")
+
+
+def test_error_of_the_producer_is_raised_and_write_error_is_reported():
+    with pytest.warns(UserWarning, match="disk full"):
+        with pytest.raises(RuntimeError, match="render failed"):
+            with WriterPipeline(FailingSink()) as pipeline:
+                pipeline.put(Path("bad.md"), "bad")
+                raise RuntimeError("render failed")
+
+
+def test_stats():
+    pages = {f"{i}.md": "✓" * i for i in range(10)}
+    sink = MemorySink()
+    with WriterPipeline(sink, writers=3, queue_size=4) as pipeline:
+        for relative_path, markdown_str in pages.items():
+            pipeline.put(Path(relative_path), markdown_str)
+    stats = pipeline.stats
+    assert sink.pages == pages
+    assert stats.pages_written == 10
+    assert stats.pages_unchanged == 0
+    assert stats.bytes_written == sum(len(markdown_str.encode()) for markdown_str in pages.values())
+    assert stats.elapsed_seconds > 0
+    assert stats.as_dict()["pages_per_second"] == stats.pages_per_second > 0
+    assert WriterStats().pages_per_second == WriterStats().bytes_per_second == 0.0
+
+
+def test_render_pool_has_a_bounded_number_of_tasks_in_flight():
+    submitted = []
+
+    class CountingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    pages = list(range(100))
+    with CountingPool(max_workers=2) as pool:
+        rendered = _render_in_pool(pool, lambda chunk: [[page] for page in chunk], pages, chunksize=3, max_tasks=4)
+        for i, files in enumerate(rendered):
+            assert files == [i]
+            # the chunks up to the one of page i are consumed, and at most 4 chunks after it are in flight
+            assert len(submitted) <= i // 3 + 1 + 4
+    assert [page for chunk in submitted for page in chunk] == pages